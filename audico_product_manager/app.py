@@ -1,5 +1,5 @@
 
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify, stream_with_context
 from flask_cors import CORS
 import os
 import tempfile
@@ -14,12 +14,16 @@ import base64
 # Use absolute import that works when running directly
 try:
     from audico_product_manager.opencart_client import OpenCartAPIClient
+    from audico_product_manager.async_opencart_client import AsyncOpenCartAPIClient, HTTPX_AVAILABLE
     from audico_product_manager.docai_parser import DocumentAIParser
     from audico_product_manager.product_comparison import ProductComparator
+    from audico_product_manager.catalog_mirror import CatalogMirror
 except ImportError:
     from opencart_client import OpenCartAPIClient
+    from async_opencart_client import AsyncOpenCartAPIClient, HTTPX_AVAILABLE
     from docai_parser import DocumentAIParser
     from product_comparison import ProductComparator
+    from catalog_mirror import CatalogMirror
 
 # Load environment variables from .env
 load_dotenv()
@@ -39,8 +43,10 @@ logger = logging.getLogger(__name__)
 
 # Initialize clients
 opencart_client = None
+async_opencart_client = None
 docai_parser = None
 product_comparator = None
+catalog_mirror = None
 
 def get_opencart_client():
     """Get or create OpenCart client instance."""
@@ -49,6 +55,24 @@ def get_opencart_client():
         opencart_client = OpenCartAPIClient()
     return opencart_client
 
+def get_async_opencart_client():
+    """Get or create async OpenCart client instance (None if httpx is unavailable)."""
+    global async_opencart_client
+    if async_opencart_client is None and HTTPX_AVAILABLE:
+        # Share the sync client's retry/circuit breaker state and search cache
+        async_opencart_client = AsyncOpenCartAPIClient(
+            transport_policy=get_opencart_client().transport_policy,
+            search_cache=get_opencart_client().search_cache
+        )
+    return async_opencart_client
+
+def get_catalog_mirror():
+    """Get or create the local catalog mirror instance."""
+    global catalog_mirror
+    if catalog_mirror is None:
+        catalog_mirror = CatalogMirror()
+    return catalog_mirror
+
 def get_docai_parser():
     """Get or create Document AI parser instance."""
     global docai_parser
@@ -60,7 +84,9 @@ def get_product_comparator():
     """Get or create Product Comparator instance."""
     global product_comparator
     if product_comparator is None:
-        product_comparator = ProductComparator(get_opencart_client())
+        product_comparator = ProductComparator(
+            get_opencart_client(), get_async_opencart_client(), catalog_mirror=get_catalog_mirror()
+        )
     return product_comparator
 
 # Create upload directory if it doesn't exist
@@ -108,6 +134,33 @@ def test_connection():
             'timestamp': datetime.now().isoformat()
         }), 500
 
+@app.route('/transport-stats')
+def transport_stats():
+    """Get OpenCart retry counters and circuit breaker state."""
+    return jsonify({
+        'success': True,
+        'stats': get_opencart_client().get_transport_stats(),
+        'timestamp': datetime.now().isoformat()
+    })
+
+@app.route('/search-cache-stats')
+def search_cache_stats():
+    """Get OpenCart search cache hit/miss statistics."""
+    return jsonify({
+        'success': True,
+        'stats': get_opencart_client().get_search_cache_stats(),
+        'timestamp': datetime.now().isoformat()
+    })
+
+@app.route('/parse-cache-stats')
+def parse_cache_stats():
+    """Get document parse cache hit/miss statistics."""
+    return jsonify({
+        'success': True,
+        'stats': get_docai_parser().get_parse_cache_stats(),
+        'timestamp': datetime.now().isoformat()
+    })
+
 @app.route('/categories')
 def get_categories():
     """Get all categories from OpenCart."""
@@ -323,9 +376,102 @@ def reload_existing_products():
             'message': f'Failed to reload existing products: {str(e)}'
         }), 500
 
+@app.route('/api/catalog/refresh', methods=['POST'])
+def refresh_catalog_mirror():
+    """Refresh the local catalog mirror (incremental unless 'full' is set)."""
+    try:
+        data = request.get_json(silent=True) or {}
+        mirror = get_catalog_mirror()
+        success = mirror.refresh(get_opencart_client(), full=bool(data.get('full', False)))
+        
+        if success:
+            # Pick up the refreshed catalog on the next comparison
+            get_product_comparator().existing_products_loaded = False
+        
+        return jsonify({
+            'success': success,
+            'message': 'Catalog mirror refreshed' if success else 'Catalog mirror refresh failed',
+            'stats': mirror.get_stats()
+        })
+        
+    except Exception as e:
+        logger.error(f"Error refreshing catalog mirror: {str(e)}")
+        return jsonify({
+            'success': False,
+            'message': f'Failed to refresh catalog mirror: {str(e)}'
+        }), 500
+
+@app.route('/api/pricelist/parse-cache/invalidate', methods=['POST'])
+def invalidate_parse_cache():
+    """Drop cached parse results for an uploaded file or content hash, or all of them."""
+    try:
+        parser = get_docai_parser()
+        data = request.get_json(silent=True) or {}
+        
+        if 'file' in request.files and request.files['file'].filename:
+            removed = parser.invalidate_cached_document(document_content=request.files['file'].read())
+        elif data.get('content_hash'):
+            removed = parser.invalidate_cached_document(content_hash=data['content_hash'])
+        elif data.get('all'):
+            removed = parser.invalidate_cached_document()
+        else:
+            return jsonify({
+                'success': False,
+                'message': "Provide a file, a content_hash, or 'all': true"
+            }), 400
+        
+        return jsonify({
+            'success': True,
+            'message': f'Removed {removed} cached parse results',
+            'removed': removed
+        })
+        
+    except Exception as e:
+        logger.error(f"Error invalidating parse cache: {str(e)}")
+        return jsonify({
+            'success': False,
+            'message': f'Failed to invalidate parse cache: {str(e)}'
+        }), 500
+
+def stream_parsed_products(parser, file_path, filename):
+    """Stream products as NDJSON lines while the document is parsed, then a summary line."""
+    def generate():
+        products_count = 0
+        tier_report = []
+        try:
+            for product in parser.iter_products(file_path, tier_report=tier_report):
+                products_count += 1
+                yield json.dumps({'type': 'product', 'product': parser.products_to_dict([product])[0]}) + '\n'
+            yield json.dumps({
+                'type': 'summary',
+                'success': True,
+                'message': f'Successfully processed {products_count} products from {filename}',
+                'filename': filename,
+                'products_count': products_count,
+                'extraction_tiers': tier_report
+            }) + '\n'
+        except Exception as processing_error:
+            logger.error(f"Error processing file: {str(processing_error)}")
+            yield json.dumps({
+                'type': 'summary',
+                'success': False,
+                'message': f'Error processing file: {str(processing_error)}',
+                'products_count': products_count
+            }) + '\n'
+        finally:
+            # Clean up temporary file once parsing has finished
+            if os.path.exists(file_path):
+                os.remove(file_path)
+    
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
 @app.route('/api/pricelist/upload', methods=['POST'])
 def upload_pricelist():
-    """Upload and process a pricelist PDF."""
+    """Upload and process a pricelist PDF.
+    
+    With ?stream=1 (or a 'stream' form field) products are streamed as NDJSON
+    while the document is still being parsed.
+    """
     try:
         # Check if file is present in request
         if 'file' not in request.files:
@@ -359,10 +505,14 @@ def upload_pricelist():
         file.save(file_path)
         logger.info(f"File saved: {file_path}")
         
+        if str(request.args.get('stream', request.form.get('stream', ''))).lower() in ('1', 'true', 'yes'):
+            return stream_parsed_products(get_docai_parser(), file_path, filename)
+        
         try:
             # Process the file with Document AI
             parser = get_docai_parser()
-            products = parser.parse_file(file_path)
+            tier_report = []
+            products = parser.parse_file(file_path, tier_report=tier_report)
             
             # Convert to dictionaries for JSON response
             products_dict = parser.products_to_dict(products)
@@ -376,7 +526,8 @@ def upload_pricelist():
                 'data': {
                     'filename': filename,
                     'products_count': len(products),
-                    'products': products_dict
+                    'products': products_dict,
+                    'extraction_tiers': tier_report
                 }
             })
             
@@ -436,7 +587,7 @@ def process_text():
         
         # Process the text with Document AI parser
         parser = get_docai_parser()
-        products = parser._parse_text_fallback(text_content)
+        products = parser._parse_text_fallback_enhanced(text_content)
         
         # Convert to dictionaries for JSON response
         products_dict = parser.products_to_dict(products)
@@ -0,0 +1,396 @@
+"""
+Asynchronous OpenCart API Client for Audico Product Manager.
+
+This module provides an asyncio counterpart to OpenCartAPIClient so that many
+OpenCart requests can be in flight at once, bounded by a configurable
+concurrency limit. Synchronous code (comparators, ProductSynchronizer, Flask
+views) drives it through the run() helper and the *_sync wrappers.
+"""
+
+import asyncio
+import logging
+from contextvars import ContextVar
+from typing import List, Dict, Any, Optional, Iterable, Tuple
+from urllib.parse import urljoin
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+    logging.warning("httpx not available, AsyncOpenCartAPIClient will be disabled")
+
+# Use absolute import that works when running directly
+try:
+    from audico_product_manager.config import config
+    from audico_product_manager.opencart_client import OpenCartProduct, CatalogExportError
+    from audico_product_manager.transport_policy import TransportPolicy, CircuitOpenError
+    from audico_product_manager.search_cache import SearchCache
+except ImportError:
+    try:
+        from .config import config
+        from .opencart_client import OpenCartProduct, CatalogExportError
+        from .transport_policy import TransportPolicy, CircuitOpenError
+        from .search_cache import SearchCache
+    except ImportError:
+        from config import config
+        from opencart_client import OpenCartProduct, CatalogExportError
+        from transport_policy import TransportPolicy, CircuitOpenError
+        from search_cache import SearchCache
+
+
+class AsyncOpenCartAPIClient:
+    """Asyncio client for the OpenCart REST API with bounded concurrency."""
+
+    # httpx replaces (rather than merges) a URL's query string when params are
+    # given, so the ocrestapi route is passed as a parameter.
+    LISTING_URL = "https://www.audicoonline.co.za/index.php"
+    LISTING_ROUTE = "ocrestapi/product/listing"
+
+    def __init__(self, base_url: Optional[str] = None, auth_token: Optional[str] = None,
+                 max_concurrency: Optional[int] = None, timeout: Optional[float] = None,
+                 transport_policy: Optional[TransportPolicy] = None,
+                 search_cache: Optional[SearchCache] = None):
+        """
+        Initialize the async OpenCart API client.
+
+        Args:
+            base_url: OpenCart API base URL
+            auth_token: Authentication token for API access
+            max_concurrency: Maximum number of requests in flight at once
+            timeout: Pool-level timeout in seconds (per-call timeouts come from the policy)
+            transport_policy: Retry/circuit breaker policy (shareable with OpenCartAPIClient)
+            search_cache: Search result cache (shareable with OpenCartAPIClient)
+        """
+        if not HTTPX_AVAILABLE:
+            raise ImportError("httpx is required for AsyncOpenCartAPIClient")
+
+        self.base_url = base_url or config.opencart_base_url
+        self.auth_token = auth_token or config.opencart_auth_token
+        self.max_concurrency = max_concurrency or config.opencart_max_concurrency
+        self.timeout = timeout or config.opencart_timeout
+        self.transport_policy = transport_policy or TransportPolicy()
+        self.search_cache = search_cache or SearchCache()
+
+        # Set up logging
+        self.logger = logging.getLogger(__name__)
+
+        # Set up Basic Auth headers
+        self.headers = {
+            'Authorization': f'Basic {self.auth_token}',
+            'Content-Type': 'application/json'
+        }
+
+        # Connection pool and semaphore of the current run, created in __aenter__.
+        # The client is shared by concurrent Flask requests, each calling run()
+        # on its own event loop, so they live in the run's context, not on self.
+        self._session: ContextVar[Optional[Tuple[httpx.AsyncClient, asyncio.Semaphore]]] = ContextVar(
+            f"opencart_session_{id(self)}", default=None
+        )
+
+    async def __aenter__(self) -> 'AsyncOpenCartAPIClient':
+        client = httpx.AsyncClient(
+            headers=self.headers,
+            timeout=self.timeout,
+            limits=httpx.Limits(max_connections=self.max_concurrency)
+        )
+        self._session.set((client, asyncio.Semaphore(self.max_concurrency)))
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        client, _ = self._session.get()
+        self._session.set(None)
+        await client.aclose()
+
+    def run(self, coro_fn, *args, **kwargs):
+        """
+        Run one of the client's coroutine methods from synchronous code.
+
+        An HTTP connection pool is opened for the duration of the call and
+        closed afterwards, so this is safe to call repeatedly, and from
+        several threads at once.
+
+        Args:
+            coro_fn: Coroutine function to run (e.g. client.search_products_many)
+            *args: Positional arguments for coro_fn
+            **kwargs: Keyword arguments for coro_fn
+
+        Returns:
+            The coroutine's result
+        """
+        async def runner():
+            async with self:
+                return await coro_fn(*args, **kwargs)
+
+        return asyncio.run(runner())
+
+    async def _send(self, method: str, url: str, endpoint: str, **kwargs) -> Optional[Any]:
+        """
+        Send a request through the shared pool and transport policy.
+
+        Each attempt holds the semaphore only while in flight, so backoff
+        sleeps do not block other requests.
+
+        Args:
+            method: HTTP method
+            url: Absolute request URL
+            endpoint: Endpoint name used for per-endpoint retry counters
+            **kwargs: Extra arguments passed to httpx (params, json)
+
+        Returns:
+            Any: Decoded JSON body or None if the request failed
+        """
+        client, semaphore = self._session.get()
+
+        async def attempt(timeout: float):
+            async with semaphore:
+                return await client.request(method, url, timeout=timeout, **kwargs)
+
+        if method in TransportPolicy.IDEMPOTENT_METHODS:
+            retry_exceptions = (httpx.TransportError,)
+        else:
+            retry_exceptions = (httpx.ConnectError, httpx.ConnectTimeout)
+
+        try:
+            response = await self.transport_policy.execute_async(method, endpoint, attempt, retry_exceptions)
+        except CircuitOpenError as e:
+            self.logger.warning(str(e))
+            return None
+        except Exception as e:
+            self.logger.error(f"Request error: {str(e)}")
+            return None
+
+        if response.status_code in [200, 201]:
+            try:
+                return response.json()
+            except ValueError as e:
+                self.logger.error(f"Invalid JSON response: {str(e)}")
+                return None
+
+        self.logger.error(f"API request failed: {response.status_code} - {response.text}")
+        return None
+
+    async def _make_request(self, method: str, endpoint: str, data: Optional[Dict] = None,
+                            params: Optional[Dict] = None) -> Optional[Dict]:
+        """
+        Make an authenticated request to the OpenCart API.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            endpoint: API endpoint
+            data: Request data for POST/PUT requests
+            params: Query parameters
+
+        Returns:
+            Dict: Response data or None if request failed
+        """
+        url = urljoin(self.base_url, endpoint)
+
+        if method.upper() in ['POST', 'PUT']:
+            return await self._send(method.upper(), url, endpoint, json=data)
+        if method.upper() in ['GET', 'DELETE']:
+            return await self._send(method.upper(), url, endpoint, params=params)
+
+        self.logger.error(f"Unsupported HTTP method: {method}")
+        return None
+
+    async def _get_product_listing(self, params: Dict[str, Any]) -> Optional[List[Dict]]:
+        """
+        Fetch products from the ocrestapi product listing endpoint.
+
+        Args:
+            params: Query parameters (search, limit, page)
+
+        Returns:
+            List[Dict]: List of products or None if request failed
+        """
+        data = await self._send('GET', self.LISTING_URL, 'product/listing',
+                                params={'route': self.LISTING_ROUTE, **params})
+        if data is None:
+            return None
+
+        # Extract products from the nested response structure
+        if 'data' in data and 'products' in data['data']:
+            return data['data']['products']
+
+        self.logger.warning(f"Unexpected response structure: {list(data.keys())}")
+        return []
+
+    async def search_products(self, search_term: str) -> Optional[List[Dict]]:
+        """
+        Search for products using the OpenCart API.
+
+        Args:
+            search_term: Product name or model to search for
+
+        Returns:
+            List[Dict]: List of matching products or None if request failed
+        """
+        self.logger.debug(f"Searching for products with term: {search_term}")
+        return await self.search_cache.async_get_or_fetch(
+            search_term, lambda: self._get_product_listing({'search': search_term})
+        )
+
+    async def search_products_many(self, search_terms: Iterable[str]) -> Dict[str, Optional[List[Dict]]]:
+        """
+        Run several product searches concurrently.
+
+        Args:
+            search_terms: Search terms (duplicates are only fetched once)
+
+        Returns:
+            Dict[str, Optional[List[Dict]]]: Search results keyed by term
+        """
+        unique_terms = list(dict.fromkeys(search_terms))
+        results = await asyncio.gather(*(self.search_products(term) for term in unique_terms))
+        return dict(zip(unique_terms, results))
+
+    async def get_products(self, search_term: str = "", limit: int = 100, page: int = 1) -> Optional[List[Dict]]:
+        """
+        Retrieve a single page of products from OpenCart.
+
+        Args:
+            search_term: Search term for products (empty string returns all)
+            limit: Number of products per page
+            page: Page number (1-based)
+
+        Returns:
+            List[Dict]: List of products or None if request failed
+        """
+        return await self._get_product_listing({'search': search_term, 'limit': limit, 'page': page})
+
+    async def get_all_products(self, page_size: Optional[int] = None) -> List[Dict]:
+        """
+        Export the full catalog, fetching up to max_concurrency pages at a time.
+
+        Args:
+            page_size: Number of products per page (defaults to config.catalog_page_size)
+
+        Returns:
+            List[Dict]: All products, deduplicated by product_id, in page order
+
+        Raises:
+            CatalogExportError: If a page request fails before the export is complete
+        """
+        page_size = page_size or config.catalog_page_size
+        all_products = []
+        seen_product_ids = set()
+        next_page = 1
+
+        while True:
+            pages = range(next_page, next_page + self.max_concurrency)
+            results = await asyncio.gather(*(self.get_products(limit=page_size, page=page) for page in pages))
+
+            for page, products in zip(pages, results):
+                if products is None:
+                    raise CatalogExportError(f"Catalog export failed at page {page}")
+
+                new_products = 0
+                for product in products:
+                    product_id = product.get('product_id')
+                    if product_id in seen_product_ids:
+                        continue
+                    if product_id:
+                        seen_product_ids.add(product_id)
+                    new_products += 1
+                    all_products.append(product)
+
+                if len(products) < page_size or new_products == 0:
+                    self.logger.info(f"Catalog export complete: {len(all_products)} products in {page} pages")
+                    return all_products
+
+            next_page += self.max_concurrency
+
+    async def get_product_by_model(self, model: str) -> Optional[Dict]:
+        """
+        Find a product by model/SKU.
+
+        Args:
+            model: Product model/SKU to search for
+
+        Returns:
+            Dict: Product data or None if not found
+        """
+        products = await self.search_products(model)
+        if products:
+            # Look for exact model match first
+            for product in products:
+                if product.get('model', '').lower() == model.lower():
+                    return product
+            return products[0]
+        return None
+
+    async def create_product(self, product: OpenCartProduct) -> Optional[Dict]:
+        """
+        Create a new product in OpenCart.
+
+        Args:
+            product: OpenCartProduct instance
+
+        Returns:
+            Dict: Created product data or None if creation failed
+        """
+        self.logger.info(f"Creating product: {product.name} (Model: {product.model})")
+
+        response = await self._make_request('POST', '/products', data=product.to_dict())
+        self.search_cache.invalidate()
+        if response:
+            self.logger.info(f"Successfully created product: {product.name}")
+        else:
+            self.logger.error(f"Failed to create product: {product.name}")
+
+        return response
+
+    async def update_product(self, product_id: int, product: OpenCartProduct) -> Optional[Dict]:
+        """
+        Update an existing product in OpenCart.
+
+        Args:
+            product_id: ID of the product to update
+            product: OpenCartProduct instance with updated data
+
+        Returns:
+            Dict: Updated product data or None if update failed
+        """
+        self.logger.info(f"Updating product ID {product_id}: {product.name}")
+
+        response = await self._make_request('PUT', f'/products/{product_id}', data=product.to_dict())
+        self.search_cache.invalidate()
+        if response:
+            self.logger.info(f"Successfully updated product: {product.name}")
+        else:
+            self.logger.error(f"Failed to update product: {product.name}")
+
+        return response
+
+    async def get_categories(self) -> Optional[List[Dict]]:
+        """
+        Retrieve all categories from OpenCart.
+
+        Returns:
+            List[Dict]: List of categories or None if request failed
+        """
+        response = await self._make_request('GET', '/categories')
+        if response and 'data' in response:
+            return response['data']
+        return None
+
+    async def get_manufacturers(self) -> Optional[List[Dict]]:
+        """
+        Retrieve all manufacturers from OpenCart.
+
+        Returns:
+            List[Dict]: List of manufacturers or None if request failed
+        """
+        response = await self._make_request('GET', '/manufacturers')
+        if response and 'data' in response:
+            return response['data']
+        return None
+
+    def search_products_many_sync(self, search_terms: Iterable[str]) -> Dict[str, Optional[List[Dict]]]:
+        """Synchronous wrapper for search_products_many."""
+        return self.run(self.search_products_many, search_terms)
+
+    def get_all_products_sync(self, page_size: Optional[int] = None) -> List[Dict]:
+        """Synchronous wrapper for get_all_products."""
+        return self.run(self.get_all_products, page_size)
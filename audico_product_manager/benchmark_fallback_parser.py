@@ -0,0 +1,129 @@
+"""
+Benchmark for local pricelist parsing.
+
+Generates synthetic supplier pricelists of increasing size, split into pages,
+and times DocumentAIParser.iter_products on each end to end: the table and
+row extractors, extraction scoring, cross-page deduplication and fallback
+naming, i.e. the path an upload takes when no page needs escalating (the
+parser runs without a parse cache, and without GPT-4 or Document AI clients
+unless credentials are configured). The row extractor alone
+(_match_fallback_patterns) is timed alongside for comparison.
+
+Time per line should stay roughly flat as the document grows; a rising
+figure means a super-linear step has crept into one of the stages. Very long
+lines, a row of many prices and long runs of code-like tokens are timed as
+worst cases for regex backtracking.
+
+Usage:
+    python benchmark_fallback_parser.py [--sizes 1000 10000 100000] [--page-lines 60] [--seed 42]
+"""
+
+import argparse
+import io
+import logging
+import random
+import time
+from contextlib import redirect_stdout
+from typing import List
+
+# Use absolute import that works when running directly
+try:
+    from audico_product_manager.docai_parser import DocumentAIParser
+except ImportError:
+    try:
+        from .docai_parser import DocumentAIParser
+    except ImportError:
+        from docai_parser import DocumentAIParser
+
+
+PRODUCT_TYPES = ['AV Receiver', 'Integrated Amplifier', 'Bookshelf Speaker', 'Soundbar', 'CD Player', 'Subwoofer']
+FINISHES = ['Black', 'Silver', 'Walnut', 'White']
+BRANDS = ['Denon', 'Polk', 'AKG', 'Marantz']
+
+
+def synthetic_pricelist(lines: int, seed: int = 42, page_lines: int = 0) -> str:
+    """
+    Build a pricelist with mixed row layouts, split rows, headers and repeated models.
+
+    Args:
+        lines: Approximate number of lines
+        seed: Random seed
+        page_lines: Lines per page, pages separated by form feeds (0 = one page)
+
+    Returns:
+        str: Pricelist text
+    """
+    rng = random.Random(seed)
+    rows: List[str] = []
+    while len(rows) < lines:
+        brand = rng.choice(BRANDS)
+        model = f"{rng.choice(['AVR-X', 'PM', 'DCD-', 'ES', 'K'])}{rng.randint(100, 9999)}{rng.choice(['H', 'NE', 'BT', ''])}"
+        name = f"{brand} {rng.choice(PRODUCT_TYPES)} {rng.choice(FINISHES)}"
+        price = f"{rng.randint(1, 99)} {rng.randint(0, 999):03d}.00"
+        layout = rng.random()
+        if layout < 0.5:
+            rows.append(f"{name} | {model} | R {price}")
+        elif layout < 0.7:
+            rows.append(f"{name}; {model}; R {price}; R {rng.randint(1, 99)} {rng.randint(0, 999):03d}.00")
+        elif layout < 0.85:
+            # Row split over two lines
+            rows.append(f"{name} {model}")
+            rows.append(f"R {price}")
+        elif layout < 0.95:
+            rows.append(f"{name} {model}\t{rng.randint(1, 99)},{rng.randint(0, 999):03d}.00")
+        else:
+            rows.append(f"Page {len(rows) // 50 + 1} - Prices include VAT")
+    if page_lines <= 0:
+        return "\n".join(rows)
+    return "\f".join("\n".join(rows[start:start + page_lines]) for start in range(0, len(rows), page_lines))
+
+
+def time_parse(parser: DocumentAIParser, text: str) -> tuple:
+    """Parse text once through iter_products, returning (seconds, product count)."""
+    # The parser prints progress lines; keep them out of the results table
+    with redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        count = sum(1 for _ in parser.iter_products(text.encode('utf-8'), 'text/plain'))
+        return time.perf_counter() - start, count
+
+
+def time_fallback(parser: DocumentAIParser, text: str) -> tuple:
+    """Run only the row extractor once, returning (seconds, product count)."""
+    start = time.perf_counter()
+    products = parser._match_fallback_patterns(text)
+    return time.perf_counter() - start, len(products)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Benchmark local pricelist parsing end to end")
+    arg_parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000],
+                            help="Pricelist sizes in lines")
+    arg_parser.add_argument('--page-lines', type=int, default=60, help="Lines per page")
+    arg_parser.add_argument('--seed', type=int, default=42, help="Random seed")
+    args = arg_parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+    parser = DocumentAIParser(use_cache=False)
+
+    print(f"{'lines':>10} {'chars':>12} {'products':>10} {'seconds':>10} {'us/line':>10} {'rows-only us/line':>18}")
+    for size in args.sizes:
+        text = synthetic_pricelist(size, args.seed, args.page_lines)
+        seconds, count = time_parse(parser, text)
+        fallback_seconds, _ = time_fallback(parser, text)
+        print(f"{size:>10} {len(text):>12} {count:>10} {seconds:>10.3f} {seconds / size * 1e6:>10.1f} "
+              f"{fallback_seconds / size * 1e6:>18.1f}")
+
+    print("\nWorst cases (end to end):")
+    for label, text in [
+        ("one 1M-char line", "AB12 word " * 100000 + "R 100.00"),
+        ("row with 50k prices", "AVR-X1800H Receiver " + " ".join(f"R{i}.00" for i in range(50000))),
+        ("no newlines, 200k words", "Denon Receiver AVR-X1800H " * 66666),
+        ("16k chars of digitless codes", "ABC-DEF/ " * 2000),
+        ("40k-char hyphen run", "A-" * 20000)
+    ]:
+        seconds, count = time_parse(parser, text)
+        print(f"  {label:<30} {len(text):>10} chars {seconds:>8.3f}s ({count} products)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Precomputed matching features for catalog products in Audico Product Manager.
+
+Catalog products are wrapped once per catalog load in a compact ProductFeatures
+record, so the matchers do not re-run text normalization and model extraction
+for every existing product on every parsed row.
+"""
+
+import re
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+
+CANONICAL_PATTERN = re.compile(r'[^a-z0-9]')
+
+
+class ProductFeatures(NamedTuple):
+    """Normalized matching features for one catalog product."""
+    product: Dict[str, Any]
+    normalized_name: str
+    normalized_model: str
+    normalized_sku: str
+    model_key: str          # canonical model: normalized, punctuation removed
+    extracted_model: str    # normalized model extracted from name or model ('' if none)
+    brand: str
+    category: str
+
+
+def build_product_features(product: Dict[str, Any], normalize: Callable[[str], str],
+                           extract_model: Callable[[str], Optional[str]]) -> ProductFeatures:
+    """
+    Compute the matching features for a catalog product.
+
+    Args:
+        product: Catalog product dict
+        normalize: Text normalizer of the comparator that will score the product
+        extract_model: Model extractor of the comparator that will score the product
+
+    Returns:
+        ProductFeatures: Precomputed features
+    """
+    name = product.get('name', '')
+    model = product.get('model', '')
+    normalized_name = normalize(name)
+    normalized_model = normalize(model)
+    extracted = extract_model(name) or extract_model(model)
+    manufacturer = product.get('manufacturer')
+    category = product.get('category')
+    brand = normalize(manufacturer) if isinstance(manufacturer, str) else ''
+    if not brand and normalized_name:
+        brand = normalized_name.split(' ', 1)[0]
+
+    return ProductFeatures(
+        product=product,
+        normalized_name=normalized_name,
+        normalized_model=normalized_model,
+        normalized_sku=normalize(product.get('sku', '')),
+        model_key=CANONICAL_PATTERN.sub('', normalized_model),
+        extracted_model=normalize(extracted) if extracted else '',
+        brand=brand,
+        category=normalize(category) if isinstance(category, str) else ''
+    )
+
+
+def build_catalog_features(products: List[Dict[str, Any]], normalize: Callable[[str], str],
+                           extract_model: Callable[[str], Optional[str]]) -> List[ProductFeatures]:
+    """
+    Compute matching features for every catalog product.
+
+    Args:
+        products: Catalog products
+        normalize: Text normalizer of the scoring comparator
+        extract_model: Model extractor of the scoring comparator
+
+    Returns:
+        List[ProductFeatures]: Features in catalog order
+    """
+    return [build_product_features(product, normalize, extract_model) for product in products]
@@ -0,0 +1,170 @@
+"""
+Catalog index for Audico Product Manager.
+
+This module provides an in-memory index over the loaded OpenCart catalog so
+that matching a parsed row only scores a small candidate set instead of
+scanning every existing product. It holds hash maps on canonical SKU/model
+and an inverted index on model fragments and name tokens.
+"""
+
+import logging
+import math
+import re
+from collections import defaultdict
+from typing import List, Dict, Any, Optional, Callable, Iterable
+
+# Use absolute import that works when running directly
+try:
+    from audico_product_manager.config import config
+    from audico_product_manager.catalog_features import ProductFeatures, build_product_features, CANONICAL_PATTERN
+except ImportError:
+    try:
+        from .config import config
+        from .catalog_features import ProductFeatures, build_product_features, CANONICAL_PATTERN
+    except ImportError:
+        from config import config
+        from catalog_features import ProductFeatures, build_product_features, CANONICAL_PATTERN
+
+
+TOKEN_SPLIT_PATTERN = re.compile(r'[\s\-_/]+')
+
+
+class CatalogIndex:
+    """Hash and inverted indexes over catalog products for candidate generation."""
+
+    # Tokens present in more than this share of the catalog (e.g. brand names,
+    # 'black') do not generate candidates on their own
+    COMMON_TOKEN_RATIO = 0.2
+
+    def __init__(self, products: List[Dict[str, Any]], normalize: Callable[[str], str],
+                 extract_model: Callable[[str], Optional[str]], max_candidates: Optional[int] = None):
+        """
+        Build the index.
+
+        Args:
+            products: Catalog products (dicts with name, model, sku, product_id)
+            normalize: Text normalizer shared with the scorer (e.g. ProductComparator.normalize_text)
+            extract_model: Model extractor shared with the scorer
+            max_candidates: Maximum token-matched candidates returned per lookup
+        """
+        self.normalize = normalize
+        self.extract_model = extract_model
+        self.max_candidates = max_candidates or config.match_max_candidates
+        self.logger = logging.getLogger(__name__)
+
+        self.products: List[Dict[str, Any]] = []
+        self.features: List[ProductFeatures] = []
+        self.product_ids = set()
+        self.exact_map: Dict[str, List[int]] = defaultdict(list)
+        self.token_index: Dict[str, List[int]] = defaultdict(list)
+
+        for product in products:
+            self.add(product)
+
+        self.logger.info(f"Built catalog index: {len(self.products)} products, "
+                         f"{len(self.exact_map)} model/SKU keys, {len(self.token_index)} tokens")
+
+    def canonical(self, text: str) -> str:
+        """
+        Canonicalize a model/SKU: normalized, with all punctuation removed.
+
+        Args:
+            text: Model or SKU
+
+        Returns:
+            str: Canonical key (e.g. 'avrx1800h' for 'AVR-X1800H')
+        """
+        return CANONICAL_PATTERN.sub('', self.normalize(text)) if text else ''
+
+    @staticmethod
+    def _split_tokens(normalized_text: str) -> set:
+        """Split already-normalized text into index tokens (2+ characters)."""
+        return {token for token in TOKEN_SPLIT_PATTERN.split(normalized_text) if len(token) >= 2}
+
+    def _tokens(self, text: str) -> Iterable[str]:
+        """Split raw text into index tokens."""
+        return self._split_tokens(self.normalize(text))
+
+    def _exact_keys(self, name: str, model: str, sku: str) -> set:
+        """Canonical SKU/model keys for a product, including models extracted from text."""
+        keys = {self.canonical(sku), self.canonical(model)}
+        for text in (name, model):
+            extracted = self.extract_model(text)
+            if extracted:
+                keys.add(self.canonical(extracted))
+        keys.discard('')
+        return keys
+
+    def add(self, product: Dict[str, Any]) -> None:
+        """
+        Add a product to the index, precomputing its matching features.
+
+        Args:
+            product: Catalog product
+        """
+        position = len(self.products)
+        features = build_product_features(product, self.normalize, self.extract_model)
+        self.products.append(product)
+        self.features.append(features)
+        if product.get('product_id'):
+            self.product_ids.add(product.get('product_id'))
+
+        for key in self._exact_keys(product.get('name', ''), product.get('model', ''), product.get('sku', '')):
+            self.exact_map[key].append(position)
+
+        for token in self._split_tokens(features.normalized_name) | self._split_tokens(features.normalized_model):
+            self.token_index[token].append(position)
+
+    def lookup(self, term: str) -> List[ProductFeatures]:
+        """
+        Find products whose canonical SKU/model (or extracted model) equals a term.
+
+        Args:
+            term: Model or SKU search term
+
+        Returns:
+            List[ProductFeatures]: Matching products (empty if the term is unknown)
+        """
+        return [self.features[position] for position in self.exact_map.get(self.canonical(term), ())]
+
+    def contains(self, product: Dict[str, Any]) -> bool:
+        """Check whether a product (by product_id) is already indexed."""
+        return product.get('product_id') in self.product_ids
+
+    def candidates(self, name: str, model: str = '', sku: str = '') -> List[ProductFeatures]:
+        """
+        Get the catalog products worth scoring for a parsed row.
+
+        Exact canonical SKU/model hits are always included; the remaining
+        slots go to the products sharing the most (IDF-weighted) name and
+        model tokens. Candidates are returned in catalog order so ties are
+        broken the same way as a full scan.
+
+        Args:
+            name: Parsed product name
+            model: Parsed model
+            sku: Parsed SKU
+
+        Returns:
+            List[ProductFeatures]: Features of the candidate products
+        """
+        selected = set()
+        for key in self._exact_keys(name, model, sku):
+            selected.update(self.exact_map.get(key, ()))
+
+        total = len(self.products) or 1
+        common_limit = max(1, int(total * self.COMMON_TOKEN_RATIO))
+        tokens = [t for t in self._tokens(name) | self._tokens(model) if t in self.token_index]
+        rare_tokens = [t for t in tokens if len(self.token_index[t]) <= common_limit] or tokens
+
+        scores: Dict[int, float] = defaultdict(float)
+        for token in rare_tokens:
+            postings = self.token_index[token]
+            weight = math.log(1 + total / len(postings))
+            for position in postings:
+                scores[position] += weight
+
+        ranked = sorted(scores, key=lambda position: (-scores[position], position))
+        selected.update(ranked[:self.max_candidates])
+
+        return [self.features[position] for position in sorted(selected)]
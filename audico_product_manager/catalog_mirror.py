@@ -0,0 +1,447 @@
+"""
+Local catalog mirror for Audico Product Manager.
+
+This module keeps a persistent SQLite copy of the OpenCart catalog (products,
+categories and manufacturers) so that matching and syncing can read locally
+instead of sweeping the live store. Refreshes are incremental: only products
+modified since the last sync watermark (less an overlap window) are pulled,
+with a periodic full re-export to prune products deleted from the store.
+"""
+
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import List, Dict, Any, Optional, Iterator
+
+# Use absolute import that works when running directly
+try:
+    from audico_product_manager.config import config
+except ImportError:
+    try:
+        from .config import config
+    except ImportError:
+        from config import config
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS products (
+    product_id TEXT PRIMARY KEY,
+    model TEXT,
+    sku TEXT,
+    name TEXT,
+    normalized_name TEXT,
+    date_modified TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_products_model ON products (model COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_products_sku ON products (sku COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_products_normalized_name ON products (normalized_name);
+
+CREATE TABLE IF NOT EXISTS categories (
+    category_id TEXT PRIMARY KEY,
+    name TEXT,
+    data TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS manufacturers (
+    manufacturer_id TEXT PRIMARY KEY,
+    name TEXT,
+    data TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def normalize_name(name: str) -> str:
+    """
+    Normalize a product name for indexed lookups.
+
+    Args:
+        name: Product name
+
+    Returns:
+        str: Lowercased name with punctuation collapsed to single spaces
+    """
+    return re.sub(r'[^a-z0-9]+', ' ', str(name or '').lower()).strip()
+
+
+class CatalogMirror:
+    """Persistent SQLite mirror of the OpenCart catalog with incremental refresh."""
+
+    # Listing sort used for incremental refreshes (newest changes first)
+    INCREMENTAL_SORT = 'p.date_modified'
+
+    # OpenCart date_modified format
+    DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+    def __init__(self, db_path: Optional[str] = None, max_age: Optional[float] = None,
+                 overlap: Optional[float] = None, full_refresh_interval: Optional[float] = None):
+        """
+        Initialize the catalog mirror.
+
+        Args:
+            db_path: SQLite database path
+            max_age: Seconds after which the mirror is refreshed before use
+            overlap: Seconds before the watermark that incremental refreshes re-read
+            full_refresh_interval: Seconds after which a refresh re-exports the full catalog
+        """
+        self.db_path = db_path or config.catalog_mirror_path
+        self.max_age = max_age if max_age is not None else config.catalog_mirror_max_age
+        self.overlap = overlap if overlap is not None else config.catalog_mirror_overlap
+        self.full_refresh_interval = (full_refresh_interval if full_refresh_interval is not None
+                                      else config.catalog_mirror_full_refresh_interval)
+        self.logger = logging.getLogger(__name__)
+        self._write_lock = threading.Lock()
+
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection for one unit of work, committing on success."""
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _get_state(self, key: str) -> Optional[str]:
+        """Read a sync_state value."""
+        with self._connect() as conn:
+            row = conn.execute("SELECT value FROM sync_state WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    @staticmethod
+    def _set_state(conn: sqlite3.Connection, key: str, value: str) -> None:
+        """Write a sync_state value."""
+        conn.execute("INSERT OR REPLACE INTO sync_state (key, value) VALUES (?, ?)", (key, value))
+
+    @staticmethod
+    def _product_row(product: Dict[str, Any]) -> tuple:
+        """Build a products table row from an OpenCart product dict."""
+        return (
+            str(product.get('product_id')),
+            product.get('model', ''),
+            product.get('sku', ''),
+            product.get('name', ''),
+            normalize_name(product.get('name', '')),
+            product.get('date_modified', ''),
+            json.dumps(product)
+        )
+
+    def _upsert_products(self, conn: sqlite3.Connection, products: List[Dict[str, Any]]) -> int:
+        """Insert or replace products that carry a product_id."""
+        rows = [self._product_row(p) for p in products if p.get('product_id')]
+        conn.executemany(
+            "INSERT OR REPLACE INTO products "
+            "(product_id, model, sku, name, normalized_name, date_modified, data) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            rows
+        )
+        return len(rows)
+
+    # Refresh
+
+    def refresh(self, opencart_client, full: bool = False) -> bool:
+        """
+        Refresh the mirror from OpenCart.
+
+        An incremental refresh pages through the listing newest-first and
+        stops after the first page reaching products older than the watermark
+        less the overlap window. A full refresh re-exports everything and
+        prunes products that no longer exist; it runs when forced, on an empty
+        mirror, once full_refresh_interval has passed since the last one, and
+        against a store that does not report or sort by date_modified.
+
+        Args:
+            opencart_client: OpenCartAPIClient instance
+            full: Force a full re-export
+
+        Returns:
+            bool: True if the refresh completed
+        """
+        with self._write_lock:
+            watermark = self._get_state('products_watermark')
+            start_time = time.time()
+
+            last_full = float(self._get_state('last_full_refresh') or 0)
+            if time.time() - last_full > self.full_refresh_interval:
+                full = True
+
+            if full or not watermark or self.product_count() == 0:
+                success = self._refresh_full(opencart_client)
+            else:
+                success = self._refresh_incremental(opencart_client, watermark)
+
+            if success:
+                self._refresh_reference_data(opencart_client)
+                with self._connect() as conn:
+                    self._set_state(conn, 'last_synced', str(time.time()))
+                self.logger.info(f"Catalog mirror refreshed in {time.time() - start_time:.2f}s "
+                                 f"({self.product_count()} products)")
+            return success
+
+    def _fetch_pages(self, opencart_client, sort: Optional[str] = None) -> Iterator[List[Dict]]:
+        """
+        Yield listing pages until a short page; yields None if a page fails.
+
+        Args:
+            opencart_client: OpenCartAPIClient instance
+            sort: Optional listing sort column (descending)
+        """
+        page_size = config.catalog_page_size
+        seen_product_ids = set()
+        page = 1
+
+        while True:
+            if sort:
+                products = opencart_client.get_products(limit=page_size, page=page, sort=sort, order='DESC')
+            else:
+                products = opencart_client.get_products(limit=page_size, page=page)
+            if products is None:
+                yield None
+                return
+
+            new_products = [p for p in products if p.get('product_id') not in seen_product_ids]
+            seen_product_ids.update(p.get('product_id') for p in new_products)
+            yield new_products
+
+            # Stop on a short page, or if the store ignores paging and repeats itself
+            if len(products) < page_size or not new_products:
+                return
+            page += 1
+
+    def _refresh_full(self, opencart_client) -> bool:
+        """Re-export the full catalog and prune deleted products."""
+        fetched = []
+        for products in self._fetch_pages(opencart_client):
+            if products is None:
+                self.logger.error("Full catalog mirror refresh failed; keeping existing mirror")
+                return False
+            fetched.extend(products)
+
+        if not fetched:
+            self.logger.warning("Full catalog mirror refresh returned no products; keeping existing mirror")
+            return False
+
+        watermark = max((p.get('date_modified') or '' for p in fetched), default='')
+        with self._connect() as conn:
+            conn.execute("DELETE FROM products")
+            count = self._upsert_products(conn, fetched)
+            self._set_state(conn, 'products_watermark', watermark)
+            self._set_state(conn, 'last_full_refresh', str(time.time()))
+
+        self.logger.info(f"Full catalog mirror refresh stored {count} products")
+        return True
+
+    def _refresh_incremental(self, opencart_client, watermark: str) -> bool:
+        """Pull only products modified since the watermark, less the overlap window."""
+        try:
+            cutoff = (datetime.strptime(watermark, self.DATE_FORMAT)
+                      - timedelta(seconds=self.overlap)).strftime(self.DATE_FORMAT)
+        except ValueError:
+            self.logger.warning(f"Unrecognised watermark {watermark!r}; falling back to full refresh")
+            return self._refresh_full(opencart_client)
+
+        changed = []
+        previous = None
+
+        for products in self._fetch_pages(opencart_client, sort=self.INCREMENTAL_SORT):
+            if products is None:
+                self.logger.error("Incremental catalog mirror refresh failed")
+                return False
+
+            # Check the whole page is newest-first before trusting the early stop,
+            # so a store that ignores the sort cannot hide modified products
+            for product in products:
+                date_modified = product.get('date_modified')
+                if not date_modified:
+                    self.logger.warning("Store does not report date_modified; falling back to full refresh")
+                    return self._refresh_full(opencart_client)
+                if previous is not None and date_modified > previous:
+                    self.logger.warning("Store listing is not sorted by date_modified; falling back to full refresh")
+                    return self._refresh_full(opencart_client)
+                previous = date_modified
+
+            # Products modified in the same second as the watermark, or committed
+            # late, fall inside the overlap and are re-read (upserts are idempotent)
+            recent = [p for p in products if p['date_modified'] >= cutoff]
+            changed.extend(recent)
+            if len(recent) < len(products):
+                break
+
+        with self._connect() as conn:
+            count = self._upsert_products(conn, changed)
+            if changed:
+                self._set_state(conn, 'products_watermark', max(watermark, *(p['date_modified'] for p in changed)))
+
+        self.logger.info(f"Incremental catalog mirror refresh updated {count} products since {watermark}")
+        return True
+
+    def _refresh_reference_data(self, opencart_client) -> None:
+        """Replace the categories and manufacturers tables (both are small)."""
+        categories = opencart_client.get_categories()
+        manufacturers = opencart_client.get_manufacturers()
+
+        with self._connect() as conn:
+            if categories is not None:
+                conn.execute("DELETE FROM categories")
+                conn.executemany(
+                    "INSERT OR REPLACE INTO categories (category_id, name, data) VALUES (?, ?, ?)",
+                    [(str(c.get('category_id')), c.get('name', ''), json.dumps(c))
+                     for c in categories if c.get('category_id')]
+                )
+            if manufacturers is not None:
+                conn.execute("DELETE FROM manufacturers")
+                conn.executemany(
+                    "INSERT OR REPLACE INTO manufacturers (manufacturer_id, name, data) VALUES (?, ?, ?)",
+                    [(str(m.get('manufacturer_id')), m.get('name', ''), json.dumps(m))
+                     for m in manufacturers if m.get('manufacturer_id')]
+                )
+
+    def ensure_fresh(self, opencart_client) -> bool:
+        """
+        Make sure the mirror holds data, refreshing it if empty or stale.
+
+        A stale but non-empty mirror is still usable if the refresh fails.
+
+        Args:
+            opencart_client: OpenCartAPIClient instance
+
+        Returns:
+            bool: True if the mirror has products to read
+        """
+        if self.product_count() == 0:
+            return self.refresh(opencart_client)
+
+        if self.age() > self.max_age:
+            if not self.refresh(opencart_client):
+                self.logger.warning("Catalog mirror refresh failed; using stale mirror")
+        return True
+
+    def age(self) -> float:
+        """
+        Get seconds since the last successful refresh.
+
+        Returns:
+            float: Age in seconds (infinity if never synced)
+        """
+        last_synced = self._get_state('last_synced')
+        return time.time() - float(last_synced) if last_synced else float('inf')
+
+    # Reads
+
+    def product_count(self) -> int:
+        """Get the number of mirrored products."""
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM products").fetchone()[0]
+
+    def get_all_products(self) -> List[Dict[str, Any]]:
+        """
+        Get every mirrored product.
+
+        Returns:
+            List[Dict[str, Any]]: Product dicts as returned by the OpenCart API
+        """
+        with self._connect() as conn:
+            rows = conn.execute("SELECT data FROM products ORDER BY rowid").fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def get_product_by_model(self, model: str) -> Optional[Dict[str, Any]]:
+        """
+        Find a product by exact model or SKU (case-insensitive).
+
+        Args:
+            model: Product model/SKU
+
+        Returns:
+            Dict: Product data or None if not mirrored
+        """
+        if not model:
+            return None
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT data FROM products WHERE model = ? COLLATE NOCASE "
+                "UNION ALL SELECT data FROM products WHERE sku = ? COLLATE NOCASE LIMIT 1",
+                (model, model)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def search_products(self, search_term: str, limit: int = 50) -> List[Dict[str, Any]]:
+        """
+        Search mirrored products by model, SKU or name.
+
+        Args:
+            search_term: Model, SKU or name fragment
+            limit: Maximum number of products returned
+
+        Returns:
+            List[Dict[str, Any]]: Matching products
+        """
+        normalized = normalize_name(search_term)
+        if not normalized:
+            return []
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT data FROM products WHERE model = ? COLLATE NOCASE OR sku = ? COLLATE NOCASE "
+                "OR normalized_name LIKE ? LIMIT ?",
+                (search_term, search_term, f"%{normalized}%", limit)
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def get_categories(self) -> List[Dict[str, Any]]:
+        """Get mirrored categories."""
+        with self._connect() as conn:
+            rows = conn.execute("SELECT data FROM categories").fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def get_manufacturers(self) -> List[Dict[str, Any]]:
+        """Get mirrored manufacturers."""
+        with self._connect() as conn:
+            rows = conn.execute("SELECT data FROM manufacturers").fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    # Writes
+
+    def record_product(self, product_id: Any, product_data: Dict[str, Any]) -> None:
+        """
+        Record a product written to OpenCart so the mirror stays current.
+
+        Args:
+            product_id: OpenCart product ID
+            product_data: Product fields (e.g. OpenCartProduct.to_dict())
+        """
+        if not product_id:
+            return
+        with self._write_lock, self._connect() as conn:
+            self._upsert_products(conn, [{**product_data, 'product_id': product_id}])
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get mirror statistics.
+
+        Returns:
+            Dict[str, Any]: Row counts, watermark and age
+        """
+        with self._connect() as conn:
+            categories = conn.execute("SELECT COUNT(*) FROM categories").fetchone()[0]
+            manufacturers = conn.execute("SELECT COUNT(*) FROM manufacturers").fetchone()[0]
+        age = self.age()
+        return {
+            'db_path': self.db_path,
+            'products': self.product_count(),
+            'categories': categories,
+            'manufacturers': manufacturers,
+            'watermark': self._get_state('products_watermark'),
+            'age_seconds': round(age, 1) if age != float('inf') else None
+        }
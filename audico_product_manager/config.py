@@ -68,6 +68,49 @@ class Config:
         self.batch_size = int(os.getenv('BATCH_SIZE', '50'))
         self.max_retries = int(os.getenv('MAX_RETRIES', '3'))
         self.retry_delay = int(os.getenv('RETRY_DELAY', '5'))
+        self.catalog_page_size = int(os.getenv('CATALOG_PAGE_SIZE', '100'))
+        self.opencart_max_concurrency = int(os.getenv('OPENCART_MAX_CONCURRENCY', '8'))
+        self.opencart_timeout = float(os.getenv('OPENCART_TIMEOUT', '30'))
+        self.retry_max_delay = float(os.getenv('RETRY_MAX_DELAY', '60'))
+        self.circuit_breaker_threshold = int(os.getenv('CIRCUIT_BREAKER_THRESHOLD', '5'))
+        self.circuit_breaker_reset = float(os.getenv('CIRCUIT_BREAKER_RESET', '30'))
+        self.search_cache_size = int(os.getenv('SEARCH_CACHE_SIZE', '1024'))
+        self.search_cache_ttl = float(os.getenv('SEARCH_CACHE_TTL', '300'))
+        self.catalog_mirror_path = os.getenv('CATALOG_MIRROR_PATH', 'catalog_mirror.db')
+        self.catalog_mirror_max_age = float(os.getenv('CATALOG_MIRROR_MAX_AGE', '3600'))
+        self.catalog_mirror_overlap = float(os.getenv('CATALOG_MIRROR_OVERLAP', '300'))
+        self.catalog_mirror_full_refresh_interval = float(os.getenv('CATALOG_MIRROR_FULL_REFRESH_INTERVAL', '86400'))
+        self.match_full_scan = os.getenv('MATCH_FULL_SCAN', 'false').lower() == 'true'
+        self.match_max_candidates = int(os.getenv('MATCH_MAX_CANDIDATES', '200'))
+        self.compare_workers = int(os.getenv('COMPARE_WORKERS', '0'))  # 0 = one per CPU core
+        self.compare_min_shard_rows = int(os.getenv('COMPARE_MIN_SHARD_ROWS', '50'))
+        self.store_name_cache_enabled = os.getenv('STORE_NAME_CACHE_ENABLED', 'true').lower() == 'true'
+        self.store_name_cache_path = os.getenv('STORE_NAME_CACHE_PATH', 'store_name_cache.db')
+        self.store_name_cache_size = int(os.getenv('STORE_NAME_CACHE_SIZE', '50000'))
+        self.store_name_batch_enabled = os.getenv('STORE_NAME_BATCH_ENABLED', 'true').lower() == 'true'
+        self.store_name_batch_tokens = int(os.getenv('STORE_NAME_BATCH_TOKENS', '2000'))
+        self.store_name_batch_size = int(os.getenv('STORE_NAME_BATCH_SIZE', '25'))
+        self.naming_max_concurrency = int(os.getenv('NAMING_MAX_CONCURRENCY', '8'))
+        self.naming_requests_per_minute = float(os.getenv('NAMING_REQUESTS_PER_MINUTE', '500'))
+        self.naming_tokens_per_minute = float(os.getenv('NAMING_TOKENS_PER_MINUTE', '40000'))
+        self.gpt_chunk_tokens = int(os.getenv('GPT_CHUNK_TOKENS', '1000'))
+        self.gpt_chunk_overlap_lines = int(os.getenv('GPT_CHUNK_OVERLAP_LINES', '3'))
+        self.gpt_max_concurrency = int(os.getenv('GPT_MAX_CONCURRENCY', '4'))
+        self.parse_cache_enabled = os.getenv('PARSE_CACHE_ENABLED', 'true').lower() == 'true'
+        self.parse_cache_path = os.getenv('PARSE_CACHE_PATH', 'parse_cache.db')
+        self.parse_cache_size = int(os.getenv('PARSE_CACHE_SIZE', '500'))
+        self.extraction_confidence_threshold = float(os.getenv('EXTRACTION_CONFIDENCE_THRESHOLD', '0.8'))
+        self.pdf_extract_workers = int(os.getenv('PDF_EXTRACT_WORKERS', '0'))
+        self.pdf_min_pages_per_worker = int(os.getenv('PDF_MIN_PAGES_PER_WORKER', '8'))
+        self.stream_batch_size = int(os.getenv('STREAM_BATCH_SIZE', '50'))
+        self.excel_stream_threshold_mb = float(os.getenv('EXCEL_STREAM_THRESHOLD_MB', '20'))
+        self.excel_stream_chunk_rows = int(os.getenv('EXCEL_STREAM_CHUNK_ROWS', '5000'))
+        self.excel_all_sheets = os.getenv('EXCEL_ALL_SHEETS', 'false').lower() == 'true'
+        self.excel_sheet_workers = int(os.getenv('EXCEL_SHEET_WORKERS', '0'))  # 0 = one per CPU core
+        self.csv_chunk_rows = int(os.getenv('CSV_CHUNK_ROWS', '20000'))
+        self.template_registry_enabled = os.getenv('TEMPLATE_REGISTRY_ENABLED', 'true').lower() == 'true'
+        self.template_registry_path = os.getenv('TEMPLATE_REGISTRY_PATH', 'supplier_templates.db')
+        self.template_registry_size = int(os.getenv('TEMPLATE_REGISTRY_SIZE', '1000'))
         
         # Logging Configuration
         self.log_level = os.getenv('LOG_LEVEL', 'INFO')
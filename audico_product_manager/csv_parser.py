@@ -0,0 +1,192 @@
+"""
+CSV/TSV Parser for Audico Product Manager.
+
+Supplier CSV exports are tabular already, so instead of sending them through
+Document AI and GPT-4 as plain text they are read with the pandas C parser in
+chunks and run through the Excel parser's column mapping, price parsing and
+columnar product extraction. The delimiter is sniffed from a sample of the
+file, and the header row and column mapping come from the supplier template
+registry, discovered from the same sample the first time a layout is seen.
+"""
+
+import csv
+import os
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+# Use absolute import that works when running directly
+try:
+    from audico_product_manager.docai_parser import ProductData
+    from audico_product_manager.config import config
+    from audico_product_manager.excel_parser import ExcelParser, HEADER_SCAN_ROWS
+except ImportError:
+    try:
+        from .docai_parser import ProductData
+        from .config import config
+        from .excel_parser import ExcelParser, HEADER_SCAN_ROWS
+    except ImportError:
+        from docai_parser import ProductData
+        from config import config
+        from excel_parser import ExcelParser, HEADER_SCAN_ROWS
+
+
+# Characters read to sniff the delimiter and find the header row
+SNIFF_BYTES = 64 * 1024
+
+CANDIDATE_DELIMITERS = ',;\t|'
+
+# Supplier exports are usually UTF-8 (often with a BOM); stray bytes are replaced, not fatal
+CSV_ENCODING = 'utf-8-sig'
+
+
+class CsvParser(ExcelParser):
+    """Parser for CSV and TSV price lists, sharing the Excel parser's mapping and extraction."""
+
+    def parse_csv_file(self, file_path: str) -> List[ProductData]:
+        """
+        Parse a CSV or TSV file and extract product data.
+
+        Args:
+            file_path: Path to the CSV file
+
+        Returns:
+            List[ProductData]: List of extracted product data
+        """
+        return list(self.iter_csv_products(file_path))
+
+    def parse_prices(self, file_path: str) -> List[Dict[str, Any]]:
+        """
+        Parse a CSV file and return product data as dictionaries.
+
+        Args:
+            file_path: Path to the CSV file
+
+        Returns:
+            List[Dict[str, Any]]: List of product data dictionaries
+        """
+        return [asdict(product) for product in self.iter_csv_products(file_path)]
+
+    def iter_csv_products(self, file_path: str, chunk_rows: Optional[int] = None,
+                          supplier: str = '') -> Iterator[ProductData]:
+        """
+        Parse a CSV or TSV file in row chunks, yielding products as each chunk is extracted.
+
+        Cells are read as strings and the mapped columns named by the template.
+        Rows with more fields than the header row are logged and skipped.
+
+        Args:
+            file_path: Path to the CSV file
+            chunk_rows: Rows per chunk (default: CSV_CHUNK_ROWS)
+            supplier: Supplier name, part of the template fingerprint
+
+        Yields:
+            ProductData: Extracted product data
+        """
+        self.logger.info(f"Starting CSV parsing: {file_path}")
+
+        if not os.path.exists(file_path):
+            self.logger.error(f"CSV file not found: {file_path}")
+            return
+
+        product_count = 0
+        try:
+            delimiter, rows = self._sniff_layout(file_path)
+            # CSV cells are text, so prices are not retyped; the template's dtypes are all str
+            template = self._resolve_template(rows, f"csv:{delimiter}", supplier, typed_prices=False)
+            if template is None:
+                self.logger.warning(f"No header row found in CSV file: {file_path}")
+                return
+            self.logger.info(f"CSV delimiter {delimiter!r}, header at row {template.header_row + 1}")
+            if not template.usecols:
+                return
+
+            # Every field is read, plus one position past the header: a row with
+            # more fields than the header (e.g. an unquoted 'R 1,299.00') fills
+            # it and is rejected, instead of being silently cut to the header
+            # width with a wrong price
+            header_width = len(rows[template.header_row])
+            chunks = pd.read_csv(
+                file_path,
+                sep=delimiter,
+                header=None,
+                skiprows=template.header_row + 1,
+                names=range(header_width + 1),
+                index_col=False,
+                dtype=str,
+                chunksize=max(1, chunk_rows or config.csv_chunk_rows),
+                engine='c',
+                encoding=CSV_ENCODING,
+                encoding_errors='replace',
+                skipinitialspace=True,
+                on_bad_lines='warn'
+            )
+
+            row_count = malformed_count = 0
+            with chunks:
+                for chunk in chunks:
+                    row_count += len(chunk)
+                    malformed = chunk[header_width].notna()
+                    if malformed.any():
+                        # Data rows start on the line after the header (1-based)
+                        lines = (chunk.index[malformed] + template.header_row + 2).tolist()
+                        malformed_count += len(lines)
+                        self.logger.warning(f"Skipping {len(lines)} CSV rows with more fields than the header "
+                                            f"({header_width}) at lines {self._format_lines(lines)}")
+                    chunk = chunk.loc[~malformed, template.usecols]
+                    chunk.columns = template.usecol_names
+                    chunk = self._clean_dataframe(chunk)
+                    for product in self._extract_products_from_dataframe(chunk, template.column_map):
+                        product_count += 1
+                        yield product
+
+            self.logger.info(f"Successfully extracted {product_count} products from {row_count} CSV rows"
+                             + (f" ({malformed_count} malformed rows skipped)" if malformed_count else ""))
+
+        except Exception as e:
+            self.logger.error(f"Error parsing CSV file {file_path}: {str(e)}")
+            # Products already yielded would otherwise pass for the whole file
+            if product_count:
+                raise
+
+    @staticmethod
+    def _format_lines(lines: List[int], limit: int = 10) -> str:
+        """Format line numbers for a log message, truncated after limit."""
+        shown = ', '.join(str(line) for line in lines[:limit])
+        return shown + (f" and {len(lines) - limit} more" if len(lines) > limit else '')
+
+    def _sniff_layout(self, file_path: str) -> Tuple[str, List[Tuple[str, ...]]]:
+        """
+        Detect the delimiter of a CSV file and read its first rows.
+
+        Args:
+            file_path: Path to the CSV file
+
+        Returns:
+            Tuple[str, List[Tuple[str, ...]]]: Delimiter and up to HEADER_SCAN_ROWS rows
+        """
+        with open(file_path, 'r', encoding=CSV_ENCODING, errors='replace', newline='') as f:
+            sample = f.read(SNIFF_BYTES)
+
+        # Drop a partial last line so it cannot skew the sniffer
+        if len(sample) == SNIFF_BYTES and '\n' in sample:
+            sample = sample[:sample.rindex('\n') + 1]
+
+        try:
+            delimiter = csv.Sniffer().sniff(sample, delimiters=CANDIDATE_DELIMITERS).delimiter
+        except csv.Error:
+            delimiter = '\t' if Path(file_path).suffix.lower() == '.tsv' else ','
+
+        rows = [tuple(row) for row in csv.reader(sample.splitlines()[:HEADER_SCAN_ROWS], delimiter=delimiter)]
+        return delimiter, rows
+
+    def get_supported_formats(self) -> List[str]:
+        """
+        Get list of supported delimited text formats.
+
+        Returns:
+            List[str]: List of supported file extensions
+        """
+        return ['.csv', '.tsv']
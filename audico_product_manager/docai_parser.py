@@ -4,7 +4,8 @@ import re
 import os
 import json
 import time
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Iterator, Optional, Tuple, Union
 from dataclasses import dataclass, asdict
 from google.cloud import documentai
 import PyPDF2
@@ -14,10 +15,22 @@ from openai import OpenAI
 
 try:
     from audico_product_manager.config import config
+    from audico_product_manager.naming_memo import NamingMemo
+    from audico_product_manager.parse_cache import ParseCache
+    from audico_product_manager.extraction_scoring import PRICE_TOKEN_PATTERN, find_model_token, model_key, score_extraction
+    from audico_product_manager.pdf_text import DocumentSource, PdfTextExtractor, _open_reader, map_document
 except ImportError:
     try:
         from .config import config
+        from .naming_memo import NamingMemo
+        from .parse_cache import ParseCache
+        from .extraction_scoring import PRICE_TOKEN_PATTERN, find_model_token, model_key, score_extraction
+        from .pdf_text import DocumentSource, PdfTextExtractor, _open_reader, map_document
     except ImportError:
+        from naming_memo import NamingMemo
+        from parse_cache import ParseCache
+        from extraction_scoring import PRICE_TOKEN_PATTERN, find_model_token, model_key, score_extraction
+        from pdf_text import DocumentSource, PdfTextExtractor, _open_reader, map_document
         try:
             from config import config
         except ImportError:
@@ -28,8 +41,35 @@ except ImportError:
                 openai_api_key = os.getenv('OPENAI_API_KEY')
                 openai_client = None
                 default_manufacturer = os.getenv('DEFAULT_MANUFACTURER', 'Audico')
+                gpt_chunk_tokens = int(os.getenv('GPT_CHUNK_TOKENS', '1000'))
+                gpt_chunk_overlap_lines = int(os.getenv('GPT_CHUNK_OVERLAP_LINES', '3'))
+                gpt_max_concurrency = int(os.getenv('GPT_MAX_CONCURRENCY', '4'))
+                parse_cache_enabled = os.getenv('PARSE_CACHE_ENABLED', 'true').lower() == 'true'
+                parse_cache_path = os.getenv('PARSE_CACHE_PATH', 'parse_cache.db')
+                parse_cache_size = int(os.getenv('PARSE_CACHE_SIZE', '500'))
+                extraction_confidence_threshold = float(os.getenv('EXTRACTION_CONFIDENCE_THRESHOLD', '0.8'))
+                pdf_extract_workers = int(os.getenv('PDF_EXTRACT_WORKERS', '0'))
+                pdf_min_pages_per_worker = int(os.getenv('PDF_MIN_PAGES_PER_WORKER', '8'))
             config = FallbackConfig()
 
+# Fallback row parser tokens. Each is matched once per whitespace-separated
+# token with fullmatch and has no nested repetition, so a line is parsed in
+# time linear in its length.
+ROW_SEPARATORS = str.maketrans({'|': ' ', ';': ' ', '\t': ' '})
+CURRENCY_TOKEN = re.compile(r'(?:R|ZAR|\$|£|€)', re.IGNORECASE)
+AMOUNT_TOKEN = re.compile(r'(?:R|\$|£|€)?(\d[\d,]*)(\.\d{1,2})?', re.IGNORECASE)
+THOUSANDS_GROUP_TOKEN = re.compile(r'\d{3}(?:\.\d{1,2})?')
+LEADING_GROUP_TOKEN = re.compile(r'(?:R|\$|£|€)?\d{1,3}', re.IGNORECASE)
+DENON_MODEL_TOKEN = re.compile(r'(?:AVR|AVC)X?[-_]?[A-Z]?\d{3,4}[A-Z]*', re.IGNORECASE)
+MODEL_TOKEN = re.compile(r'(?=[^\d]*\d)(?=[^A-Z]*[A-Z])[A-Z0-9][A-Z0-9\-/\.]{2,}[A-Z0-9]')
+
+# Price labels left in a table row once its prices are removed ('RRP', 'Old RRP:', 'Was')
+PRICE_LABEL_PATTERN = re.compile(r'\b(?:(?:old|new|current)\s+)?(?:rrp|was|now|price)\b:?', re.IGNORECASE)
+
+# Tiers that extract a page without calling GPT-4 or Document AI
+LOCAL_TIERS = ('table', 'rows')
+
+
 @dataclass
 class ProductData:
     name: str
@@ -43,8 +83,12 @@ class ProductData:
     online_store_name: Optional[str] = None
 
 class DocumentAIParser:
+    # Bump when extraction logic changes so cached parse results are not reused
+    PARSER_VERSION = '5'
+
     def __init__(self, project_id: Optional[str] = None, location: Optional[str] = None, 
-                 processor_id: Optional[str] = None, openai_api_key: Optional[str] = None):
+                 processor_id: Optional[str] = None, openai_api_key: Optional[str] = None,
+                 parse_cache: Optional[ParseCache] = None, use_cache: Optional[bool] = None):
         self.project_id = project_id or getattr(config, 'google_cloud_project_id', os.getenv('GOOGLE_CLOUD_PROJECT_ID', 'your-project-id'))
         self.location = location or getattr(config, 'google_cloud_location', os.getenv('GOOGLE_CLOUD_LOCATION', 'us'))
         self.processor_id = processor_id or getattr(config, 'google_cloud_processor_id', os.getenv('GOOGLE_CLOUD_PROCESSOR_ID', 'mock-processor-for-demo'))
@@ -54,6 +98,15 @@ class DocumentAIParser:
         self.documentai_client = None
         self._initialize_documentai_client()
         
+        # Page-parallel PDF text extraction
+        self.pdf_extractor = PdfTextExtractor(config.pdf_extract_workers or None, config.pdf_min_pages_per_worker)
+        
+        # Parsed products keyed by document content hash
+        self.use_cache = config.parse_cache_enabled if use_cache is None else use_cache
+        self.parse_cache = None
+        if self.use_cache:
+            self.parse_cache = parse_cache or ParseCache(config.parse_cache_path, config.parse_cache_size)
+        
         # Enhanced model extraction patterns for audio equipment
         self.denon_model_patterns = [
             # Denon AVR patterns: AVRX-580BT, AVR-X1800H, AVC-X3800H
@@ -204,74 +257,318 @@ class DocumentAIParser:
         
         return normalized.strip()
 
-    def parse_document(self, document_content: bytes, mime_type: str) -> List[ProductData]:
+    def parse_document(self, document_content: bytes, mime_type: str,
+                       naming_memo: Optional[NamingMemo] = None,
+                       tier_report: Optional[List[Dict[str, Any]]] = None) -> List[ProductData]:
+        """Parse a document into products.
+
+        When a naming_memo is given, store names are left to the run's
+        StoreNameGenerator and no AI naming call is made here. Results are
+        cached by document content hash, so re-parsing the same bytes with
+        the same parser version skips extraction. document_content may also
+        be a memory-mapped file from map_document. When a tier_report list
+        is given, it receives this call's per-page tier report.
+        """
         try:
-            print(f"\n🔍 Starting enhanced document parsing (MIME type: {mime_type})")
-            raw_text = self._extract_raw_text(document_content, mime_type)
-            if not raw_text or len(raw_text.strip()) < 50:
-                self.logger.warning("Insufficient text extracted from document")
-                print("⚠️ Insufficient text content found in document")
-                return []
-            print(f"📝 Extracted {len(raw_text)} characters of text from document")
-            
-            if self.openai_client:
-                try:
-                    print("🤖 Attempting OpenAI GPT-4 intelligent parsing...")
-                    products = self._parse_with_gpt4(raw_text)
-                    if products:
-                        self.logger.info(f"Successfully extracted {len(products)} products using OpenAI GPT-4")
-                        print(f"✅ Enhanced OpenAI GPT-4 successfully extracted {len(products)} products")
-                        return products
-                except Exception as e:
-                    self.logger.error(f"OpenAI parsing failed: {str(e)}")
-            
-            if self.documentai_client and self.processor_id != 'mock-processor-for-demo':
-                try:
-                    print("📄 Attempting Google Cloud Document AI parsing...")
-                    products = self._parse_with_documentai(document_content, mime_type)
-                    if products:
-                        print(f"✅ Document AI successfully extracted {len(products)} products")
-                        return products
-                except Exception as e:
-                    self.logger.error(f"Document AI parsing failed: {str(e)}")
-            
-            print("🔧 Using enhanced fallback regex-based parsing...")
-            products = self._parse_text_fallback_enhanced(raw_text)
-            if products:
-                print(f"✅ Enhanced regex fallback successfully extracted {len(products)} products")
-            else:
-                print("❌ No products could be extracted using any method")
-            return products
+            return list(self.iter_products(document_content, mime_type, naming_memo, tier_report))
         except Exception as e:
             self.logger.error(f"Error parsing document: {str(e)}")
             print(f"❌ Document parsing error: {str(e)}")
             return []
 
-    def _extract_raw_text(self, document_content: bytes, mime_type: str) -> str:
-        try:
-            if mime_type == 'application/pdf':
-                return self._extract_pdf_text(document_content)
-            elif mime_type.startswith('text/'):
-                return document_content.decode('utf-8')
-            else:
-                self.logger.warning(f"Unsupported mime type: {mime_type}")
-                return ""
-        except Exception as e:
-            self.logger.error(f"Error extracting raw text: {str(e)}")
-            return ""
+    def iter_products(self, document_source: Union[str, os.PathLike, bytes, DocumentSource],
+                      mime_type: Optional[str] = None,
+                      naming_memo: Optional[NamingMemo] = None,
+                      tier_report: Optional[List[Dict[str, Any]]] = None) -> Iterator[ProductData]:
+        """Yield products page by page while the document is still being parsed.
 
-    def _extract_pdf_text(self, pdf_content: bytes) -> str:
-        try:
-            pdf_file = io.BytesIO(pdf_content)
-            pdf_reader = PyPDF2.PdfReader(pdf_file)
-            full_text = ""
-            for page in pdf_reader.pages:
-                full_text += page.extract_text() + "\n"
-            self.logger.info(f"Extracted {len(full_text)} characters from PDF")
-            return full_text
-        except Exception as e:
-            self.logger.error(f"Error extracting PDF text: {str(e)}")
-            return ""
+        document_source is a file path (memory-mapped while parsing), document
+        bytes or a mapping from map_document. Pages are extracted lazily and
+        only pages waiting for escalation are held, so memory stays bounded.
+        Products repeated on later pages are yielded once. The complete
+        result is written to the parse cache when the document finishes.
+
+        The parser is shared between requests, so the tier report belongs to
+        the call: when a tier_report list is given, an entry for each page
+        (tier, confidence, escalation, product count and GPT-4 chunk stats) is
+        appended to it as the page is yielded.
+        """
+        report = tier_report if tier_report is not None else []
+        if isinstance(document_source, (str, os.PathLike)):
+            file_path = os.fspath(document_source)
+            with map_document(file_path) as document_content:
+                yield from self.iter_products(document_content, mime_type or self._mime_type_for_path(file_path),
+                                              naming_memo, report)
+            return
+        document_content = document_source
+        mime_type = mime_type or 'application/pdf'
+        
+        content_hash = variant = None
+        if self.parse_cache:
+            content_hash = ParseCache.document_hash(document_content)
+            # Deferred naming leaves different store names than AI naming
+            variant = f"{mime_type}|{'deferred' if naming_memo is not None else 'named'}"
+            cached = self.parse_cache.get(content_hash, variant, self.PARSER_VERSION)
+            if cached is not None:
+                self.logger.info(f"Parse cache hit for document {content_hash[:12]} ({len(cached)} products)")
+                print(f"⚡ Reusing {len(cached)} products parsed earlier from this document")
+                report.append({'page': None, 'tier': 'cache', 'products': len(cached)})
+                for product_dict in cached:
+                    yield ProductData(**product_dict)
+                return
+        
+        print(f"\n🔍 Starting enhanced document parsing (MIME type: {mime_type})")
+        parsed_dicts: List[Dict[str, Any]] = []
+        seen_models = set()
+        page_start = 0
+        for index, page_text, tier, page_products, score, escalated, extraction in self._iter_pages_tiered(document_content, mime_type):
+            added = []
+            for product in page_products:
+                key = model_key(product.model)
+                if key in seen_models:
+                    continue
+                seen_models.add(key)
+                added.append(product)
+            self._name_products(added, naming_memo)
+            report.append({
+                'page': index + 1,
+                'tier': tier,
+                'confidence': score['confidence'],
+                'candidates': score['candidates'],
+                'escalated': escalated,
+                'products': len(added),
+                # Character span of the page in the joined document text
+                'span': (page_start, page_start + len(page_text)),
+                # GPT-4 chunk timings and token usage, when the page was sent to GPT-4
+                'gpt4': extraction
+            })
+            page_start += len(page_text) + 1
+            if self.parse_cache:
+                parsed_dicts.extend(self.products_to_dict(added))
+            yield from added
+        
+        pages = len(report)
+        product_count = sum(page['products'] for page in report)
+        if page_start < 50:
+            self.logger.warning("Insufficient text extracted from document")
+            print("⚠️ Insufficient text content found in document")
+        
+        tier_counts: Dict[str, int] = {}
+        for page in report:
+            tier_counts[page['tier']] = tier_counts.get(page['tier'], 0) + 1
+        escalated_pages = sum(1 for page in report if page['escalated'])
+        # Low-confidence pages no escalation tier handled (GPT-4 and Document AI
+        # unavailable or failing) still carry their local result
+        unescalated_pages = sum(1 for page in report
+                                if page['escalated'] and page['tier'] in LOCAL_TIERS)
+        self.logger.info(f"Extracted {product_count} products from {pages} pages "
+                         f"({escalated_pages} escalated); pages per tier: {tier_counts}")
+        
+        if product_count:
+            print(f"✅ Tiered extraction found {product_count} products in {pages} pages")
+            # Empty and degraded results are not cached so the parse is retried
+            if self.parse_cache and unescalated_pages:
+                self.logger.warning(f"Not caching parse of document {content_hash[:12]}: "
+                                    f"{unescalated_pages} low-confidence page(s) could not be escalated")
+            elif self.parse_cache:
+                self.parse_cache.put(content_hash, variant, self.PARSER_VERSION, parsed_dicts)
+        else:
+            print("❌ No products could be extracted using any method")
+
+    def invalidate_cached_document(self, document_content: Optional[bytes] = None,
+                                   content_hash: Optional[str] = None) -> int:
+        """Drop cached parse results for one document, or for all documents when none is given.
+
+        Returns the number of cached results removed.
+        """
+        if not self.parse_cache:
+            return 0
+        if document_content is not None:
+            content_hash = ParseCache.document_hash(document_content)
+        if content_hash:
+            return self.parse_cache.invalidate(content_hash)
+        return self.parse_cache.clear()
+
+    def get_parse_cache_stats(self) -> Dict[str, Any]:
+        """Get parse cache hit/miss statistics."""
+        return self.parse_cache.get_stats() if self.parse_cache else {'enabled': False}
+
+    def _iter_raw_pages(self, document_content: DocumentSource, mime_type: str) -> Iterator[str]:
+        """Yield the text of each page (form-feed separated pages for plain text)."""
+        if mime_type == 'application/pdf':
+            yield from self.pdf_extractor.iter_pages(document_content)
+        elif mime_type.startswith('text/'):
+            yield from bytes(document_content).decode('utf-8').split('\f')
+        else:
+            self.logger.warning(f"Unsupported mime type: {mime_type}")
+
+    def _extract_page_locally(self, page_text: str) -> Tuple[str, List[ProductData], Dict[str, Any]]:
+        """Run the local table and row extractors on a page, keeping the best-scored result.
+
+        Both tiers always run: a result over the threshold can still miss
+        rows (e.g. rows wrapped over two lines) that the other tier finds.
+        Ties go to the result with more products.
+        """
+        best = None
+        for tier, extractor in (('table', self._parse_table_lines), ('rows', self._match_fallback_patterns)):
+            page_products = extractor(page_text)
+            score = score_extraction(page_text, page_products)
+            if best is None or (score['confidence'], len(page_products)) > (best[2]['confidence'], len(best[1])):
+                best = (tier, page_products, score)
+        for product in best[1]:
+            product.confidence = best[2]['confidence']
+        return best
+
+    def _iter_pages_tiered(self, document_content: DocumentSource, mime_type: str
+                           ) -> Iterator[Tuple[int, str, str, List[ProductData], Dict[str, Any], bool, Optional[Dict[str, Any]]]]:
+        """Extract products page by page, cheapest tier first.
+
+        Each page goes through the local extractors, scored by
+        score_extraction. Pages whose best local result stays below
+        EXTRACTION_CONFIDENCE_THRESHOLD are escalated to GPT-4, or to
+        Document AI when GPT-4 is unavailable. Confident pages are yielded at
+        once; low-confidence pages are escalated together, up to
+        GPT_MAX_CONCURRENCY pages at a time, so their chunks run concurrently.
+
+        Yields (page index, page text, tier, products, local score, escalated,
+        GPT-4 extraction stats or None) in page order.
+        """
+        threshold = config.extraction_confidence_threshold
+        window_size = max(1, config.gpt_max_concurrency)
+        pending: List[Tuple[int, str, str, List[ProductData], Dict[str, Any]]] = []
+        
+        def flush():
+            low_confidence = [index for index, _, _, _, score in pending if score['confidence'] < threshold]
+            escalated, extraction = {}, {}
+            if low_confidence:
+                page_texts = {index: page_text for index, page_text, _, _, _ in pending}
+                escalated, extraction = self._escalate_pages(low_confidence, page_texts, document_content, mime_type)
+            for index, page_text, tier, page_products, score in pending:
+                if index in escalated:
+                    tier, page_products = escalated[index]
+                yield index, page_text, tier, page_products, score, index in low_confidence, extraction.get(index)
+            pending.clear()
+        
+        low_count = 0
+        for index, page_text in enumerate(self._iter_raw_pages(document_content, mime_type)):
+            tier, page_products, score = self._extract_page_locally(page_text)
+            pending.append((index, page_text, tier, page_products, score))
+            low_count += score['confidence'] < threshold
+            if low_count == 0 or low_count >= window_size:
+                yield from flush()
+                low_count = 0
+        yield from flush()
+
+    def _escalate_pages(self, indexes: List[int], pages: Dict[int, str], document_content: DocumentSource,
+                        mime_type: str) -> Tuple[Dict[int, Tuple[str, List[ProductData]]], Dict[int, Dict[str, Any]]]:
+        """Re-extract low-confidence pages with GPT-4, then Document AI for pages still empty.
+
+        A page where any GPT-4 chunk failed is incomplete, so it is left to
+        Document AI or keeps its local result.
+
+        Returns the tier and products of each page an escalation tier handled,
+        and the GPT-4 chunk stats of each page sent to GPT-4.
+        """
+        escalated: Dict[int, Tuple[str, List[ProductData]]] = {}
+        extraction: Dict[int, Dict[str, Any]] = {}
+        
+        if self.openai_client:
+            print(f"🤖 Escalating {len(indexes)} low-confidence pages to OpenAI GPT-4...")
+            chunk_pages, chunks = [], []
+            for index in indexes:
+                for chunk in self._split_text_chunks(pages[index]):
+                    chunk_pages.append(index)
+                    chunks.append(chunk)
+            page_chunk_results: Dict[int, List[List[Dict[str, Any]]]] = {}
+            page_chunk_stats: Dict[int, List[Dict[str, Any]]] = {}
+            chunk_results, extraction_stats = self._extract_chunks_with_gpt4(chunks)
+            for index, chunk_products, chunk_stats in zip(chunk_pages, chunk_results, extraction_stats['chunks']):
+                page_chunk_results.setdefault(index, []).append(chunk_products)
+                page_chunk_stats.setdefault(index, []).append(chunk_stats)
+            for index, chunk_results in page_chunk_results.items():
+                extraction[index] = self._chunk_totals(page_chunk_stats[index])
+                if extraction[index]['failed_chunks']:
+                    self.logger.warning(f"{extraction[index]['failed_chunks']} of {extraction[index]['chunk_count']} "
+                                        f"GPT-4 chunks of page {index + 1} failed; not using its GPT-4 result")
+                    continue
+                page_products = self._products_from_gpt4_dicts(self._merge_chunk_products(chunk_results))
+                if page_products:
+                    escalated[index] = ('gpt4', page_products)
+        
+        remaining = [index for index in indexes if index not in escalated]
+        if remaining and self.documentai_client and self.processor_id != 'mock-processor-for-demo':
+            print(f"📄 Escalating {len(remaining)} pages to Google Cloud Document AI...")
+            # One reader over the mapping serves every page of the window
+            reader = _open_reader(document_content) if mime_type == 'application/pdf' else None
+            for index in remaining:
+                try:
+                    page_content, page_mime_type = self._page_document(reader, mime_type, pages, index)
+                    page_products = self._parse_with_documentai(page_content, page_mime_type)
+                    if page_products:
+                        escalated[index] = ('documentai', page_products)
+                except Exception as e:
+                    self.logger.error(f"Document AI parsing of page {index + 1} failed: {str(e)}")
+        
+        return escalated, extraction
+
+    def _page_document(self, reader: Optional[PyPDF2.PdfReader], mime_type: str, pages: Dict[int, str],
+                       index: int) -> Tuple[bytes, str]:
+        """Build a single-page document to send to Document AI from the document's PDF reader."""
+        if mime_type == 'application/pdf':
+            writer = PyPDF2.PdfWriter()
+            writer.add_page(reader.pages[index])
+            output = io.BytesIO()
+            writer.write(output)
+            return output.getvalue(), mime_type
+        return pages[index].encode('utf-8'), 'text/plain'
+
+    def _name_products(self, products: List[ProductData], naming_memo: Optional[NamingMemo] = None) -> None:
+        """Set the online store name of each extracted product."""
+        for product in products:
+            product.online_store_name = self._make_online_store_name(product.name, product.model,
+                                                                     product.manufacturer, naming_memo)
+
+    def _detect_manufacturer(self, text: str) -> str:
+        """Detect the manufacturer named in a product line."""
+        lowered = text.lower()
+        if 'denon' in lowered:
+            return 'Denon'
+        elif 'akg' in lowered:
+            return 'AKG'
+        elif 'polk' in lowered:
+            return 'Polk Audio'
+        return config.default_manufacturer
+
+    def _parse_table_lines(self, page_text: str) -> List[ProductData]:
+        """Local table extractor: one product per line holding a model and a trailing price."""
+        products = []
+        for line in page_text.splitlines():
+            price_match = None
+            for price_match in PRICE_TOKEN_PATTERN.finditer(line):
+                pass
+            if price_match is None:
+                continue
+            
+            # The last price on the line is the current one; the model precedes it.
+            # Earlier prices (old RRP) and their labels are not part of the name.
+            head = PRICE_TOKEN_PATTERN.sub(' ', line[:price_match.start()])
+            head = PRICE_LABEL_PATTERN.sub(' ', head)
+            model = self.extract_denon_model(head)
+            if not model:
+                model = find_model_token(head)
+                if not model:
+                    continue
+            
+            name = re.sub(re.escape(model), ' ', head, count=1, flags=re.IGNORECASE)
+            name = re.sub(r'[\s|,;:]+', ' ', name).strip(' -') or model
+            manufacturer = self._detect_manufacturer(line)
+            products.append(ProductData(
+                name=self.normalize_product_name(name, model, manufacturer) or name,
+                model=model,
+                price=self._price_to_rands(re.sub(r'[^\d.]', '', price_match.group(0))),
+                manufacturer=manufacturer
+            ))
+        return products
 
     def _generate_online_store_name_ai(self, name: str, model: str, manufacturer: Optional[str]) -> Optional[str]:
         """Use OpenAI to generate a concise store-friendly name."""
@@ -300,12 +597,18 @@ class DocumentAIParser:
             self.logger.warning(f"AI name generation failed: {str(e)}")
             return None
 
-    def _make_online_store_name(self, name: str, model: str, manufacturer: Optional[str]) -> str:
+    def _make_online_store_name(self, name: str, model: str, manufacturer: Optional[str],
+                                naming_memo: Optional[NamingMemo] = None) -> str:
         """Construct a clean, searchable product name for the online store."""
-        # First try using OpenAI for a polished name
-        ai_name = self._generate_online_store_name_ai(name, model, manufacturer)
-        if ai_name:
-            return ai_name
+        if naming_memo is not None:
+            # The run's StoreNameGenerator names this product later
+            if self.openai_client:
+                naming_memo.record_deferred()
+        else:
+            # First try using OpenAI for a polished name
+            ai_name = self._generate_online_store_name_ai(name, model, manufacturer)
+            if ai_name:
+                return ai_name
 
         # Normalize the base name
         base = self.normalize_product_name(name, model, manufacturer)
@@ -329,42 +632,131 @@ class DocumentAIParser:
             return f"R{price}"
         return price
 
-    def _parse_with_gpt4(self, raw_text: str) -> List[ProductData]:
-        try:
-            prompt = self._create_enhanced_gpt4_prompt(raw_text)
-            response = self._call_openai_with_retries(prompt)
-            if not response:
-                return []
-            products_data = self._parse_gpt4_response(response)
-            products = []
-            for product_dict in products_data:
-                try:
-                    sku_value = product_dict.get('sku') or product_dict.get('model', '')
-                    manufacturer = product_dict.get('manufacturer') or config.default_manufacturer
-                    
-                    # Enhanced model extraction
-                    if not sku_value:
-                        sku_value = self.extract_denon_model(product_dict.get('name', ''))
-                    
-                    product = ProductData(
-                        name=self.normalize_product_name(product_dict.get('name', ''), sku_value, manufacturer),
-                        model=sku_value,
-                        price=self._price_to_rands(str(product_dict.get('price', '0.00'))),
-                        description=product_dict.get('description'),
-                        category=product_dict.get('category'),
-                        manufacturer=manufacturer,
-                        specifications=product_dict.get('specifications'),
-                        confidence=product_dict.get('confidence', 0.9),
-                        online_store_name=self._make_online_store_name(product_dict.get('name', ''), sku_value, manufacturer)
-                    )
-                    if product.name and product.model:
-                        products.append(product)
-                except Exception as e:
-                    self.logger.warning(f"Error creating product from GPT-4 response: {str(e)}")
-            return products
-        except Exception as e:
-            self.logger.error(f"Error in GPT-4 parsing: {str(e)}")
-            return []
+    def _products_from_gpt4_dicts(self, products_data: List[Dict[str, Any]]) -> List[ProductData]:
+        """Build products from GPT-4 product dicts, dropping entries without a name or model."""
+        products = []
+        for product_dict in products_data:
+            try:
+                sku_value = product_dict.get('sku') or product_dict.get('model', '')
+                manufacturer = product_dict.get('manufacturer') or config.default_manufacturer
+                
+                # Enhanced model extraction
+                if not sku_value:
+                    sku_value = self.extract_denon_model(product_dict.get('name', ''))
+                
+                product = ProductData(
+                    name=self.normalize_product_name(product_dict.get('name', ''), sku_value, manufacturer),
+                    model=sku_value,
+                    price=self._price_to_rands(str(product_dict.get('price', '0.00'))),
+                    description=product_dict.get('description'),
+                    category=product_dict.get('category'),
+                    manufacturer=manufacturer,
+                    specifications=product_dict.get('specifications'),
+                    confidence=product_dict.get('confidence', 0.9)
+                )
+                if product.name and product.model:
+                    products.append(product)
+            except Exception as e:
+                self.logger.warning(f"Error creating product from GPT-4 response: {str(e)}")
+        return products
+
+    def _split_text_chunks(self, text: str, max_chars: Optional[int] = None,
+                           overlap_lines: Optional[int] = None) -> List[str]:
+        """Split text into line-aligned chunks within the GPT token budget.
+
+        Consecutive chunks share overlap_lines lines, so a product row cut at
+        a chunk boundary is still seen whole by one of the chunks.
+        """
+        max_chars = max_chars or config.gpt_chunk_tokens * 4  # ~4 characters per token
+        overlap_lines = config.gpt_chunk_overlap_lines if overlap_lines is None else overlap_lines
+        
+        lines = []
+        for line in text.splitlines():
+            # Hard-wrap lines that alone exceed the budget
+            lines.extend([line[i:i + max_chars] for i in range(0, len(line), max_chars)] or [''])
+        
+        chunks = []
+        start = 0
+        while start < len(lines):
+            end, size = start, 0
+            while end < len(lines) and (end == start or size + len(lines[end]) + 1 <= max_chars):
+                size += len(lines[end]) + 1
+                end += 1
+            chunk = '\n'.join(lines[start:end])
+            if chunk.strip():
+                chunks.append(chunk)
+            if end >= len(lines):
+                break
+            start = max(start + 1, end - overlap_lines)
+        return chunks
+
+    def _extract_chunks_with_gpt4(self, chunks: List[str]) -> Tuple[List[List[Dict[str, Any]]], Dict[str, Any]]:
+        """Run GPT-4 extraction on all chunks concurrently.
+
+        Returns the product dicts of each chunk, in chunk order, and the
+        extraction's per-chunk timings and token usage.
+        """
+        start_time = time.time()
+        workers = max(1, min(config.gpt_max_concurrency, len(chunks)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(self._extract_chunk_with_gpt4, range(len(chunks)), chunks))
+        
+        chunk_results = [chunk_products for chunk_products, _ in results]
+        extraction_stats = self._chunk_totals([stats for _, stats in results])
+        extraction_stats['seconds'] = round(time.time() - start_time, 3)
+        self.logger.info(f"GPT-4 extracted {extraction_stats['products_extracted']} products "
+                         f"from {len(chunks)} chunks in {extraction_stats['seconds']}s ({workers} concurrent)")
+        return chunk_results, extraction_stats
+
+    @staticmethod
+    def _chunk_totals(chunk_stats: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Sum per-chunk GPT-4 stats, keeping the chunk entries."""
+        return {
+            'chunks': chunk_stats,
+            'chunk_count': len(chunk_stats),
+            'failed_chunks': sum(1 for stats in chunk_stats if not stats['success']),
+            'products_extracted': sum(stats['products'] for stats in chunk_stats),
+            'prompt_tokens': sum(stats['prompt_tokens'] for stats in chunk_stats),
+            'completion_tokens': sum(stats['completion_tokens'] for stats in chunk_stats)
+        }
+
+    def _extract_chunk_with_gpt4(self, index: int, chunk: str) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """Extract product dicts from one chunk, with its timing and token usage."""
+        stats = {'chunk': index, 'characters': len(chunk), 'success': False, 'products': 0,
+                 'prompt_tokens': 0, 'completion_tokens': 0, 'seconds': 0.0}
+        start_time = time.time()
+        response = self._call_openai_with_retries(self._create_enhanced_gpt4_prompt(chunk), usage=stats)
+        products = self._parse_gpt4_response(response) if response else []
+        stats.update({
+            'success': response is not None,
+            'products': len(products),
+            'seconds': round(time.time() - start_time, 3)
+        })
+        self.logger.info(f"Chunk {index + 1}: {stats['products']} products in {stats['seconds']}s "
+                         f"({stats['prompt_tokens']} prompt / {stats['completion_tokens']} completion tokens)")
+        return products, stats
+
+    def _merge_chunk_products(self, chunk_results: List[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Merge per-chunk product dicts in document order, deduplicating by model.
+
+        Products seen in two chunks (e.g. in the overlap) keep the first
+        occurrence, with empty fields filled from later ones.
+        """
+        merged: Dict[str, Dict[str, Any]] = {}
+        for chunk_products in chunk_results:
+            for product_dict in chunk_products:
+                if not isinstance(product_dict, dict):
+                    continue
+                model = product_dict.get('sku') or product_dict.get('model') or self.extract_denon_model(product_dict.get('name', '')) or ''
+                key = model_key(model) or 'name:' + model_key(product_dict.get('name'))
+                existing = merged.get(key)
+                if existing is None:
+                    merged[key] = dict(product_dict)
+                    continue
+                for field, value in product_dict.items():
+                    if value and not existing.get(field):
+                        existing[field] = value
+        return list(merged.values())
 
     def _create_enhanced_gpt4_prompt(self, raw_text: str) -> str:
         prompt = f"""
@@ -398,10 +790,11 @@ EXTRACTION FIELDS (return as JSON array):
 RETURN FORMAT: Valid JSON array only, no explanations or additional text.
 
 TEXT TO PROCESS:
-{raw_text[:4000]}"""
+{raw_text}"""
         return prompt
 
-    def _call_openai_with_retries(self, prompt: str, max_retries: int = 3) -> Optional[str]:
+    def _call_openai_with_retries(self, prompt: str, max_retries: int = 3,
+                                  usage: Optional[Dict[str, Any]] = None) -> Optional[str]:
         for attempt in range(max_retries):
             try:
                 response = self.openai_client.chat.completions.create(
@@ -420,6 +813,9 @@ TEXT TO PROCESS:
                     max_tokens=4000,
                     response_format={"type": "json_object"}
                 )
+                if usage is not None and getattr(response, 'usage', None) is not None:
+                    usage['prompt_tokens'] = usage.get('prompt_tokens', 0) + (response.usage.prompt_tokens or 0)
+                    usage['completion_tokens'] = usage.get('completion_tokens', 0) + (response.usage.completion_tokens or 0)
                 return response.choices[0].message.content
             except Exception as e:
                 self.logger.warning(f"OpenAI API call attempt {attempt + 1} failed: {str(e)}")
@@ -457,58 +853,108 @@ TEXT TO PROCESS:
         products = self._extract_products_from_document(document)
         return products
 
-    def _parse_text_fallback_enhanced(self, text: str) -> List[ProductData]:
+    def _parse_text_fallback_enhanced(self, text: str, naming_memo: Optional[NamingMemo] = None) -> List[ProductData]:
         """Enhanced fallback parsing with audio equipment specific patterns."""
+        products = self._match_fallback_patterns(text)
+        self._name_products(products, naming_memo)
+        return products
+
+    def _match_fallback_patterns(self, text: str) -> List[ProductData]:
+        """Local line-oriented extractor: one product per priced row with a model.
+
+        Runs a single tokenizing pass per line, so it is linear in the text
+        length. A row split over two lines (model first, price on the next
+        line) is joined. Products are deduplicated by model, first row wins.
+        """
         products = []
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Enhanced patterns for audio equipment
-        patterns = [
-            # Denon specific pattern
-            r'(?P<name>[\w\.\-\s]+(?:Denon|AVR|AVC)[\w\.\-\s]*?)[\s|,]+(?P<model>AVR[X]?[-_]?[A-Z]?\d{3,4}[A-Z]*[BT]*|AVC[-_][A-Z]?\d{3,4}[A-Z]*)[\s|,]+.*?R?\s*(?P<price>[0-9,]+\.?\d*)',
-            # General audio equipment pattern
-            r'(?P<name>[\w\.\-\s]+(?:Channel|Receiver|Amplifier|Speaker)[\w\.\-\s]*?)[\s|,]+(?P<model>[A-Z0-9\-]{4,})[\s|,]+.*?R?\s*(?P<price>[0-9,]+\.?\d*)',
-            # Generic pattern
-            r'(?P<name>[\w\.\-\s]+)[\s|,]+(?P<model>[A-Z0-9\-]{4,})[\s|,]+.*?R?\s*(?P<price>[0-9,]+\.?\d*)'
-        ]
+        seen_models = set()
+        held_tokens: List[str] = []  # previous line with a model but no price
+        for line in text.splitlines():
+            tokens = line.translate(ROW_SEPARATORS).split()
+            if not tokens:
+                continue
+            
+            price, price_start = self._split_row_price(tokens)
+            if price is None:
+                held_tokens = tokens if self._find_row_model(tokens) is not None else []
+                continue
+            
+            # Drop earlier prices on the row (e.g. old RRP before the new one)
+            row_end = price_start
+            while row_end > 0:
+                earlier_price, earlier_start = self._split_row_price(tokens, row_end)
+                if earlier_price is None:
+                    break
+                row_end = earlier_start
+            row = tokens[:row_end]
+            model_index = self._find_row_model(row)
+            if model_index is None and held_tokens:
+                row = held_tokens + row
+                model_index = self._find_row_model(row)
+            held_tokens = []
+            if model_index is None:
+                continue
+            
+            model = row[model_index].strip('.,:-')
+            name = ' '.join(row[:model_index] + row[model_index + 1:]).strip(' ,:-')
+            key = model_key(model)
+            if len(name) < 3 or key in seen_models:
+                continue
+            seen_models.add(key)
+            
+            # Detect manufacturer from the row
+            manufacturer = self._detect_manufacturer(name)
+            products.append(ProductData(
+                name=self.normalize_product_name(name, model, manufacturer) or name,
+                model=model,
+                price=self._price_to_rands(price),
+                manufacturer=manufacturer,
+                confidence=0.7  # Lower confidence for fallback parsing
+            ))
+        return products
+
+    @staticmethod
+    def _split_row_price(tokens: List[str], end: Optional[int] = None) -> Tuple[Optional[str], int]:
+        """Find the price ending tokens[:end] in a tokenized row.
+
+        Returns the price as plain digits and the index of its first token,
+        or (None, end) when the row does not end in a price. Handles
+        'R 12 999.00' style prices split into several tokens.
+        """
+        end = len(tokens) if end is None else end
+        match = AMOUNT_TOKEN.fullmatch(tokens[end - 1])
+        if not match:
+            return None, end
+        start = end - 1
+        digits = match.group(1).replace(',', '') + (match.group(2) or '')
         
-        for pattern in patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                name = match.group('name').strip()
-                model = match.group('model').strip()
-                price = match.group('price').replace(',', '').strip()
-                
-                # Enhanced model extraction
-                extracted_model = self.extract_denon_model(name) or model
-                
-                # Skip if invalid
-                if len(name) < 3 or len(extracted_model) < 3:
-                    continue
-                
-                manufacturer = config.default_manufacturer
-                
-                # Detect manufacturer from name
-                if 'denon' in name.lower():
-                    manufacturer = 'Denon'
-                elif 'akg' in name.lower():
-                    manufacturer = 'AKG'
-                elif 'polk' in name.lower():
-                    manufacturer = 'Polk Audio'
-                
-                normalized_name = self.normalize_product_name(name, extracted_model, manufacturer)
-                online_store_name = self._make_online_store_name(normalized_name, extracted_model, manufacturer)
-                
-                product = ProductData(
-                    name=normalized_name,
-                    model=extracted_model,
-                    price=self._price_to_rands(price),
-                    manufacturer=manufacturer,
-                    online_store_name=online_store_name,
-                    confidence=0.7  # Lower confidence for fallback parsing
-                )
-                products.append(product)
+        # Space-separated thousands: '12 999.00'
+        while start > 0 and THOUSANDS_GROUP_TOKEN.fullmatch(tokens[start]) and LEADING_GROUP_TOKEN.fullmatch(tokens[start - 1]):
+            start -= 1
+            digits = AMOUNT_TOKEN.fullmatch(tokens[start]).group(1) + digits
+        if start > 0 and CURRENCY_TOKEN.fullmatch(tokens[start - 1]):
+            start -= 1
         
-        return products
+        # A bare short number is more likely a quantity or spec than a price
+        if '.' not in digits and len(digits) < 3 and not CURRENCY_TOKEN.match(tokens[start]):
+            return None, end
+        return digits, start
+
+    @staticmethod
+    def _find_row_model(tokens: List[str]) -> Optional[int]:
+        """Index of the model token in a row: a Denon model, else the first code starting with a letter."""
+        fallback = None
+        for index, token in enumerate(tokens):
+            token = token.strip('.,:-')
+            if DENON_MODEL_TOKEN.fullmatch(token):
+                return index
+            if fallback is None and MODEL_TOKEN.fullmatch(token) and token[0].isalpha():
+                fallback = index
+        if fallback is None:
+            for index, token in enumerate(tokens):
+                if MODEL_TOKEN.fullmatch(token.strip('.,:-')):
+                    return index
+        return fallback
 
     def _extract_products_from_document(self, document: documentai.Document) -> List[ProductData]:
         products = []
@@ -542,8 +988,7 @@ TEXT TO PROCESS:
                         name=normalized_name,
                         model=extracted_model,
                         price=self._price_to_rands(price) if price else None,
-                        manufacturer=manufacturer,
-                        online_store_name=self._make_online_store_name(normalized_name, extracted_model, manufacturer)
+                        manufacturer=manufacturer
                     )
                     products.append(product)
                     name = model = price = manufacturer = ""
@@ -551,17 +996,18 @@ TEXT TO PROCESS:
             self.logger.error(f"Error extracting products from document: {str(e)}")
         return products
 
-    def parse_file(self, file_path: str) -> List[ProductData]:
+    @staticmethod
+    def _mime_type_for_path(file_path: str) -> str:
+        if file_path.lower().endswith('.pdf'):
+            return 'application/pdf'
+        elif file_path.lower().endswith('.txt'):
+            return 'text/plain'
+        return 'application/octet-stream'
+
+    def parse_file(self, file_path: str, tier_report: Optional[List[Dict[str, Any]]] = None) -> List[ProductData]:
         try:
-            with open(file_path, 'rb') as f:
-                content = f.read()
-            if file_path.lower().endswith('.pdf'):
-                mime_type = 'application/pdf'
-            elif file_path.lower().endswith('.txt'):
-                mime_type = 'text/plain'
-            else:
-                mime_type = 'application/octet-stream'
-            return self.parse_document(content, mime_type)
+            with map_document(file_path) as content:
+                return self.parse_document(content, self._mime_type_for_path(file_path), tier_report=tier_report)
         except Exception as e:
             self.logger.error(f"Error parsing file {file_path}: {str(e)}")
             return []
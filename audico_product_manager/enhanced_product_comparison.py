@@ -22,20 +22,35 @@ except ImportError:
     RAPIDFUZZ_AVAILABLE = False
     logging.warning("rapidfuzz not available, falling back to difflib")
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 try:
     from audico_product_manager.docai_parser import ProductData
-    from audico_product_manager.opencart_client import OpenCartAPIClient
+    from audico_product_manager.opencart_client import OpenCartAPIClient, CatalogExportError
+    from audico_product_manager.async_opencart_client import AsyncOpenCartAPIClient
+    from audico_product_manager.catalog_mirror import CatalogMirror
+    from audico_product_manager.catalog_features import ProductFeatures, build_catalog_features
     from audico_product_manager.config import config
     from audico_product_manager.store_name_generator import StoreNameGenerator
 except ImportError:
     try:
         from .docai_parser import ProductData
-        from .opencart_client import OpenCartAPIClient
+        from .opencart_client import OpenCartAPIClient, CatalogExportError
+        from .async_opencart_client import AsyncOpenCartAPIClient
+        from .catalog_mirror import CatalogMirror
+        from .catalog_features import ProductFeatures, build_catalog_features
         from .config import config
         from .store_name_generator import StoreNameGenerator
     except ImportError:
         from docai_parser import ProductData
-        from opencart_client import OpenCartAPIClient
+        from opencart_client import OpenCartAPIClient, CatalogExportError
+        from async_opencart_client import AsyncOpenCartAPIClient
+        from catalog_mirror import CatalogMirror
+        from catalog_features import ProductFeatures, build_catalog_features
         from config import config
         from store_name_generator import StoreNameGenerator
 
@@ -77,20 +92,44 @@ class EnhancedProductMatch:
 class EnhancedProductComparator:
     """Enhanced product comparison with GPT-4 store names and improved fuzzy matching."""
     
-    def __init__(self, opencart_client: OpenCartAPIClient, store_name_generator: Optional[StoreNameGenerator] = None):
+    # Terms that boost similarity when present in both texts
+    AUDIO_TERMS = ['receiver', 'amplifier', 'speaker', 'microphone', 'channel', 'dolby', 'dts', 'hdmi']
+    
+    # Match types by cascade step in the vectorized batch path (0 = no match)
+    BATCH_MATCH_TYPES = [
+        MatchType.NO_MATCH, MatchType.EXACT_SKU, MatchType.EXACT_MODEL, MatchType.STORE_NAME_MATCH,
+        MatchType.MODEL_EXTRACTED, MatchType.FUZZY_NAME, MatchType.PARTIAL_MATCH
+    ]
+    
+    # Upper bound on parsed rows x catalog products scored per cdist chunk
+    BATCH_SCORING_CELLS = 2_000_000
+    
+    def __init__(self, opencart_client: OpenCartAPIClient, store_name_generator: Optional[StoreNameGenerator] = None,
+                 async_client: Optional[AsyncOpenCartAPIClient] = None,
+                 catalog_mirror: Optional[CatalogMirror] = None):
         """
         Initialize the enhanced product comparator.
         
         Args:
             opencart_client: OpenCart API client instance
             store_name_generator: Store name generator instance (optional)
+            async_client: Async OpenCart client for concurrent catalog export (optional)
+            catalog_mirror: Local catalog mirror to read products from (optional)
         """
         self.opencart_client = opencart_client
+        self.async_client = async_client
+        self.catalog_mirror = catalog_mirror
         self.store_name_generator = store_name_generator or StoreNameGenerator()
         self.logger = logging.getLogger(__name__)
         self.existing_products = []
         self.existing_products_loaded = False
         
+        # Precomputed matching features for existing_products, built lazily after each load
+        self.catalog_features: Optional[List[ProductFeatures]] = None
+        
+        # Threads used by rapidfuzz cdist (-1 = all cores; 1 inside sharded worker processes)
+        self.cdist_workers = -1
+        
         # Enhanced matching thresholds
         self.exact_threshold = 0.95
         self.high_threshold = 0.85
@@ -116,33 +155,51 @@ class EnhancedProductComparator:
             # AKG patterns
             r'(C\d{3}[-_]?[A-Z]*)', # C414-XLS, C414
         ]
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Pickle the prepared comparator for comparison worker processes.
         
-        # Enhanced search terms for OpenCart API
-        self.audio_search_terms = [
-            "", "Denon", "AKG", "Audio", "Speaker", "Amplifier", "Receiver", "DJ", "Polk", "Alpha",
-            "JBL", "QSC", "Yamaha", "Pioneer", "Sony", "Marantz", "Onkyo", "Harman", "Shure",
-            "Sennheiser", "Audio-Technica", "Behringer", "Mackie", "PreSonus", "Focusrite",
-            "Microphone", "Headphones", "Subwoofer", "Monitor", "Mixer", "Interface", "Preamp",
-            "Turntable", "CDJ", "Controller", "Synthesizer", "Keyboard", "Studio", "Live",
-            "Channel", "Wireless", "Bluetooth", "USB", "XLR", "TRS", "Phantom", "Condenser",
-            "Dynamic", "Ribbon", "Cardioid", "Omnidirectional", "Shotgun", "Lavalier",
-            "HDMI", "4K", "8K", "Dolby", "DTS", "Atmos", "Surround", "Theater", "Cinema"
-        ]
+        Workers only score rows against the loaded catalog, so the API
+        clients, the catalog mirror and the store name generator are left out.
+        
+        Returns:
+            Dict[str, Any]: Instance state without I/O members
+        """
+        state = self.__dict__.copy()
+        for name in ('opencart_client', 'async_client', 'catalog_mirror', 'store_name_generator'):
+            state[name] = None
+        return state
     
     def load_existing_products(self, force_reload: bool = False) -> bool:
         """
-        Load existing products from OpenCart with enhanced search.
+        Load existing products from OpenCart via a paginated catalog export.
         
         Args:
             force_reload: Force reload even if already loaded
             
         Returns:
-            bool: True if products loaded successfully
+            bool: True if products loaded successfully, False if the catalog export
+                failed part-way (the previously loaded catalog, if any, is kept)
         """
         if self.existing_products_loaded and not force_reload:
             return True
         
+        self.catalog_features = None
+        
         try:
+            # Read from the local catalog mirror when available
+            if self.catalog_mirror is not None:
+                if force_reload:
+                    # A forced reload re-exports everything so deleted products are pruned
+                    self.catalog_mirror.refresh(self.opencart_client, full=True)
+                if self.catalog_mirror.ensure_fresh(self.opencart_client):
+                    self.existing_products = self.catalog_mirror.get_all_products()
+                    self.logger.info(f"Loaded {len(self.existing_products)} products from the catalog mirror")
+                    self.existing_products_loaded = True
+                    return True
+                self.logger.warning("Catalog mirror is empty and could not be refreshed, falling back to live export")
+            
             self.logger.info("Loading existing products from OpenCart...")
             
             # Test connection first
@@ -152,23 +209,16 @@ class EnhancedProductComparator:
                 self.existing_products_loaded = True
                 return True
             
-            # Fetch products using multiple search terms
-            all_products = []
-            seen_product_ids = set()
-            
-            for term in self.audio_search_terms:
-                try:
-                    products = self.opencart_client.search_products(term)
-                    if products:
-                        for product in products:
-                            product_id = product.get('product_id')
-                            if product_id and product_id not in seen_product_ids:
-                                all_products.append(product)
-                                seen_product_ids.add(product_id)
-                        self.logger.debug(f"Search term '{term}': found {len(products)} products")
-                except Exception as e:
-                    self.logger.warning(f"Error searching for term '{term}': {str(e)}")
-                    continue
+            # Export the full catalog in one paginated pass; a partial export is refused
+            try:
+                if self.async_client is not None:
+                    all_products = self.async_client.get_all_products_sync()
+                else:
+                    all_products = list(self.opencart_client.iter_all_products())
+            except CatalogExportError as e:
+                self.logger.error(f"{str(e)}; keeping the previously loaded catalog "
+                                  f"({len(self.existing_products)} products)")
+                return False
             
             if all_products:
                 self.logger.info(f"Successfully loaded {len(all_products)} unique products from OpenCart")
@@ -276,10 +326,10 @@ class EnhancedProductComparator:
         if not text1 or not text2:
             return 0.0
         
-        # Normalize both texts
-        norm_text1 = self.normalize_text(text1)
-        norm_text2 = self.normalize_text(text2)
-        
+        return self._fuzzy_similarity_normalized(self.normalize_text(text1), self.normalize_text(text2))
+    
+    def _fuzzy_similarity_normalized(self, norm_text1: str, norm_text2: str) -> float:
+        """Fuzzy similarity between two already-normalized texts (see calculate_fuzzy_similarity)."""
         if RAPIDFUZZ_AVAILABLE:
             # Use rapidfuzz for better performance and accuracy
             ratio = fuzz.ratio(norm_text1, norm_text2) / 100.0
@@ -293,8 +343,7 @@ class EnhancedProductComparator:
             similarity = SequenceMatcher(None, norm_text1, norm_text2).ratio()
         
         # Boost similarity for audio equipment specific terms
-        audio_terms = ['receiver', 'amplifier', 'speaker', 'microphone', 'channel', 'dolby', 'dts', 'hdmi']
-        common_audio_terms = sum(1 for term in audio_terms if term in norm_text1 and term in norm_text2)
+        common_audio_terms = sum(1 for term in self.AUDIO_TERMS if term in norm_text1 and term in norm_text2)
         
         if common_audio_terms > 0:
             boost = min(0.1, common_audio_terms * 0.03)
@@ -326,95 +375,170 @@ class EnhancedProductComparator:
         Returns:
             EnhancedProductMatch: Enhanced match result
         """
-        if not self.existing_products_loaded:
-            self.load_existing_products()
+        if not self.existing_products_loaded and not self.load_existing_products():
+            raise CatalogExportError("Existing products could not be loaded")
         
-        # Generate store-friendly name
-        store_name = self.store_name_generator.generate_store_name(product_data)
-        product_data.online_store_name = store_name
-        
-        # Prepare search data
-        parsed_name = product_data.name or ""
-        parsed_model = product_data.model or ""
-        parsed_sku = getattr(product_data, 'sku', '') or ""
-        parsed_price = self._parse_price(product_data.price)
+        return self._match_prepared_row(product_data, self._prepare_parsed_row(product_data))
+    
+    def _match_prepared_row(self, product_data: ProductData, row: Dict[str, Any]) -> EnhancedProductMatch:
+        """
+        Score every catalog product against a prepared parsed row.
         
+        Args:
+            product_data: Product data from extraction
+            row: Prepared parsed row (see _prepare_parsed_row)
+            
+        Returns:
+            EnhancedProductMatch: Enhanced match result
+        """
         best_match = None
         best_score = 0.0
         best_match_type = MatchType.NO_MATCH
         debug_matches = []
         
-        self.logger.debug(f"Finding enhanced match for: {parsed_name}")
-        self.logger.debug(f"Generated store name: {store_name}")
+        self.logger.debug(f"Finding enhanced match for: {row['name']}")
+        self.logger.debug(f"Generated store name: {row['store_name']}")
         
-        for existing_product in self.existing_products:
-            existing_name = existing_product.get('name', '')
-            existing_model = existing_product.get('model', '')
-            existing_sku = existing_product.get('sku', '')
-            
-            match_info = {
-                'existing_product': existing_product,
-                'scores': {},
-                'match_type': MatchType.NO_MATCH,
-                'total_score': 0.0
-            }
-            
-            # 1. Exact SKU match (highest priority)
-            if parsed_sku and existing_sku:
-                sku_similarity = self.calculate_fuzzy_similarity(parsed_sku, existing_sku)
-                match_info['scores']['sku'] = sku_similarity
-                if sku_similarity >= self.exact_threshold:
-                    match_info['match_type'] = MatchType.EXACT_SKU
-                    match_info['total_score'] = sku_similarity
-            
-            # 2. Exact model match
-            if match_info['total_score'] < self.exact_threshold and parsed_model and existing_model:
-                model_similarity = self.calculate_fuzzy_similarity(parsed_model, existing_model)
-                match_info['scores']['model'] = model_similarity
-                if model_similarity >= self.exact_threshold:
-                    match_info['match_type'] = MatchType.EXACT_MODEL
-                    match_info['total_score'] = model_similarity
-            
-            # 3. Store name matching (new enhanced feature)
-            if match_info['total_score'] < self.high_threshold and store_name:
-                store_name_similarity = self.calculate_fuzzy_similarity(store_name, existing_name)
-                match_info['scores']['store_name'] = store_name_similarity
-                if store_name_similarity >= self.high_threshold:
-                    match_info['match_type'] = MatchType.STORE_NAME_MATCH
-                    match_info['total_score'] = store_name_similarity
-            
-            # 4. Model extraction and comparison
-            if match_info['total_score'] < self.high_threshold:
-                parsed_extracted = self.extract_model_number(parsed_name) or self.extract_model_number(parsed_model)
-                existing_extracted = self.extract_model_number(existing_name) or self.extract_model_number(existing_model)
-                
-                if parsed_extracted and existing_extracted:
-                    extracted_similarity = self.calculate_fuzzy_similarity(parsed_extracted, existing_extracted)
-                    match_info['scores']['model_extracted'] = extracted_similarity
-                    if extracted_similarity >= self.high_threshold:
-                        match_info['match_type'] = MatchType.MODEL_EXTRACTED
-                        match_info['total_score'] = extracted_similarity
-            
-            # 5. Fuzzy name matching
-            if match_info['total_score'] < self.medium_threshold:
-                name_similarity = self.calculate_fuzzy_similarity(parsed_name, existing_name)
-                match_info['scores']['name_similarity'] = name_similarity
-                
-                if name_similarity >= self.medium_threshold:
-                    match_info['match_type'] = MatchType.FUZZY_NAME
-                    match_info['total_score'] = name_similarity
-                elif name_similarity >= self.low_threshold:
-                    match_info['match_type'] = MatchType.PARTIAL_MATCH
-                    match_info['total_score'] = name_similarity
-            
+        for features in self._get_catalog_features():
+            match_info = self._score_existing_product(row, features)
             debug_matches.append(match_info)
             
             # Update best match
             if match_info['total_score'] > best_score:
                 best_score = match_info['total_score']
-                best_match = existing_product
+                best_match = features.product
                 best_match_type = match_info['match_type']
         
+        return self._build_enhanced_match(product_data, row, best_match, best_score, best_match_type, debug_matches)
+    
+    def _prepare_parsed_row(self, product_data: ProductData) -> Dict[str, Any]:
+        """
+        Generate the store name for a parsed product and normalize its fields once.
+        
+        Args:
+            product_data: Product data from extraction
+            
+        Returns:
+            Dict[str, Any]: Raw and normalized parsed values
+        """
+        # Generate store-friendly name
+        store_name = self.store_name_generator.generate_store_name(product_data)
+        product_data.online_store_name = store_name
+        
+        # Prepare search data
+        parsed_name = product_data.name or ""
+        parsed_model = product_data.model or ""
+        parsed_sku = getattr(product_data, 'sku', '') or ""
+        parsed_extracted = self.extract_model_number(parsed_name) or self.extract_model_number(parsed_model)
+        
+        return {
+            'name': parsed_name,
+            'model': parsed_model,
+            'sku': parsed_sku,
+            'store_name': store_name,
+            'extracted': parsed_extracted,
+            'normalized_name': self.normalize_text(parsed_name),
+            'normalized_model': self.normalize_text(parsed_model),
+            'normalized_sku': self.normalize_text(parsed_sku),
+            'normalized_store_name': self.normalize_text(store_name),
+            'normalized_extracted': self.normalize_text(parsed_extracted) if parsed_extracted else ''
+        }
+    
+    def _score_existing_product(self, row: Dict[str, Any], features: ProductFeatures) -> Dict[str, Any]:
+        """
+        Score one existing product against a prepared parsed row.
+        
+        Args:
+            row: Prepared parsed row (see _prepare_parsed_row)
+            features: Precomputed features of the existing product
+            
+        Returns:
+            Dict[str, Any]: Match info with per-strategy scores, match type and total score
+        """
+        existing_product = features.product
+        existing_name = existing_product.get('name', '')
+        existing_model = existing_product.get('model', '')
+        existing_sku = existing_product.get('sku', '')
+        
+        match_info = {
+            'existing_product': existing_product,
+            'scores': {},
+            'match_type': MatchType.NO_MATCH,
+            'total_score': 0.0
+        }
+        
+        # 1. Exact SKU match (highest priority)
+        if row['sku'] and existing_sku:
+            sku_similarity = self._fuzzy_similarity_normalized(row['normalized_sku'], features.normalized_sku)
+            match_info['scores']['sku'] = sku_similarity
+            if sku_similarity >= self.exact_threshold:
+                match_info['match_type'] = MatchType.EXACT_SKU
+                match_info['total_score'] = sku_similarity
+        
+        # 2. Exact model match
+        if match_info['total_score'] < self.exact_threshold and row['model'] and existing_model:
+            model_similarity = self._fuzzy_similarity_normalized(row['normalized_model'], features.normalized_model)
+            match_info['scores']['model'] = model_similarity
+            if model_similarity >= self.exact_threshold:
+                match_info['match_type'] = MatchType.EXACT_MODEL
+                match_info['total_score'] = model_similarity
+        
+        # 3. Store name matching (new enhanced feature)
+        if match_info['total_score'] < self.high_threshold and row['store_name']:
+            store_name_similarity = (
+                self._fuzzy_similarity_normalized(row['normalized_store_name'], features.normalized_name)
+                if existing_name else 0.0
+            )
+            match_info['scores']['store_name'] = store_name_similarity
+            if store_name_similarity >= self.high_threshold:
+                match_info['match_type'] = MatchType.STORE_NAME_MATCH
+                match_info['total_score'] = store_name_similarity
+        
+        # 4. Model extraction and comparison
+        if match_info['total_score'] < self.high_threshold:
+            if row['extracted'] and features.extracted_model:
+                extracted_similarity = self._fuzzy_similarity_normalized(row['normalized_extracted'], features.extracted_model)
+                match_info['scores']['model_extracted'] = extracted_similarity
+                if extracted_similarity >= self.high_threshold:
+                    match_info['match_type'] = MatchType.MODEL_EXTRACTED
+                    match_info['total_score'] = extracted_similarity
+        
+        # 5. Fuzzy name matching
+        if match_info['total_score'] < self.medium_threshold:
+            if row['name'] and existing_name:
+                name_similarity = self._fuzzy_similarity_normalized(row['normalized_name'], features.normalized_name)
+            else:
+                name_similarity = 0.0
+            match_info['scores']['name_similarity'] = name_similarity
+            
+            if name_similarity >= self.medium_threshold:
+                match_info['match_type'] = MatchType.FUZZY_NAME
+                match_info['total_score'] = name_similarity
+            elif name_similarity >= self.low_threshold:
+                match_info['match_type'] = MatchType.PARTIAL_MATCH
+                match_info['total_score'] = name_similarity
+        
+        return match_info
+    
+    def _build_enhanced_match(self, product_data: ProductData, row: Dict[str, Any], best_match: Optional[Dict],
+                              best_score: float, best_match_type: MatchType,
+                              debug_matches: List[Dict[str, Any]]) -> EnhancedProductMatch:
+        """
+        Build the match result for a parsed product from its best candidate.
+        
+        Args:
+            product_data: Product data from extraction
+            row: Prepared parsed row
+            best_match: Best matching existing product (or None)
+            best_score: Score of the best match
+            best_match_type: Match type of the best match
+            debug_matches: Match info for the leading catalog products
+            
+        Returns:
+            EnhancedProductMatch: Enhanced match result
+        """
+        parsed_price = self._parse_price(product_data.price)
+        
         # Determine confidence level
         if best_score >= self.high_threshold:
             confidence_level = MatchConfidence.HIGH
@@ -442,10 +566,10 @@ class EnhancedProductComparator:
         debug_info = {
             'total_products_checked': len(self.existing_products),
             'best_score': best_score,
-            'store_name_generated': store_name,
+            'store_name_generated': row['store_name'],
             'top_matches': debug_matches[:3],
             'model_extraction': {
-                'parsed': self.extract_model_number(parsed_name) or self.extract_model_number(parsed_model),
+                'parsed': row['extracted'],
                 'existing': self.extract_model_number(best_match.get('name', '')) if best_match else None
             }
         }
@@ -459,10 +583,171 @@ class EnhancedProductComparator:
             action=action,
             issues=issues,
             price_change=price_change,
-            store_name_used=store_name,
+            store_name_used=row['store_name'],
             debug_info=debug_info
         )
     
+    def _audio_term_matrix(self, texts: List[str]) -> 'np.ndarray':
+        """
+        Mark which AUDIO_TERMS occur in each normalized text.
+        
+        Args:
+            texts: Normalized texts
+            
+        Returns:
+            np.ndarray: Integer matrix of shape (len(texts), len(AUDIO_TERMS))
+        """
+        return np.array(
+            [[term in text for term in self.AUDIO_TERMS] for text in texts],
+            dtype=np.int64
+        ).reshape(len(texts), len(self.AUDIO_TERMS))
+    
+    def _similarity_matrix(self, queries: List[str], choices: List[str],
+                           query_terms: 'np.ndarray', choice_terms: 'np.ndarray') -> 'np.ndarray':
+        """
+        Vectorized equivalent of _fuzzy_similarity_normalized for every query/choice pair.
+        
+        Args:
+            queries: Normalized parsed texts
+            choices: Normalized catalog texts
+            query_terms: Audio term matrix for queries
+            choice_terms: Audio term matrix for choices
+            
+        Returns:
+            np.ndarray: Similarity matrix of shape (len(queries), len(choices))
+        """
+        scores = process.cdist(queries, choices, scorer=fuzz.ratio, dtype=np.float64, workers=self.cdist_workers)
+        np.maximum(scores, process.cdist(queries, choices, scorer=fuzz.token_sort_ratio,
+                                         dtype=np.float64, workers=self.cdist_workers), out=scores)
+        np.maximum(scores, process.cdist(queries, choices, scorer=fuzz.token_set_ratio,
+                                         dtype=np.float64, workers=self.cdist_workers), out=scores)
+        similarity = scores / 100.0
+        
+        # Same audio term boost as the scalar path
+        common_audio_terms = query_terms @ choice_terms.T
+        boost = np.minimum(0.1, common_audio_terms * 0.03)
+        return np.where(common_audio_terms > 0, np.minimum(1.0, similarity + boost), similarity)
+    
+    def _batch_match_enhanced(self, products_data: List[ProductData]) -> List[EnhancedProductMatch]:
+        """
+        Match all parsed products at once using rapidfuzz score matrices.
+        
+        Parsed and catalog texts are normalized once, ratio/token_sort/token_set
+        matrices are computed with process.cdist, and the scalar match cascade
+        is applied with NumPy masks. Results are identical to calling
+        find_best_match_enhanced row by row.
+        
+        Args:
+            products_data: Parsed products (store names are generated here)
+            
+        Returns:
+            List[EnhancedProductMatch]: Match results in input order
+        """
+        rows = [self._prepare_parsed_row(product_data) for product_data in products_data]
+        return self._match_prepared_rows(products_data, rows)
+    
+    def _match_prepared_rows(self, products_data: List[ProductData],
+                             rows: List[Dict[str, Any]]) -> List[EnhancedProductMatch]:
+        """
+        Vectorized scoring of prepared parsed rows against the whole catalog.
+        
+        Args:
+            products_data: Parsed products
+            rows: Prepared rows for products_data (see _prepare_parsed_row)
+            
+        Returns:
+            List[EnhancedProductMatch]: Match results in input order
+        """
+        catalog = self._get_catalog_features()
+        if not catalog:
+            return [self._build_enhanced_match(product_data, row, None, 0.0, MatchType.NO_MATCH, [])
+                    for product_data, row in zip(products_data, rows)]
+        
+        # Catalog-side texts, presence masks and audio terms (computed once)
+        catalog_texts = {
+            'sku': [f.normalized_sku for f in catalog],
+            'model': [f.normalized_model for f in catalog],
+            'name': [f.normalized_name for f in catalog],
+            'extracted': [f.extracted_model for f in catalog]
+        }
+        catalog_terms = {kind: self._audio_term_matrix(texts) for kind, texts in catalog_texts.items()}
+        has_sku = np.array([bool(f.product.get('sku', '')) for f in catalog])
+        has_model = np.array([bool(f.product.get('model', '')) for f in catalog])
+        has_name = np.array([bool(f.product.get('name', '')) for f in catalog])
+        has_extracted = np.array([bool(f.extracted_model) for f in catalog])
+        
+        chunk_size = max(1, self.BATCH_SCORING_CELLS // len(catalog))
+        matches = []
+        
+        for start in range(0, len(rows), chunk_size):
+            chunk = rows[start:start + chunk_size]
+            shape = (len(chunk), len(catalog))
+            
+            def similarities(row_key: str, catalog_kind: str, needed: 'np.ndarray') -> 'np.ndarray':
+                # Skip the cdist calls entirely when no row in the chunk needs them
+                if not needed.any():
+                    return np.zeros(shape)
+                queries = [row[row_key] for row in chunk]
+                return self._similarity_matrix(queries, catalog_texts[catalog_kind],
+                                               self._audio_term_matrix(queries), catalog_terms[catalog_kind])
+            
+            row_sku = np.array([bool(row['sku']) for row in chunk])[:, None]
+            row_model = np.array([bool(row['model']) for row in chunk])[:, None]
+            row_store_name = np.array([bool(row['store_name']) for row in chunk])[:, None]
+            row_extracted = np.array([bool(row['extracted']) for row in chunk])[:, None]
+            row_name = np.array([bool(row['name']) for row in chunk])[:, None]
+            
+            score = np.zeros(shape)
+            match_code = np.zeros(shape, dtype=np.int64)
+            
+            # Apply the scalar cascade (see _score_existing_product) with masks
+            cascade = [
+                ('normalized_sku', 'sku', row_sku & has_sku, self.exact_threshold, self.exact_threshold),
+                ('normalized_model', 'model', row_model & has_model, self.exact_threshold, self.exact_threshold),
+                ('normalized_store_name', 'name', row_store_name & has_name, self.high_threshold, self.high_threshold),
+                ('normalized_extracted', 'extracted', row_extracted & has_extracted, self.high_threshold, self.high_threshold),
+            ]
+            for code, (row_key, catalog_kind, applicable, gate, threshold) in enumerate(cascade, start=1):
+                # The first step always runs; later ones only where no strong match was found yet
+                eligible = applicable if code == 1 else applicable & (score < gate)
+                step_similarity = similarities(row_key, catalog_kind, eligible)
+                hit = eligible & (step_similarity >= threshold)
+                score = np.where(hit, step_similarity, score)
+                match_code = np.where(hit, code, match_code)
+            
+            eligible = score < self.medium_threshold
+            name_similarity = np.where(row_name & has_name,
+                                       similarities('normalized_name', 'name', eligible & row_name & has_name), 0.0)
+            fuzzy_hit = eligible & (name_similarity >= self.medium_threshold)
+            partial_hit = eligible & ~fuzzy_hit & (name_similarity >= self.low_threshold)
+            score = np.where(fuzzy_hit | partial_hit, name_similarity, score)
+            match_code = np.where(fuzzy_hit, 5, np.where(partial_hit, 6, match_code))
+            
+            best_columns = np.argmax(score, axis=1)
+            for i, row in enumerate(chunk):
+                column = int(best_columns[i])
+                best_score = float(score[i, column])
+                if best_score > 0.0:
+                    best_match = catalog[column].product
+                    best_match_type = self.BATCH_MATCH_TYPES[int(match_code[i, column])]
+                else:
+                    best_match, best_score, best_match_type = None, 0.0, MatchType.NO_MATCH
+                
+                debug_matches = [self._score_existing_product(row, features) for features in catalog[:3]]
+                matches.append(self._build_enhanced_match(
+                    products_data[start + i], row, best_match, best_score, best_match_type, debug_matches
+                ))
+        
+        return matches
+    
+    def _get_catalog_features(self) -> List[ProductFeatures]:
+        """Get precomputed matching features for the loaded catalog, building them on first use."""
+        if self.catalog_features is None:
+            self.catalog_features = build_catalog_features(
+                self.existing_products, self.normalize_text, self.extract_model_number
+            )
+        return self.catalog_features
+    
     def _parse_price(self, price_value: Any) -> Optional[float]:
         """Enhanced price parsing."""
         if not price_value:
@@ -537,25 +822,37 @@ class EnhancedProductComparator:
         
         return issues
     
-    def batch_compare_products(self, products_data: List[ProductData]) -> List[EnhancedProductMatch]:
+    def batch_compare_products(self, products_data: List[ProductData],
+                               vectorized: bool = True) -> List[EnhancedProductMatch]:
         """
         Compare a batch of products with enhanced matching.
         
         Args:
             products_data: List of product data to compare
+            vectorized: Score all rows at once with rapidfuzz.process.cdist when
+                rapidfuzz and numpy are available (results match the per-row path)
             
         Returns:
             List[EnhancedProductMatch]: List of enhanced match results
         """
         self.logger.info(f"Starting enhanced batch comparison for {len(products_data)} products")
         
-        # Ensure existing products are loaded
-        self.load_existing_products()
+        # Ensure existing products are loaded; never compare against a partial catalog
+        if not self.load_existing_products() and not self.existing_products_loaded:
+            raise CatalogExportError("Existing products could not be loaded")
         
         # Generate store names for all products first
         self.logger.info("Generating store names for all products...")
         products_data = self.store_name_generator.batch_generate_store_names(products_data)
         
+        if vectorized and RAPIDFUZZ_AVAILABLE and NUMPY_AVAILABLE:
+            try:
+                matches = self._batch_match_enhanced(products_data)
+                self.log_comparison_summary(matches)
+                return matches
+            except Exception as e:
+                self.logger.error(f"Vectorized batch scoring failed, comparing row by row: {str(e)}")
+        
         # Compare each product
         matches = []
         for i, product_data in enumerate(products_data):
@@ -586,6 +883,56 @@ class EnhancedProductComparator:
         
         return matches
     
+    def prepare_batch(self, products_data: List[ProductData]) -> List[Dict[str, Any]]:
+        """
+        Load the catalog, generate store names and prepare every parsed row.
+        
+        After this, match_prepared_batch scores rows from local state only, so
+        slices of the batch can be matched in other processes.
+        
+        Args:
+            products_data: List of product data to compare
+            
+        Returns:
+            List[Dict[str, Any]]: Prepared rows in input order
+        """
+        if not self.load_existing_products() and not self.existing_products_loaded:
+            raise CatalogExportError("Existing products could not be loaded")
+        
+        self.logger.info("Generating store names for all products...")
+        self.store_name_generator.batch_generate_store_names(products_data)
+        
+        self._get_catalog_features()
+        return [self._prepare_parsed_row(product_data) for product_data in products_data]
+    
+    def match_prepared_batch(self, products_data: List[ProductData], rows: List[Dict[str, Any]],
+                             vectorized: bool = True) -> List[EnhancedProductMatch]:
+        """
+        Match rows prepared by prepare_batch against the loaded catalog.
+        
+        Args:
+            products_data: Parsed products
+            rows: Prepared rows for products_data
+            vectorized: Use the cdist score matrices when rapidfuzz and numpy are available
+            
+        Returns:
+            List[EnhancedProductMatch]: Match results in input order
+        """
+        if vectorized and RAPIDFUZZ_AVAILABLE and NUMPY_AVAILABLE:
+            return self._match_prepared_rows(products_data, rows)
+        return [self._match_prepared_row(product_data, row) for product_data, row in zip(products_data, rows)]
+    
+    def log_comparison_summary(self, matches: List[EnhancedProductMatch]) -> None:
+        """
+        Log per-product results and the summary of a batch comparison.
+        
+        Args:
+            matches: Match results in input order
+        """
+        for i, match in enumerate(matches):
+            self.logger.info(f"Product {i+1}: {match.match_type.value} match with {match.confidence_score:.2f} confidence")
+        self._log_comparison_summary(matches)
+    
     def _log_comparison_summary(self, matches: List[EnhancedProductMatch]) -> None:
         """Log summary of comparison results."""
         total = len(matches)
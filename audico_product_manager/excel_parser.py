@@ -9,30 +9,110 @@ product information in a format compatible with the existing workflow.
 import logging
 import re
 import os
-from typing import List, Dict, Any, Optional, Union
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import List, Dict, Any, Callable, Iterator, Optional, Tuple, Union
 from dataclasses import dataclass, asdict
+import openpyxl
 import pandas as pd
 from pathlib import Path
 
 try:
     from audico_product_manager.docai_parser import ProductData
     from audico_product_manager.config import config
+    from audico_product_manager.extraction_scoring import model_key
+    from audico_product_manager.template_registry import SupplierTemplate, TemplateRegistry
+    from audico_product_manager.process_pools import pool_context
 except ImportError:
     try:
         from .docai_parser import ProductData
         from .config import config
+        from .extraction_scoring import model_key
+        from .template_registry import SupplierTemplate, TemplateRegistry
+        from .process_pools import pool_context
     except ImportError:
         from docai_parser import ProductData
         from config import config
+        from extraction_scoring import model_key
+        from template_registry import SupplierTemplate, TemplateRegistry
+        from process_pools import pool_context
+
+
+# Common audio equipment manufacturers, matched in order against name and model
+AUDIO_MANUFACTURERS = {
+    'denon': 'Denon',
+    'akg': 'AKG',
+    'shure': 'Shure',
+    'sennheiser': 'Sennheiser',
+    'audio-technica': 'Audio-Technica',
+    'yamaha': 'Yamaha',
+    'pioneer': 'Pioneer',
+    'sony': 'Sony',
+    'jbl': 'JBL',
+    'qsc': 'QSC',
+    'behringer': 'Behringer',
+    'mackie': 'Mackie',
+    'polk': 'Polk Audio',
+    'marantz': 'Marantz',
+    'onkyo': 'Onkyo',
+    'harman': 'Harman Kardon'
+}
+
+# Audio equipment specific name normalizations (case-insensitive)
+NAME_NORMALIZATIONS = {
+    r'\bCh\b': 'Channel',
+    r'\bCh\.': 'Channel',
+    r'\bAmp\b': 'Amplifier',
+    r'\bRec\b': 'Receiver',
+    r'\bBT\b': 'Bluetooth',
+    r'\bWiFi\b': 'Wi-Fi',
+    r'\bHDMI\b': 'HDMI',
+    r'\b4K\b': '4K',
+    r'\b8K\b': '8K'
+}
+
+# What float() accepts once a price cell is reduced to digits, commas and periods
+PRICE_NUMBER_PATTERN = r'\d+\.?\d*|\.\d+'
+
+# Rows at the top of a sheet searched for the header row
+HEADER_SCAN_ROWS = 25
+
+# Workbook formats openpyxl can open in read-only mode
+STREAMABLE_FORMATS = ['.xlsx', '.xlsm']
+
+# Cell text read_excel treats as missing (pandas' default na_values); applied to streamed rows too
+NA_STRINGS = frozenset(['', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND',
+                        '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null'])
+
+
+def _parse_sheet(task: Tuple[str, str, str, Optional[Tuple[str, int]]]) -> List[ProductData]:
+    """Worker: parse one sheet of a workbook with the calling parser's template settings."""
+    file_path, sheet_name, supplier, registry = task
+    parser = ExcelParser(TemplateRegistry(*registry) if registry else None, use_templates=registry is not None)
+    return list(parser.iter_excel_products(file_path, sheet_name, supplier=supplier))
 
 
 class ExcelParser:
     """Parser for Excel price lists and product catalogs."""
     
-    def __init__(self):
-        """Initialize the Excel parser."""
+    def __init__(self, template_registry: Optional[TemplateRegistry] = None, use_templates: Optional[bool] = None):
+        """
+        Initialize the Excel parser.
+        
+        Args:
+            template_registry: Registry of known supplier templates (default: from config)
+            use_templates: Reuse parse plans of known supplier templates (default: TEMPLATE_REGISTRY_ENABLED)
+        """
         self.logger = logging.getLogger(__name__)
         
+        # Parse plans of known supplier layouts
+        self.use_templates = config.template_registry_enabled if use_templates is None else use_templates
+        self.template_registry = None
+        if self.use_templates:
+            self.template_registry = template_registry or TemplateRegistry(
+                config.template_registry_path, config.template_registry_size
+            )
+        
         # Common column name mappings for product data
         self.column_mappings = {
             'name': ['name', 'product_name', 'product', 'description', 'item', 'title'],
@@ -53,13 +133,18 @@ class ExcelParser:
             r'\b([A-Z]+\d+[A-Z]*[-_]?[A-Z]*)\b',  # DJ/Pro equipment
         ]
     
-    def parse_excel_file(self, file_path: str, sheet_name: Union[str, int] = 0) -> List[ProductData]:
+    def parse_excel_file(self, file_path: str, sheet_name: Optional[Union[str, int]] = 0,
+                         stream: Optional[bool] = None, supplier: str = '') -> List[ProductData]:
         """
         Parse an Excel file and extract product data.
         
         Args:
             file_path: Path to the Excel file
-            sheet_name: Sheet name or index to parse (default: first sheet)
+            sheet_name: Sheet name or index to parse (default: first sheet), or
+                None to parse every product sheet with parse_all_sheets
+            stream: Read the sheet in row chunks with iter_excel_products
+                (default: for workbooks of EXCEL_STREAM_THRESHOLD_MB or more)
+            supplier: Supplier name, part of the template fingerprint
             
         Returns:
             List[ProductData]: List of extracted product data
@@ -72,9 +157,22 @@ class ExcelParser:
                 self.logger.error(f"Excel file not found: {file_path}")
                 return []
             
+            if sheet_name is None:
+                return self.parse_all_sheets(file_path, supplier)
+            
+            if stream is None:
+                stream = self.should_stream(file_path)
+            if stream:
+                return list(self.iter_excel_products(file_path, sheet_name, supplier=supplier))
+            
             # Read Excel file
             try:
-                df = pd.read_excel(file_path, sheet_name=sheet_name, engine='openpyxl')
+                if Path(file_path).suffix.lower() in STREAMABLE_FORMATS:
+                    # Only the mapped columns, with the template's dtypes
+                    df, column_map = self._read_sheet_with_template(file_path, sheet_name, supplier)
+                else:
+                    df = pd.read_excel(file_path, sheet_name=sheet_name, engine='openpyxl')
+                    column_map = None
                 self.logger.info(f"Successfully loaded Excel file with {len(df)} rows and {len(df.columns)} columns")
             except Exception as e:
                 self.logger.error(f"Error reading Excel file: {str(e)}")
@@ -84,7 +182,8 @@ class ExcelParser:
             df = self._clean_dataframe(df)
             
             # Map columns to standard names
-            column_map = self._map_columns(df.columns.tolist())
+            if column_map is None:
+                column_map = self._map_columns(df.columns.tolist())
             self.logger.info(f"Column mapping: {column_map}")
             
             # Extract products
@@ -97,6 +196,407 @@ class ExcelParser:
             self.logger.error(f"Error parsing Excel file {file_path}: {str(e)}")
             return []
     
+    def detect_product_sheets(self, file_path: str, supplier: str = '') -> Dict[str, int]:
+        """
+        Find the sheets of a workbook that hold a product table.
+        
+        Only the first rows of each sheet are read: a sheet holds products when
+        its header row maps a price and a name or model column. Templates of
+        product sheets are registered here, so sheet workers find them.
+        
+        Args:
+            file_path: Path to the Excel file (.xlsx or .xlsm)
+            supplier: Supplier name, part of the template fingerprint
+            
+        Returns:
+            Dict[str, int]: Product sheet names mapped to their row counts, in workbook order
+        """
+        sheets = {}
+        workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            for sheet in workbook.worksheets:
+                rows = list(islice(sheet.iter_rows(values_only=True), HEADER_SCAN_ROWS))
+                template = self._resolve_template(rows, f"excel:{sheet.title}", supplier)
+                if template and self._is_product_table(template.column_map):
+                    sheets[sheet.title] = sheet.max_row or 0
+                else:
+                    self.logger.debug(f"Skipping sheet without a product table: {sheet.title}")
+        finally:
+            workbook.close()
+        return sheets
+    
+    def parse_all_sheets(self, file_path: str, supplier: str = '') -> List[ProductData]:
+        """
+        Parse every product sheet of a workbook and merge the results.
+        
+        Sheets are parsed in worker processes, largest first, each with its own
+        header detection and column mapping. Products are merged in sheet order;
+        a model already found on an earlier sheet is dropped.
+        
+        Args:
+            file_path: Path to the Excel file (.xlsx or .xlsm)
+            supplier: Supplier name, part of the template fingerprint
+            
+        Returns:
+            List[ProductData]: Products from all sheets, deduplicated by model
+        """
+        try:
+            sheets = self.detect_product_sheets(file_path, supplier)
+        except Exception as e:
+            self.logger.error(f"Error reading Excel file: {str(e)}")
+            return []
+        
+        if not sheets:
+            self.logger.warning(f"No product sheets found in Excel file: {file_path}")
+            return []
+        
+        self.logger.info(f"Parsing {len(sheets)} product sheets: {list(sheets)}")
+        sheet_products = self._parse_sheets(file_path, sheets, supplier)
+        
+        products = []
+        seen_models = set()
+        for sheet in sheets:
+            for product in sheet_products.get(sheet, []):
+                key = model_key(product.model)
+                if key in seen_models:
+                    continue
+                seen_models.add(key)
+                products.append(product)
+        
+        self.logger.info(f"Extracted {len(products)} unique products from {len(sheets)} sheets")
+        return products
+    
+    def _parse_sheets(self, file_path: str, sheets: Dict[str, int], supplier: str = '') -> Dict[str, List[ProductData]]:
+        """
+        Parse sheets in worker processes, or in this process when one worker would do.
+        
+        Args:
+            file_path: Path to the Excel file
+            sheets: Sheet names mapped to their row counts
+            supplier: Supplier name, part of the template fingerprint
+            
+        Returns:
+            Dict[str, List[ProductData]]: Products of each sheet
+        """
+        # Largest sheets first, so the last sheet to finish is a small one
+        ordered = sorted(sheets, key=sheets.get, reverse=True)
+        workers = min(config.excel_sheet_workers or os.cpu_count() or 1, len(ordered))
+        
+        if workers > 1:
+            # Workers open their own registry connection on the same database
+            registry = None
+            if self.template_registry:
+                registry = (self.template_registry.db_path, self.template_registry.max_entries)
+            tasks = [(file_path, sheet, supplier, registry) for sheet in ordered]
+            try:
+                with ProcessPoolExecutor(max_workers=workers, mp_context=pool_context(__name__)) as executor:
+                    results = list(executor.map(_parse_sheet, tasks))
+                return dict(zip(ordered, results))
+            except Exception as e:
+                self.logger.error(f"Parallel sheet parsing failed, parsing sheets in this process: {str(e)}")
+        
+        return {sheet: list(self.iter_excel_products(file_path, sheet, supplier=supplier)) for sheet in ordered}
+    
+    def should_stream(self, file_path: str) -> bool:
+        """
+        Check whether a workbook is large enough to be read in row chunks.
+        
+        Args:
+            file_path: Path to the Excel file
+            
+        Returns:
+            bool: True for read-only capable workbooks of EXCEL_STREAM_THRESHOLD_MB or more
+        """
+        if Path(file_path).suffix.lower() not in STREAMABLE_FORMATS or not os.path.exists(file_path):
+            return False
+        return os.path.getsize(file_path) >= config.excel_stream_threshold_mb * 1024 * 1024
+    
+    def iter_excel_products(self, file_path: str, sheet_name: Union[str, int] = 0,
+                            chunk_rows: Optional[int] = None, supplier: str = '') -> Iterator[ProductData]:
+        """
+        Parse an Excel sheet in row chunks, yielding products as each chunk is extracted.
+        
+        The workbook is opened read-only so rows are read from disk as they are
+        consumed; only one chunk, limited to the mapped columns, is held as a
+        dataframe at a time. The sheet's template (header row and column
+        mapping) is resolved once, on the first chunk.
+        
+        Args:
+            file_path: Path to the Excel file (.xlsx or .xlsm)
+            sheet_name: Sheet name or index to parse (default: first sheet)
+            chunk_rows: Rows per chunk (default: EXCEL_STREAM_CHUNK_ROWS)
+            supplier: Supplier name, part of the template fingerprint
+            
+        Yields:
+            ProductData: Extracted product data
+        """
+        chunk_rows = max(1, chunk_rows or config.excel_stream_chunk_rows)
+        self.logger.info(f"Streaming Excel sheet in chunks of {chunk_rows} rows: {file_path}")
+        
+        try:
+            workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+        except Exception as e:
+            self.logger.error(f"Error reading Excel file: {str(e)}")
+            return
+        
+        product_count = 0
+        try:
+            sheet = self._open_sheet(workbook, sheet_name)
+            rows = sheet.iter_rows(values_only=True)
+            
+            first_chunk = self._read_row_chunk(rows, max(chunk_rows, HEADER_SCAN_ROWS))
+            template = self._resolve_template(first_chunk[:HEADER_SCAN_ROWS], f"excel:{sheet.title}", supplier)
+            if template is None:
+                self.logger.warning(f"No header row found in Excel sheet: {file_path}")
+                return
+            
+            chunk = first_chunk[template.header_row + 1:]
+            row_count = 0
+            while chunk:
+                row_count += len(chunk)
+                for product in self._extract_products_from_chunk(chunk, template):
+                    product_count += 1
+                    yield product
+                chunk = self._read_row_chunk(rows, chunk_rows)
+            
+            self.logger.info(f"Streamed {product_count} products from {row_count} Excel rows")
+        except Exception as e:
+            self.logger.error(f"Error streaming Excel file {file_path}: {str(e)}")
+            # Products already yielded would otherwise pass for the whole sheet
+            if product_count:
+                raise
+        finally:
+            workbook.close()
+    
+    def _open_sheet(self, workbook: Any, sheet_name: Union[str, int]) -> Any:
+        """Get a worksheet by index or name."""
+        return workbook.worksheets[sheet_name] if isinstance(sheet_name, int) else workbook[sheet_name]
+    
+    def _read_sheet_with_template(self, file_path: str, sheet_name: Union[str, int],
+                                  supplier: str = '') -> Tuple[pd.DataFrame, Dict[str, str]]:
+        """
+        Read a sheet with the parse plan of its supplier template.
+        
+        The first rows are read to resolve the template, then the sheet is
+        loaded from below the header with only the mapped columns, named and
+        typed by the template.
+        
+        Args:
+            file_path: Path to the Excel file (.xlsx or .xlsm)
+            sheet_name: Sheet name or index to parse
+            supplier: Supplier name, part of the template fingerprint
+            
+        Returns:
+            Tuple[pd.DataFrame, Dict[str, str]]: Sheet data and column mapping
+        """
+        workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            sheet = self._open_sheet(workbook, sheet_name)
+            rows = list(islice(sheet.iter_rows(values_only=True), HEADER_SCAN_ROWS))
+            layout = f"excel:{sheet.title}"
+        finally:
+            workbook.close()
+        
+        template = self._resolve_template(rows, layout, supplier)
+        if template is None or not template.usecols:
+            return pd.DataFrame(), {}
+        
+        df = self._read_with_template(
+            lambda dtypes: pd.read_excel(
+                file_path, sheet_name=sheet_name, engine='openpyxl', header=None,
+                skiprows=template.header_row + 1, usecols=template.usecols,
+                names=template.usecol_names, dtype=dtypes
+            ),
+            template
+        )
+        return df, template.column_map
+    
+    def _read_with_template(self, read: Callable[[Dict[str, str]], pd.DataFrame],
+                            template: SupplierTemplate) -> pd.DataFrame:
+        """
+        Read with a template's dtypes, retyping its numeric columns as text if they stopped being numeric.
+        
+        Args:
+            read: Reader taking a dtype mapping
+            template: Supplier template
+            
+        Returns:
+            pd.DataFrame: Data read
+        """
+        try:
+            return read(template.dtypes)
+        except ValueError as e:
+            # Any typed price column (price or old_price) can meet a text cell
+            numeric = [column for column, dtype in template.dtypes.items() if dtype == 'float64']
+            if not numeric:
+                raise
+            self.logger.info(f"Columns {numeric} of template {template.fingerprint[:12]} are no longer all "
+                             f"numeric, reading them as text: {str(e)}")
+        
+        template.dtypes = {column: 'str' for column in template.dtypes}
+        template.price_format = 'text'
+        if self.template_registry:
+            self.template_registry.put(template)
+        return read(template.dtypes)
+    
+    def _resolve_template(self, rows: List[Tuple[Any, ...]], layout: str, supplier: str = '',
+                          typed_prices: bool = True) -> Optional[SupplierTemplate]:
+        """
+        Get the parse plan of a sheet, discovering and registering it the first time its layout is seen.
+        
+        Args:
+            rows: First rows of the sheet
+            layout: Sheet layout (file kind and sheet name or delimiter)
+            supplier: Supplier name, part of the template fingerprint
+            typed_prices: Read numeric price columns as floats (for sources with typed cells)
+            
+        Returns:
+            SupplierTemplate: Template of the sheet, or None when it has no header row
+        """
+        if self.template_registry:
+            template = self.template_registry.find(supplier, layout, rows)
+            if template:
+                self.logger.info(f"Known supplier template {template.fingerprint[:12]}: "
+                                 f"header at row {template.header_row + 1}, column mapping: {template.column_map}")
+                return template
+        
+        header_index = self._detect_header_row(rows)
+        if header_index is None:
+            return None
+        
+        columns = self._header_columns(rows[header_index])
+        column_map = self._map_columns(columns)
+        
+        # Price columns whose sampled cells are all numbers are read as floats
+        numeric = set()
+        if typed_prices:
+            for field in ('price', 'old_price'):
+                column = column_map.get(field)
+                if column is None:
+                    continue
+                position = columns.index(column)
+                values = [row[position] for row in rows[header_index + 1:]
+                          if position < len(row) and row[position] not in (None, '')]
+                if values and all(isinstance(value, (int, float)) and not isinstance(value, bool)
+                                  for value in values):
+                    numeric.add(column)
+        
+        template = SupplierTemplate(
+            fingerprint=TemplateRegistry.fingerprint(supplier, layout, header_index, rows[header_index]),
+            supplier=supplier,
+            layout=layout,
+            header_row=header_index,
+            columns=columns,
+            column_map=column_map,
+            price_format='numeric' if column_map.get('price') in numeric else 'text'
+        )
+        template.dtypes = {column: 'float64' if column in numeric else 'str' for column in template.usecol_names}
+        
+        self.logger.info(f"Header at row {header_index + 1}, column mapping: {column_map}")
+        if self.template_registry and self._is_product_table(column_map):
+            self.template_registry.put(template)
+        return template
+    
+    def _is_product_table(self, column_map: Dict[str, str]) -> bool:
+        """Check whether a column mapping has a price and a name or model column."""
+        return 'price' in column_map and ('name' in column_map or 'model' in column_map)
+    
+    def get_template_registry_stats(self) -> Dict[str, Any]:
+        """Get supplier template registry hit/miss statistics."""
+        return self.template_registry.get_stats() if self.template_registry else {'enabled': False}
+    
+    def _read_row_chunk(self, rows: Iterator[Tuple[Any, ...]], size: int) -> List[Tuple[Any, ...]]:
+        """
+        Read up to size rows from a sheet row iterator.
+        
+        Args:
+            rows: Row value tuples from openpyxl
+            size: Maximum rows to read
+            
+        Returns:
+            List[Tuple[Any, ...]]: Next rows (empty once the sheet is exhausted)
+        """
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= size:
+                break
+        return chunk
+    
+    def _detect_header_row(self, rows: List[Tuple[Any, ...]]) -> Optional[int]:
+        """
+        Find the header row among the first rows of a sheet.
+        
+        Supplier sheets often start with a title or address block, so the
+        header is the earliest row whose text cells map the most product fields.
+        
+        Args:
+            rows: First rows of the sheet
+            
+        Returns:
+            int: Index of the header row (the first non-empty row if none maps
+            a field), or None for an empty sheet
+        """
+        best_index, best_score = None, 0
+        for index, row in enumerate(rows[:HEADER_SCAN_ROWS]):
+            labels = [str(value).strip().lower().replace(' ', '_')
+                      for value in row if isinstance(value, str) and value.strip()]
+            score = len(self._map_columns(labels)) if labels else 0
+            if score > best_score:
+                best_index, best_score = index, score
+        
+        if best_index is None:
+            best_index = next((index for index, row in enumerate(rows)
+                               if any(value is not None and str(value).strip() for value in row)), None)
+        return best_index
+    
+    def _header_columns(self, header: Tuple[Any, ...]) -> List[str]:
+        """
+        Build cleaned, unique column names from a header row, as read_excel and _clean_dataframe would.
+        
+        Args:
+            header: Header row values
+            
+        Returns:
+            List[str]: Column names up to the last non-empty header cell
+        """
+        width = max((index + 1 for index, value in enumerate(header)
+                     if value is not None and str(value).strip()), default=0)
+        
+        columns = []
+        seen: Dict[str, int] = {}
+        for index, value in enumerate(header[:width]):
+            name = str(value).strip() if value is not None and str(value).strip() else f"Unnamed: {index}"
+            name = name.lower().replace(' ', '_')
+            if name in seen:
+                seen[name] += 1
+                name = f"{name}.{seen[name]}"
+            else:
+                seen[name] = 0
+            columns.append(name)
+        return columns
+    
+    def _extract_products_from_chunk(self, rows: List[Tuple[Any, ...]], template: SupplierTemplate) -> List[ProductData]:
+        """
+        Extract products from one chunk of sheet rows.
+        
+        Args:
+            rows: Row value tuples below the header
+            template: Template of the sheet
+            
+        Returns:
+            List[ProductData]: Products in the chunk
+        """
+        positions = template.usecols
+        df = pd.DataFrame([tuple(row[index] if index < len(row) else None for index in positions) for row in rows],
+                          columns=template.usecol_names)
+        # openpyxl returns these as text, read_excel as missing values that drop empty rows
+        df = df.mask(df.isin(NA_STRINGS))
+        
+        # Renaming in _clean_dataframe leaves these names unchanged, so column_map still applies
+        df = self._clean_dataframe(df)
+        return self._extract_products_from_dataframe(df, template.column_map)
+    
     def parse_prices(self, file_path: str) -> List[Dict[str, Any]]:
         """
         Parse Excel file and return product data as dictionaries.
@@ -183,6 +683,93 @@ class ExcelParser:
         """
         Extract product data from the cleaned dataframe.
         
+        Whole columns are cleaned, parsed and filtered with pandas string
+        operations and boolean masks; only the surviving rows are turned into
+        ProductData. Falls back to row-by-row extraction if that fails.
+        
+        Args:
+            df: Cleaned dataframe
+            column_map: Column mapping dictionary
+            
+        Returns:
+            List[ProductData]: List of extracted products
+        """
+        try:
+            return self._extract_products_vectorized(df, column_map)
+        except Exception as e:
+            self.logger.warning(f"Columnar extraction failed, extracting row by row: {str(e)}")
+            return self._extract_products_from_rows(df, column_map)
+    
+    def _extract_products_vectorized(self, df: pd.DataFrame, column_map: Dict[str, str]) -> List[ProductData]:
+        """
+        Extract product data column by column.
+        
+        Args:
+            df: Cleaned dataframe
+            column_map: Column mapping dictionary
+            
+        Returns:
+            List[ProductData]: Products, in row order
+        """
+        if df.empty:
+            return []
+        
+        df = df.reset_index(drop=True)
+        name = self._column_text(df, column_map.get('name', ''))
+        model = self._column_text(df, column_map.get('model', ''))
+        
+        # Extract models from names where no model is provided
+        missing_model = (model == '') & (name != '')
+        if missing_model.any():
+            model = model.mask(missing_model, self._extract_models_from_series(name[missing_model]))
+            model = model.fillna('')
+        
+        # Parse price, falling back to old price where the current price is invalid
+        price = self._parse_price_series(self._column_text(df, column_map.get('price', '')))
+        old_price = self._parse_price_series(self._column_text(df, column_map.get('old_price', '')))
+        price = price.where(price > 0, old_price)
+        
+        keep = (model != '') & (price > 0) & (price != float('inf'))
+        self.logger.debug(f"Columnar extraction kept {int(keep.sum())} of {len(df)} rows")
+        if not keep.any():
+            return []
+        
+        name, model, price = name[keep], model[keep], price[keep]
+        manufacturer = self._column_text(df, column_map.get('manufacturer', ''))[keep]
+        category = self._column_text(df, column_map.get('category', ''))[keep]
+        description = self._column_text(df, column_map.get('description', ''))[keep]
+        
+        # Determine manufacturer where not provided
+        missing_manufacturer = manufacturer == ''
+        if missing_manufacturer.any():
+            detected = self._detect_manufacturers(
+                (name[missing_manufacturer] + ' ' + model[missing_manufacturer]).str.lower()
+            )
+            manufacturer = manufacturer.mask(missing_manufacturer, detected)
+        
+        clean_name = self._normalize_product_names(name, model, manufacturer)
+        
+        products = []
+        for row_name, row_model, row_price, row_description, row_category, row_manufacturer in zip(
+                clean_name.tolist(), model.tolist(), price.tolist(), description.tolist(),
+                category.tolist(), manufacturer.tolist()):
+            products.append(ProductData(
+                name=row_name,
+                model=row_model,
+                price=self._format_price(row_price),
+                description=row_description or None,
+                category=row_category or None,
+                manufacturer=row_manufacturer or config.default_manufacturer,
+                confidence=0.8,  # Excel parsing confidence
+                online_store_name=self._make_online_store_name(row_name, row_model, row_manufacturer)
+            ))
+        
+        return products
+    
+    def _extract_products_from_rows(self, df: pd.DataFrame, column_map: Dict[str, str]) -> List[ProductData]:
+        """
+        Extract product data from the cleaned dataframe one row at a time.
+        
         Args:
             df: Cleaned dataframe
             column_map: Column mapping dictionary
@@ -277,6 +864,54 @@ class ExcelParser:
         
         return str(value).strip()
     
+    def _column_text(self, df: pd.DataFrame, column_name: str) -> pd.Series:
+        """
+        Get a column as stripped strings, like _get_cell_value for every row.
+        
+        Args:
+            df: Dataframe
+            column_name: Name of the column to extract
+            
+        Returns:
+            pd.Series: Cell values as strings ('' for missing columns and empty cells)
+        """
+        if not column_name or column_name not in df.columns:
+            return pd.Series('', index=df.index, dtype=object)
+        
+        values = df[column_name]
+        if isinstance(values, pd.DataFrame):
+            # Duplicate column names after cleaning; use the first
+            values = values.iloc[:, 0]
+        
+        return values.astype(object).where(values.notna(), '').astype(str).str.strip()
+    
+    def _extract_models_from_series(self, text: pd.Series) -> pd.Series:
+        """
+        Extract model numbers from a column of text, like _extract_model_from_text.
+        
+        Patterns are tried in priority order, each only on rows no earlier
+        pattern resolved, so the same pattern wins as in the row-wise search.
+        
+        Args:
+            text: Text to extract models from
+            
+        Returns:
+            pd.Series: Extracted models ('' where none was found)
+        """
+        upper = text.str.upper()
+        models = pd.Series('', index=text.index, dtype=object)
+        unresolved = pd.Series(True, index=text.index)
+        
+        for pattern in self.audio_model_patterns:
+            if not unresolved.any():
+                break
+            found = upper[unresolved].str.extract(pattern, expand=False).fillna('')
+            found = found[found.str.len() >= 3]  # Minimum model length
+            models[found.index] = found
+            unresolved[found.index] = False
+        
+        return models
+    
     def _extract_model_from_text(self, text: str) -> Optional[str]:
         """
         Extract model number from text using audio equipment patterns.
@@ -349,6 +984,33 @@ class ExcelParser:
             self.logger.warning(f"Could not parse price: {price_value}")
             return None
     
+    def _parse_price_series(self, values: pd.Series) -> pd.Series:
+        """
+        Parse a column of price strings, like _parse_price_value for every row.
+        
+        Args:
+            values: Price cells as strings
+            
+        Returns:
+            pd.Series: Parsed prices (NaN where unparsable)
+        """
+        # Keep only digits and separators
+        cleaned = values.str.replace(r'[^\d.,]', '', regex=True)
+        
+        # A single comma followed by at most two digits is a decimal separator, otherwise thousands
+        decimal_comma = (
+            ~cleaned.str.contains('.', regex=False)
+            & cleaned.str.fullmatch(r'[^,]*,[^,]{0,2}')
+        )
+        cleaned = cleaned.mask(decimal_comma, cleaned.str.replace(',', '.', regex=False))
+        cleaned = cleaned.str.replace(',', '', regex=False)
+        
+        valid = cleaned.str.fullmatch(PRICE_NUMBER_PATTERN).fillna(False).astype(bool)
+        prices = pd.Series(float('nan'), index=values.index)
+        if valid.any():
+            prices[valid] = cleaned[valid].astype(object).astype(float)
+        return prices
+    
     def _detect_manufacturer(self, name: str, model: str) -> str:
         """
         Detect manufacturer from product name or model.
@@ -362,32 +1024,34 @@ class ExcelParser:
         """
         text = f"{name} {model}".lower()
         
-        # Common audio equipment manufacturers
-        manufacturers = {
-            'denon': 'Denon',
-            'akg': 'AKG',
-            'shure': 'Shure',
-            'sennheiser': 'Sennheiser',
-            'audio-technica': 'Audio-Technica',
-            'yamaha': 'Yamaha',
-            'pioneer': 'Pioneer',
-            'sony': 'Sony',
-            'jbl': 'JBL',
-            'qsc': 'QSC',
-            'behringer': 'Behringer',
-            'mackie': 'Mackie',
-            'polk': 'Polk Audio',
-            'marantz': 'Marantz',
-            'onkyo': 'Onkyo',
-            'harman': 'Harman Kardon'
-        }
-        
-        for key, manufacturer in manufacturers.items():
+        for key, manufacturer in AUDIO_MANUFACTURERS.items():
             if key in text:
                 return manufacturer
         
         return config.default_manufacturer
     
+    def _detect_manufacturers(self, text: pd.Series) -> pd.Series:
+        """
+        Detect manufacturers for a column of lower-cased "name model" text.
+        
+        Args:
+            text: Lower-cased name and model of each row
+            
+        Returns:
+            pd.Series: Detected manufacturer of each row
+        """
+        manufacturers = pd.Series(config.default_manufacturer, index=text.index, dtype=object)
+        unresolved = pd.Series(True, index=text.index)
+        
+        for key, manufacturer in AUDIO_MANUFACTURERS.items():
+            if not unresolved.any():
+                break
+            matched = unresolved & text.str.contains(key, regex=False)
+            manufacturers[matched] = manufacturer
+            unresolved &= ~matched
+        
+        return manufacturers
+    
     def _normalize_product_name(self, name: str, model: str, manufacturer: str) -> str:
         """
         Normalize product name for consistency.
@@ -403,29 +1067,9 @@ class ExcelParser:
         if not name:
             return ""
         
-        normalized = name.strip()
-        
-        # Remove manufacturer or model if they already appear at the start
-        if manufacturer and normalized.lower().startswith(manufacturer.lower()):
-            normalized = normalized[len(manufacturer):].strip()
-        
-        if model and normalized.lower().startswith(model.lower()):
-            normalized = normalized[len(model):].strip()
-        
-        # Audio equipment specific normalizations
-        normalizations = {
-            r'\bCh\b': 'Channel',
-            r'\bCh\.': 'Channel',
-            r'\bAmp\b': 'Amplifier',
-            r'\bRec\b': 'Receiver',
-            r'\bBT\b': 'Bluetooth',
-            r'\bWiFi\b': 'Wi-Fi',
-            r'\bHDMI\b': 'HDMI',
-            r'\b4K\b': '4K',
-            r'\b8K\b': '8K'
-        }
+        normalized = self._strip_name_prefixes(name, model, manufacturer)
         
-        for pattern, replacement in normalizations.items():
+        for pattern, replacement in NAME_NORMALIZATIONS.items():
             normalized = re.sub(pattern, replacement, normalized, flags=re.IGNORECASE)
         
         # Clean up whitespace
@@ -433,6 +1077,51 @@ class ExcelParser:
         
         return normalized
     
+    def _normalize_product_names(self, names: pd.Series, models: pd.Series, manufacturers: pd.Series) -> pd.Series:
+        """
+        Normalize a column of product names, like _normalize_product_name for every row.
+        
+        Args:
+            names: Original product names
+            models: Product models
+            manufacturers: Product manufacturers
+            
+        Returns:
+            pd.Series: Normalized product names
+        """
+        normalized = pd.Series(
+            [self._strip_name_prefixes(name, model, manufacturer) if name else ""
+             for name, model, manufacturer in zip(names.tolist(), models.tolist(), manufacturers.tolist())],
+            index=names.index, dtype=object
+        )
+        
+        for pattern, replacement in NAME_NORMALIZATIONS.items():
+            normalized = normalized.str.replace(pattern, replacement, regex=True, flags=re.IGNORECASE)
+        
+        return normalized.str.replace(r'\s+', ' ', regex=True).str.strip()
+    
+    def _strip_name_prefixes(self, name: str, model: str, manufacturer: str) -> str:
+        """
+        Remove manufacturer or model if they already appear at the start of a name.
+        
+        Args:
+            name: Product name
+            model: Product model
+            manufacturer: Product manufacturer
+            
+        Returns:
+            str: Name without the leading manufacturer and model
+        """
+        stripped = name.strip()
+        
+        if manufacturer and stripped.lower().startswith(manufacturer.lower()):
+            stripped = stripped[len(manufacturer):].strip()
+        
+        if model and stripped.lower().startswith(model.lower()):
+            stripped = stripped[len(model):].strip()
+        
+        return stripped
+    
     def _format_price(self, price: float) -> str:
         """
         Format price as Rand currency string.
@@ -0,0 +1,151 @@
+"""
+Extraction confidence scoring for Audico Product Manager.
+
+The document parser runs cheap local extractors first and only escalates a
+page to Document AI or GPT-4 when their output looks unreliable. This module
+scores one page's extraction by coverage (how many of the page's product-like
+lines produced a product) and consistency (whether the extracted products
+have a model that appears on the page, a parsable price and a name).
+"""
+
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set
+
+# Model-like token candidates: upper-case letters, digits and separators. The
+# digit/letter requirement is checked per token afterwards (model_tokens), as
+# lookaheads here would rescan the rest of every run from each start position.
+MODEL_TOKEN_PATTERN = re.compile(r'\b[A-Z0-9][A-Z0-9\-/.]{2,}[A-Z0-9]\b')
+DIGIT_PATTERN = re.compile(r'\d')
+LETTER_PATTERN = re.compile(r'[A-Z]')
+
+# Prices with a currency or thousands separators, or a bare amount ending the line
+PRICE_TOKEN_PATTERN = re.compile(
+    r'(?:R|\$|£|€)\s?\d[\d,\s]*(?:\.\d{2})?'
+    r'|\b\d{1,3}(?:[,\s]\d{3})+(?:\.\d{2})?\b'
+    r'|\b\d+\.\d{2}\b'
+    r'|\b\d{3,}\s*$'
+)
+
+MODEL_KEY_PATTERN = re.compile(r'[^a-z0-9]')
+
+# Separators between the words of a page when collecting model keys
+PAGE_WORD_SEPARATORS = re.compile(r'[\s|,;/()\[\]]+')
+
+# Models spanning up to this many page words still match (e.g. 'PM 6007')
+MAX_MODEL_WORDS = 3
+
+
+def model_key(model: Any) -> str:
+    """Canonical form of a model for comparisons (lower case, alphanumerics only)."""
+    return MODEL_KEY_PATTERN.sub('', str(model or '').lower())
+
+
+def model_tokens(text: str) -> Iterator[str]:
+    """
+    Yield the model-like tokens of a text (upper-case, at least one letter and one digit).
+
+    Args:
+        text: Text to scan
+
+    Yields:
+        str: Model-like tokens, in order
+    """
+    for match in MODEL_TOKEN_PATTERN.finditer(text):
+        token = match.group(0)
+        if DIGIT_PATTERN.search(token) and LETTER_PATTERN.search(token):
+            yield token
+
+
+def find_model_token(text: str) -> Optional[str]:
+    """Get the first model-like token of a text, or None."""
+    return next(model_tokens(text), None)
+
+
+def page_model_keys(page_text: str) -> Set[str]:
+    """
+    Collect the model keys a page could hold.
+
+    Every word of the page and every run of up to MAX_MODEL_WORDS adjacent
+    words is keyed, so membership tests are O(1) per product.
+
+    Args:
+        page_text: Text of one page
+
+    Returns:
+        Set[str]: model_key of each word and word run
+    """
+    words = [key for key in (model_key(word) for word in PAGE_WORD_SEPARATORS.split(page_text)) if key]
+    keys = set()
+    for start in range(len(words)):
+        key = ''
+        for word in words[start:start + MAX_MODEL_WORDS]:
+            key += word
+            keys.add(key)
+    return keys
+
+
+def candidate_lines(page_text: str) -> List[str]:
+    """
+    Find the lines of a page that look like product rows.
+
+    Args:
+        page_text: Text of one page
+
+    Returns:
+        List[str]: Lines holding both a model-like token and a price
+    """
+    return [line for line in page_text.splitlines()
+            if find_model_token(line) and PRICE_TOKEN_PATTERN.search(line)]
+
+
+def _price_value(price: Any) -> float:
+    """Parse a formatted price, returning 0.0 when it is not a positive amount."""
+    digits = re.sub(r'[^\d.]', '', str(price or '').replace(',', ''))
+    try:
+        return float(digits)
+    except ValueError:
+        return 0.0
+
+
+def score_extraction(page_text: str, products: Iterable[Any]) -> Dict[str, Any]:
+    """
+    Score the products a local extractor found on one page.
+
+    Args:
+        page_text: Text of the page
+        products: Extracted products (objects with name, model and price)
+
+    Returns:
+        Dict[str, Any]: candidates, products, coverage, consistency and the
+        combined confidence in [0, 1]
+    """
+    products = list(products)
+    candidates = candidate_lines(page_text)
+    page_keys = page_model_keys(page_text)
+
+    unique_models = set()
+    consistent = 0
+    for product in products:
+        key = model_key(getattr(product, 'model', None))
+        if not key:
+            continue
+        unique_models.add(key)
+        if (key in page_keys and _price_value(getattr(product, 'price', None)) > 0
+                and len(getattr(product, 'name', None) or '') >= 3):
+            consistent += 1
+
+    if not candidates:
+        # No priced rows: trust an empty result only when the page has no product codes either
+        has_model_tokens = sum(1 for _ in zip(range(2), model_tokens(page_text))) >= 2
+        coverage = 1.0 if not products and not has_model_tokens else 0.5
+    else:
+        coverage = min(1.0, len(unique_models) / len(candidates))
+    consistency = consistent / len(products) if products else 1.0
+
+    return {
+        'candidates': len(candidates),
+        'products': len(products),
+        'coverage': round(coverage, 3),
+        'consistency': round(consistency, 3),
+        'confidence': round(coverage * consistency, 3)
+    }
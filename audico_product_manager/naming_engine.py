@@ -0,0 +1,369 @@
+"""
+Asynchronous naming engine for Audico Product Manager.
+
+This module sends many store-naming prompts to a chat model concurrently,
+bounded by a concurrency limit and by token buckets for the provider's
+requests-per-minute and tokens-per-minute quotas. Rate-limit responses pause
+the whole engine for the Retry-After period. Providers are pluggable, so the
+engine runs against OpenAI in production and a local fake model in tests and
+benchmarks. Synchronous code drives it through run().
+"""
+
+import asyncio
+import logging
+import random
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+try:
+    import openai
+    OPENAI_AVAILABLE = True
+except ImportError:
+    OPENAI_AVAILABLE = False
+
+# Use absolute import that works when running directly
+try:
+    from audico_product_manager.config import config
+except ImportError:
+    try:
+        from .config import config
+    except ImportError:
+        from config import config
+
+
+Messages = List[Dict[str, str]]
+
+
+class NamingJob(NamedTuple):
+    """One chat completion request."""
+    messages: Messages
+    max_tokens: int
+    temperature: float = 0.3
+
+
+class NamingCompletion(NamedTuple):
+    """Text and token usage of one chat completion."""
+    text: str
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+
+
+class RateLimitedError(Exception):
+    """Raised by providers when the model API rejects a request with 429."""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def estimate_tokens(messages: Messages) -> int:
+    """Estimate prompt tokens at roughly 4 characters per token."""
+    return sum(len(message.get('content', '')) for message in messages) // 4 + 1
+
+
+class NamingProvider:
+    """Interface for chat models used by NamingEngine."""
+
+    async def open(self) -> None:
+        """Acquire per-event-loop resources before a run."""
+
+    async def close(self) -> None:
+        """Release resources acquired in open()."""
+
+    async def complete(self, job: NamingJob) -> NamingCompletion:
+        """
+        Run one chat completion.
+
+        Args:
+            job: Messages and sampling parameters
+
+        Returns:
+            NamingCompletion: Generated text and token usage
+
+        Raises:
+            RateLimitedError: When the API asks the caller to slow down
+        """
+        raise NotImplementedError
+
+
+class OpenAINamingProvider(NamingProvider):
+    """NamingProvider backed by the OpenAI chat completions API."""
+
+    def __init__(self, api_key: Optional[str] = None, model: str = "gpt-4"):
+        """
+        Initialize the provider.
+
+        Args:
+            api_key: OpenAI API key (defaults to the configured key)
+            model: Chat model name
+        """
+        if not OPENAI_AVAILABLE:
+            raise ImportError("openai is required for OpenAINamingProvider")
+        self.api_key = api_key or config.openai_api_key
+        self.model = model
+        # Client and open count per event loop, so concurrent runs on different loops keep their own client
+        self._clients: Dict[asyncio.AbstractEventLoop, List[Any]] = {}
+
+    async def open(self) -> None:
+        loop = asyncio.get_running_loop()
+        entry = self._clients.get(loop)
+        if entry is None:
+            # Retries are handled by the engine so Retry-After pauses every worker
+            entry = self._clients[loop] = [openai.AsyncOpenAI(api_key=self.api_key, max_retries=0), 0]
+        entry[1] += 1
+
+    async def close(self) -> None:
+        loop = asyncio.get_running_loop()
+        entry = self._clients.get(loop)
+        if entry is not None:
+            entry[1] -= 1
+            if entry[1] <= 0:
+                del self._clients[loop]
+                await entry[0].close()
+
+    @staticmethod
+    def _retry_after(error: Exception) -> Optional[float]:
+        """Read Retry-After (seconds) or retry-after-ms from a rate limit response."""
+        headers = getattr(getattr(error, 'response', None), 'headers', None) or {}
+        try:
+            if headers.get('retry-after-ms'):
+                return float(headers['retry-after-ms']) / 1000.0
+            if headers.get('retry-after'):
+                return float(headers['retry-after'])
+        except ValueError:
+            pass
+        return None
+
+    async def complete(self, job: NamingJob) -> NamingCompletion:
+        try:
+            client = self._clients[asyncio.get_running_loop()][0]
+            response = await client.chat.completions.create(
+                model=self.model,
+                messages=job.messages,
+                max_tokens=job.max_tokens,
+                temperature=job.temperature
+            )
+        except openai.RateLimitError as e:
+            raise RateLimitedError(str(e), self._retry_after(e)) from e
+
+        usage = getattr(response, 'usage', None)
+        return NamingCompletion(
+            text=response.choices[0].message.content or '',
+            prompt_tokens=getattr(usage, 'prompt_tokens', 0) or 0,
+            completion_tokens=getattr(usage, 'completion_tokens', 0) or 0
+        )
+
+
+class FakeNamingProvider(NamingProvider):
+    """Local fake model with configurable latency and rate limiting, for tests and benchmarks."""
+
+    def __init__(self, latency: float = 0.05, respond: Optional[Callable[[NamingJob], str]] = None,
+                 rate_limit_every: int = 0, retry_after: Optional[float] = 0.1):
+        """
+        Initialize the fake provider.
+
+        Args:
+            latency: Seconds each completion takes
+            respond: Builds the response text for a job (defaults to a name derived from the prompt)
+            rate_limit_every: Reject every Nth call with RateLimitedError (0 = never)
+            retry_after: Retry-After seconds reported on rejected calls
+        """
+        self.latency = latency
+        self.respond = respond or self._default_response
+        self.rate_limit_every = rate_limit_every
+        self.retry_after = retry_after
+        self.calls = 0
+
+    @staticmethod
+    def _default_response(job: NamingJob) -> str:
+        last_line = job.messages[-1]['content'].strip().splitlines()[-1]
+        return f"Fake Store Name - {last_line[:60]}"
+
+    async def complete(self, job: NamingJob) -> NamingCompletion:
+        self.calls += 1
+        call = self.calls
+        await asyncio.sleep(self.latency)
+        if self.rate_limit_every and call % self.rate_limit_every == 0:
+            raise RateLimitedError("fake rate limit", self.retry_after)
+        text = self.respond(job)
+        return NamingCompletion(text=text, prompt_tokens=estimate_tokens(job.messages),
+                                completion_tokens=len(text) // 4 + 1)
+
+
+class TokenBucket:
+    """Asyncio token bucket refilled continuously at a per-minute rate."""
+
+    def __init__(self, per_minute: float):
+        """
+        Initialize the bucket full.
+
+        Args:
+            per_minute: Tokens added per minute (also the bucket capacity); <= 0 disables limiting
+        """
+        self.per_minute = per_minute
+        self.capacity = per_minute
+        self.tokens = per_minute
+        self.updated_at = time.monotonic()
+
+    async def acquire(self, amount: float = 1) -> None:
+        """
+        Wait until the bucket holds amount tokens, then take them.
+
+        Args:
+            amount: Tokens needed (capped at the bucket capacity)
+        """
+        if self.per_minute <= 0:
+            return
+        amount = min(amount, self.capacity)
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.per_minute / 60.0)
+            self.updated_at = now
+            if self.tokens >= amount:
+                self.tokens -= amount
+                return
+            await asyncio.sleep((amount - self.tokens) * 60.0 / self.per_minute)
+
+
+class _NamingRun:
+    """Concurrency limit, rate-limit buckets and pause deadline of one name_all call."""
+
+    __slots__ = ('semaphore', 'request_bucket', 'token_bucket', 'resume_at')
+
+    def __init__(self, max_concurrency: int, requests_per_minute: float, tokens_per_minute: float):
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.request_bucket = TokenBucket(requests_per_minute)
+        self.token_bucket = TokenBucket(tokens_per_minute)
+        self.resume_at = 0.0
+
+
+class NamingEngine:
+    """Runs naming jobs concurrently within request and token rate limits."""
+
+    # Backoff for rate-limit responses that carry no Retry-After
+    RETRY_BASE_DELAY = 1.0
+
+    def __init__(self, provider: NamingProvider, max_concurrency: Optional[int] = None,
+                 requests_per_minute: Optional[float] = None, tokens_per_minute: Optional[float] = None,
+                 max_retries: Optional[int] = None):
+        """
+        Initialize the naming engine.
+
+        Args:
+            provider: Chat model provider
+            max_concurrency: Maximum completions in flight at once
+            requests_per_minute: Request quota (0 disables the limit)
+            tokens_per_minute: Prompt + completion token quota (0 disables the limit)
+            max_retries: Retries per job after rate-limit responses
+        """
+        self.provider = provider
+        self.max_concurrency = max_concurrency or config.naming_max_concurrency
+        self.requests_per_minute = requests_per_minute if requests_per_minute is not None else config.naming_requests_per_minute
+        self.tokens_per_minute = tokens_per_minute if tokens_per_minute is not None else config.naming_tokens_per_minute
+        self.max_retries = max_retries if max_retries is not None else config.max_retries
+        self.logger = logging.getLogger(__name__)
+
+        self.stats = {
+            'jobs': 0,
+            'completed': 0,
+            'failed': 0,
+            'rate_limited': 0,
+            'prompt_tokens': 0,
+            'completion_tokens': 0
+        }
+
+    async def name_all(self, jobs: List[NamingJob]) -> List[Optional[NamingCompletion]]:
+        """
+        Run all jobs concurrently.
+
+        Args:
+            jobs: Naming jobs
+
+        Returns:
+            List[Optional[NamingCompletion]]: Completions in input order (None for failed jobs)
+        """
+        if not jobs:
+            return []
+
+        # Per-run state stays local: the engine is shared by concurrent runs on different loops
+        naming_run = _NamingRun(self.max_concurrency, self.requests_per_minute, self.tokens_per_minute)
+
+        start_time = time.monotonic()
+        await self.provider.open()
+        try:
+            results = await asyncio.gather(*(self._run_job(naming_run, job) for job in jobs))
+        finally:
+            await self.provider.close()
+
+        self.logger.info(f"Naming engine completed {sum(r is not None for r in results)}/{len(jobs)} jobs "
+                         f"in {time.monotonic() - start_time:.2f}s")
+        return results
+
+    def run(self, jobs: List[NamingJob]) -> List[Optional[NamingCompletion]]:
+        """
+        Run all jobs from synchronous code.
+
+        Args:
+            jobs: Naming jobs
+
+        Returns:
+            List[Optional[NamingCompletion]]: Completions in input order (None for failed jobs)
+        """
+        return asyncio.run(self.name_all(jobs))
+
+    @staticmethod
+    async def _wait_for_resume(naming_run: _NamingRun) -> None:
+        """Sleep while the run is paused after a rate-limit response."""
+        delay = naming_run.resume_at - time.monotonic()
+        while delay > 0:
+            await asyncio.sleep(delay)
+            delay = naming_run.resume_at - time.monotonic()
+
+    async def _run_job(self, naming_run: _NamingRun, job: NamingJob) -> Optional[NamingCompletion]:
+        """Run one job, retrying rate-limit responses after the advertised delay."""
+        self.stats['jobs'] += 1
+        async with naming_run.semaphore:
+            for attempt in range(self.max_retries + 1):
+                await self._wait_for_resume(naming_run)
+                await naming_run.request_bucket.acquire(1)
+                await naming_run.token_bucket.acquire(estimate_tokens(job.messages) + job.max_tokens)
+
+                try:
+                    completion = await self.provider.complete(job)
+                except RateLimitedError as e:
+                    self.stats['rate_limited'] += 1
+                    if attempt >= self.max_retries:
+                        break
+                    delay = e.retry_after
+                    if delay is None:
+                        delay = self.RETRY_BASE_DELAY * (2 ** attempt) * (0.5 + random.random() / 2)
+                    delay = min(delay, config.retry_max_delay)
+                    self.logger.warning(f"Naming rate limited, pausing for {delay:.2f}s")
+                    naming_run.resume_at = max(naming_run.resume_at, time.monotonic() + delay)
+                    continue
+                except Exception as e:
+                    self.logger.error(f"Naming request failed: {str(e)}")
+                    break
+
+                self.stats['completed'] += 1
+                self.stats['prompt_tokens'] += completion.prompt_tokens
+                self.stats['completion_tokens'] += completion.completion_tokens
+                return completion
+
+        self.stats['failed'] += 1
+        return None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get engine statistics.
+
+        Returns:
+            Dict[str, Any]: Job, rate-limit and token counters
+        """
+        stats = dict(self.stats)
+        stats.update({
+            'max_concurrency': self.max_concurrency,
+            'requests_per_minute': self.requests_per_minute,
+            'tokens_per_minute': self.tokens_per_minute
+        })
+        return stats
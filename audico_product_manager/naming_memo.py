@@ -0,0 +1,102 @@
+"""
+Per-run naming memo for Audico Product Manager.
+
+One processing run names products in several stages (document parsing,
+store-name generation, enhanced comparison). The memo is shared by all of
+them so each product is sent to the LLM at most once per run, and it counts
+the calls that were avoided.
+"""
+
+import re
+import threading
+from typing import Any, Dict, Optional
+
+
+KEY_PATTERN = re.compile(r'[^a-z0-9]+')
+
+
+class NamingMemo:
+    """In-memory map of product to store name for a single processing run."""
+
+    def __init__(self):
+        """Initialize an empty memo."""
+        self._names: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+        self.names_generated = 0
+        self.memo_hits = 0
+        self.deferred_calls = 0
+
+    @staticmethod
+    def product_key(name: Optional[str], model: Optional[str]) -> str:
+        """
+        Build the memo key for a product.
+
+        Args:
+            name: Product name
+            model: Product model
+
+        Returns:
+            str: Canonical model and name
+        """
+        return f"{KEY_PATTERN.sub('', (model or '').lower())}|{KEY_PATTERN.sub(' ', (name or '').lower()).strip()}"
+
+    def __contains__(self, key: str) -> bool:
+        """Check whether a product was already named, without counting a hit."""
+        with self._lock:
+            return key in self._names
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Get the store name already generated for a product in this run.
+
+        Args:
+            key: Key from product_key
+
+        Returns:
+            str: Store name or None if the product has not been named yet
+        """
+        with self._lock:
+            name = self._names.get(key)
+            if name is not None:
+                self.memo_hits += 1
+            return name
+
+    def put(self, key: str, store_name: str) -> None:
+        """
+        Record the store name generated for a product.
+
+        Args:
+            key: Key from product_key
+            store_name: Generated store name
+        """
+        with self._lock:
+            if key not in self._names:
+                self.names_generated += 1
+            self._names[key] = store_name
+
+    def record_deferred(self, count: int = 1) -> None:
+        """
+        Record naming calls an earlier stage skipped because a later stage names the product.
+
+        Args:
+            count: Number of skipped calls
+        """
+        with self._lock:
+            self.deferred_calls += count
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get memo statistics.
+
+        Returns:
+            Dict[str, Any]: Names generated and LLM calls avoided in this run
+        """
+        with self._lock:
+            return {
+                'products_named': len(self._names),
+                'names_generated': self.names_generated,
+                'memo_hits': self.memo_hits,
+                'deferred_calls': self.deferred_calls,
+                'llm_calls_avoided': self.memo_hits + self.deferred_calls
+            }
@@ -9,7 +9,7 @@ including authentication, product management, and category operations.
 import requests
 import json
 import logging
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Iterator
 from urllib.parse import urljoin, urlencode
 import base64
 from dotenv import load_dotenv
@@ -17,15 +17,25 @@ from dotenv import load_dotenv
 # Use absolute import that works when running directly
 try:
     from audico_product_manager.config import config
+    from audico_product_manager.transport_policy import TransportPolicy, CircuitOpenError
+    from audico_product_manager.search_cache import SearchCache
 except ImportError:
     try:
         from .config import config
+        from .transport_policy import TransportPolicy, CircuitOpenError
+        from .search_cache import SearchCache
     except ImportError:
         from config import config
+        from transport_policy import TransportPolicy, CircuitOpenError
+        from search_cache import SearchCache
 
 # Load environment variables
 load_dotenv()
 
+
+class CatalogExportError(Exception):
+    """Raised when a catalog export fails part-way, so no partial catalog is returned."""
+
 class OpenCartProduct:
     """Represents a product in OpenCart with all necessary attributes."""
     
@@ -154,17 +164,28 @@ class OpenCartProduct:
 class OpenCartAPIClient:
     """Client for interacting with OpenCart REST API."""
     
-    def __init__(self, base_url: Optional[str] = None, auth_token: Optional[str] = None):
+    # Transport errors worth retrying. Only a connect timeout is retried for
+    # POST, since the request cannot have reached the store.
+    RETRY_EXCEPTIONS = (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+    NON_IDEMPOTENT_RETRY_EXCEPTIONS = (requests.exceptions.ConnectTimeout,)
+    
+    def __init__(self, base_url: Optional[str] = None, auth_token: Optional[str] = None,
+                 transport_policy: Optional[TransportPolicy] = None,
+                 search_cache: Optional[SearchCache] = None):
         """
         Initialize the OpenCart API client.
         
         Args:
             base_url: OpenCart API base URL
             auth_token: Authentication token for API access
+            transport_policy: Retry/circuit breaker policy (shareable with the async client)
+            search_cache: Search result cache (shareable with the async client)
         """
         self.base_url = base_url or config.opencart_base_url
         self.auth_token = auth_token or config.opencart_auth_token
         self.session = requests.Session()
+        self.transport_policy = transport_policy or TransportPolicy()
+        self.search_cache = search_cache or SearchCache()
         
         # Set up logging
         self.logger = logging.getLogger(__name__)
@@ -179,18 +200,35 @@ class OpenCartAPIClient:
         """
         Search for products using the OpenCart API.
         
+        Results are served from the search cache when fresh; concurrent
+        searches for the same term share a single request.
+        
         Args:
             search_term: Product name or model to search for
             
         Returns:
             List[Dict]: List of matching products or None if request failed
         """
+        self.logger.info(f"Searching for products with term: {search_term}")
+        return self.search_cache.get_or_fetch(
+            search_term, lambda: self._get_product_listing({'search': search_term})
+        )
+    
+    def _get_product_listing(self, params: Dict[str, Any]) -> Optional[List[Dict]]:
+        """
+        Fetch products from the ocrestapi product listing endpoint.
+        
+        Args:
+            params: Query parameters (search, limit, page)
+            
+        Returns:
+            List[Dict]: List of products or None if request failed
+        """
         try:
             # Use the specific endpoint format for audicoonline.co.za
-            url = f"https://www.audicoonline.co.za/index.php?route=ocrestapi/product/listing&search={search_term}"
+            url = "https://www.audicoonline.co.za/index.php?route=ocrestapi/product/listing"
             
-            self.logger.info(f"Searching for products with term: {search_term}")
-            response = self.session.get(url, headers=self.headers)
+            response = self._send('GET', url, 'product/listing', params=params)
             
             if response.status_code == 200:
                 data = response.json()
@@ -206,6 +244,9 @@ class OpenCartAPIClient:
                 self.logger.error(f"Product search failed: {response.status_code} - {response.text}")
                 return None
                 
+        except CircuitOpenError as e:
+            self.logger.warning(str(e))
+            return None
         except Exception as e:
             self.logger.error(f"Product search error: {str(e)}")
             return None
@@ -226,18 +267,15 @@ class OpenCartAPIClient:
         """
         url = urljoin(self.base_url, endpoint)
         
+        if method.upper() not in ['GET', 'POST', 'PUT', 'DELETE']:
+            self.logger.error(f"Unsupported HTTP method: {method}")
+            return None
+        
         try:
-            if method.upper() == 'GET':
-                response = self.session.get(url, headers=self.headers, params=params)
-            elif method.upper() == 'POST':
-                response = self.session.post(url, headers=self.headers, json=data)
-            elif method.upper() == 'PUT':
-                response = self.session.put(url, headers=self.headers, json=data)
-            elif method.upper() == 'DELETE':
-                response = self.session.delete(url, headers=self.headers)
+            if method.upper() in ['POST', 'PUT']:
+                response = self._send(method.upper(), url, endpoint, json=data)
             else:
-                self.logger.error(f"Unsupported HTTP method: {method}")
-                return None
+                response = self._send(method.upper(), url, endpoint, params=params)
             
             if response.status_code in [200, 201]:
                 return response.json()
@@ -245,10 +283,59 @@ class OpenCartAPIClient:
                 self.logger.error(f"API request failed: {response.status_code} - {response.text}")
                 return None
                 
+        except CircuitOpenError as e:
+            self.logger.warning(str(e))
+            return None
         except Exception as e:
             self.logger.error(f"Request error: {str(e)}")
             return None
     
+    def _send(self, method: str, url: str, endpoint: str, **kwargs) -> requests.Response:
+        """
+        Send a request through the transport policy (timeout, retries, circuit breaker).
+        
+        Args:
+            method: HTTP method
+            url: Absolute request URL
+            endpoint: Endpoint name used for per-endpoint retry counters
+            **kwargs: Extra arguments passed to requests (params, json)
+            
+        Returns:
+            requests.Response: The final response
+            
+        Raises:
+            CircuitOpenError: If the store is failing and requests are being short-circuited
+            requests.exceptions.RequestException: If the last attempt failed in transport
+        """
+        if method in TransportPolicy.IDEMPOTENT_METHODS:
+            retry_exceptions = self.RETRY_EXCEPTIONS
+        else:
+            retry_exceptions = self.NON_IDEMPOTENT_RETRY_EXCEPTIONS
+        
+        return self.transport_policy.execute(
+            method, endpoint,
+            lambda timeout: self.session.request(method, url, headers=self.headers, timeout=timeout, **kwargs),
+            retry_exceptions
+        )
+    
+    def get_transport_stats(self) -> Dict[str, Any]:
+        """
+        Get per-endpoint retry counters and circuit breaker state.
+        
+        Returns:
+            Dict[str, Any]: Transport statistics
+        """
+        return self.transport_policy.get_stats()
+    
+    def get_search_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get search cache hit/miss statistics.
+        
+        Returns:
+            Dict[str, Any]: Cache statistics
+        """
+        return self.search_cache.get_stats()
+    
     def get_categories(self) -> Optional[List[Dict]]:
         """
         Retrieve all categories from OpenCart.
@@ -300,18 +387,71 @@ class OpenCartAPIClient:
         
         return self._make_request('POST', '/categories', data=category_data)
     
-    def get_products(self, search_term: str = "", limit: int = 100, page: int = 1) -> Optional[List[Dict]]:
-        """Retrieve products from OpenCart using search.
-
+    def get_products(self, search_term: str = "", limit: int = 100, page: int = 1,
+                     sort: Optional[str] = None, order: Optional[str] = None) -> Optional[List[Dict]]:
+        """
+        Retrieve a single page of products from OpenCart.
+        
         Args:
             search_term: Search term for products (empty string returns all)
-            limit: Unused. Reserved for future support of result limiting.
-            page: Unused. Placeholder for future pagination support.
-
+            limit: Number of products per page
+            page: Page number (1-based)
+            sort: Optional sort column (e.g. 'p.date_modified')
+            order: Optional sort order ('ASC' or 'DESC')
+            
         Returns:
             List[Dict]: List of products or None if request failed
         """
-        return self.search_products(search_term)
+        self.logger.info(f"Fetching products page {page} (limit {limit}, search '{search_term}')")
+        params = {'search': search_term, 'limit': limit, 'page': page}
+        if sort:
+            params['sort'] = sort
+        if order:
+            params['order'] = order
+        return self._get_product_listing(params)
+    
+    def iter_all_products(self, page_size: Optional[int] = None, search_term: str = "") -> Iterator[Dict]:
+        """
+        Iterate over the full catalog one page at a time.
+        
+        Pages are requested sequentially until a short or empty page is
+        returned. Products are deduplicated by product_id, and iteration also
+        stops if a page contributes no unseen products (guards against stores
+        that ignore the paging parameters and keep returning the same page).
+        
+        Args:
+            page_size: Number of products per page (defaults to config.catalog_page_size)
+            search_term: Optional search term to restrict the export
+            
+        Yields:
+            Dict: Product data
+            
+        Raises:
+            CatalogExportError: If a page request fails before the export is complete
+        """
+        page_size = page_size or config.catalog_page_size
+        seen_product_ids = set()
+        page = 1
+        
+        while True:
+            products = self.get_products(search_term, limit=page_size, page=page)
+            if products is None:
+                raise CatalogExportError(f"Catalog export failed at page {page}")
+            
+            new_products = 0
+            for product in products:
+                product_id = product.get('product_id')
+                if product_id in seen_product_ids:
+                    continue
+                if product_id:
+                    seen_product_ids.add(product_id)
+                new_products += 1
+                yield product
+            
+            if len(products) < page_size or new_products == 0:
+                self.logger.info(f"Catalog export complete: {len(seen_product_ids)} products in {page} pages")
+                return
+            page += 1
     
     def get_product_by_model(self, model: str) -> Optional[Dict]:
         """
@@ -348,6 +488,7 @@ class OpenCartAPIClient:
         self.logger.info(f"Creating product: {product.name} (Model: {product.model})")
         
         response = self._make_request('POST', '/products', data=product_data)
+        self.search_cache.invalidate()
         if response:
             self.logger.info(f"Successfully created product: {product.name}")
         else:
@@ -370,6 +511,7 @@ class OpenCartAPIClient:
         self.logger.info(f"Updating product ID {product_id}: {product.name}")
         
         response = self._make_request('PUT', f'/products/{product_id}', data=product_data)
+        self.search_cache.invalidate()
         if response:
             self.logger.info(f"Successfully updated product: {product.name}")
         else:
@@ -390,6 +532,7 @@ class OpenCartAPIClient:
         self.logger.info(f"Deleting product ID: {product_id}")
         
         response = self._make_request('DELETE', f'/products/{product_id}')
+        self.search_cache.invalidate()
         if response:
             self.logger.info(f"Successfully deleted product ID: {product_id}")
             return True
@@ -459,7 +602,7 @@ class OpenCartAPIClient:
         try:
             # Test with a simple product search
             url = f"https://www.audicoonline.co.za/index.php?route=ocrestapi/product/listing&search=test"
-            response = self.session.get(url, headers=self.headers)
+            response = self.session.get(url, headers=self.headers, timeout=self.transport_policy.timeout)
             self.logger.info(f"Connection test response: {response.status_code}")
             return response.status_code == 200
         except Exception as e:
@@ -9,7 +9,7 @@ from document parsing (including Excel) to OpenCart synchronization.
 
 import logging
 import os
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 from pathlib import Path
 from datetime import datetime
 
@@ -19,29 +19,44 @@ try:
     from audico_product_manager.gcs_client import GCSClient
     from audico_product_manager.docai_parser import DocumentAIParser, ProductData
     from audico_product_manager.excel_parser import ExcelParser
+    from audico_product_manager.csv_parser import CsvParser
     from audico_product_manager.opencart_client import OpenCartAPIClient
+    from audico_product_manager.async_opencart_client import AsyncOpenCartAPIClient, HTTPX_AVAILABLE
+    from audico_product_manager.catalog_mirror import CatalogMirror
     from audico_product_manager.product_logic import ProductSynchronizer, ProductSyncResult
     from audico_product_manager.store_name_generator import StoreNameGenerator
+    from audico_product_manager.naming_memo import NamingMemo
     from audico_product_manager.enhanced_product_comparison import EnhancedProductComparator
+    from audico_product_manager.parallel_comparison import ParallelComparator
 except ImportError:
     try:
         from .config import config
         from .gcs_client import GCSClient
         from .docai_parser import DocumentAIParser, ProductData
         from .excel_parser import ExcelParser
+        from .csv_parser import CsvParser
         from .opencart_client import OpenCartAPIClient
+        from .async_opencart_client import AsyncOpenCartAPIClient, HTTPX_AVAILABLE
+        from .catalog_mirror import CatalogMirror
         from .product_logic import ProductSynchronizer, ProductSyncResult
         from .store_name_generator import StoreNameGenerator
+        from .naming_memo import NamingMemo
         from .enhanced_product_comparison import EnhancedProductComparator
+        from .parallel_comparison import ParallelComparator
     except ImportError:
         from config import config
         from gcs_client import GCSClient
         from docai_parser import DocumentAIParser, ProductData
         from excel_parser import ExcelParser
+        from csv_parser import CsvParser
         from opencart_client import OpenCartAPIClient
+        from async_opencart_client import AsyncOpenCartAPIClient, HTTPX_AVAILABLE
+        from catalog_mirror import CatalogMirror
         from product_logic import ProductSynchronizer, ProductSyncResult
         from store_name_generator import StoreNameGenerator
+        from naming_memo import NamingMemo
         from enhanced_product_comparison import EnhancedProductComparator
+        from parallel_comparison import ParallelComparator
 
 
 class ProductProcessingOrchestrator:
@@ -60,12 +75,33 @@ class ProductProcessingOrchestrator:
             
         self.docai_parser = DocumentAIParser()
         self.excel_parser = ExcelParser()
+        self.csv_parser = CsvParser()
         self.opencart_client = OpenCartAPIClient()
-        self.product_synchronizer = ProductSynchronizer(self.opencart_client)
+        
+        # Concurrent OpenCart access for batch syncs and catalog export
+        # (shares the sync client's transport policy and search cache)
+        self.async_opencart_client = (
+            AsyncOpenCartAPIClient(
+                transport_policy=self.opencart_client.transport_policy,
+                search_cache=self.opencart_client.search_cache
+            )
+            if HTTPX_AVAILABLE else None
+        )
+        
+        # Local SQLite copy of the catalog for matching and sync lookups
+        self.catalog_mirror = CatalogMirror()
+        self.product_synchronizer = ProductSynchronizer(
+            self.opencart_client, self.async_opencart_client, catalog_mirror=self.catalog_mirror
+        )
         
         # Initialize new enhanced components
         self.store_name_generator = StoreNameGenerator()
-        self.enhanced_comparator = EnhancedProductComparator(self.opencart_client, self.store_name_generator)
+        self.enhanced_comparator = EnhancedProductComparator(
+            self.opencart_client, self.store_name_generator, async_client=self.async_opencart_client,
+            catalog_mirror=self.catalog_mirror
+        )
+        # Shards large pricelists across CPU cores; small ones stay in-process
+        self.parallel_comparator = ParallelComparator(self.enhanced_comparator)
         
         self.logger.info("Enhanced Product Processing Orchestrator initialized with GPT-4 store naming and improved matching")
     
@@ -223,19 +259,45 @@ class ProductProcessingOrchestrator:
             'processing_summary': {}
         }
         
+        # Every stage below shares one memo, so each product is named at most once
+        with self.store_name_generator.naming_run() as naming_memo:
+            self._process_enhanced(file_path, result, naming_memo)
+            result['naming_stats'] = naming_memo.get_stats()
+        result['naming_requests'] = self.store_name_generator.get_request_stats()
+        
+        return result
+    
+    def _process_enhanced(self, file_path: str, result: Dict[str, Any], naming_memo: NamingMemo) -> None:
+        """
+        Run the enhanced processing steps, filling in the result dict.
+        
+        Args:
+            file_path: Path to the local document file
+            result: Result dict to update
+            naming_memo: Naming memo shared by the parsing, naming and comparison stages
+        """
         try:
-            # Step 1: Parse document based on file type (existing functionality)
-            self.logger.info("Step 1: Extracting raw product data...")
-            products_data = self._parse_document_enhanced(file_path)
+            # Steps 1-3 run per batch of parsed products, so the first products are
+            # named and compared while the rest of the document is still being parsed
+            self.logger.info("Steps 1-3: Extracting, naming and comparing products as they are parsed...")
+            products_data = []
+            # One worker pool serves every batch of the run, so the catalog is sent to it once
+            with self.parallel_comparator.comparison_run() as comparison:
+                for batch in self._iter_product_batches(file_path, naming_memo):
+                    # Step 2: Generate store-friendly names using GPT-4
+                    batch = self.store_name_generator.batch_generate_store_names(batch)
+                    products_data.extend(batch)
+                    
+                    # Step 3: Enhanced product comparison using both raw and store names,
+                    # scored in worker processes while the next batch is parsed
+                    comparison.submit(batch)
+                    self.logger.info(f"Submitted {len(products_data)} products for comparison so far")
+                enhanced_matches = comparison.matches()
             result['products_found'] = len(products_data)
             
             if not products_data:
                 result['error_message'] = "No products found in document"
-                return result
-            
-            # Step 2: Generate store-friendly names using GPT-4
-            self.logger.info("Step 2: Generating store-friendly names with GPT-4...")
-            products_data = self.store_name_generator.batch_generate_store_names(products_data)
+                return
             
             # Collect generated store names for result
             result['store_names_generated'] = [
@@ -246,10 +308,7 @@ class ProductProcessingOrchestrator:
                 }
                 for product in products_data
             ]
-            
-            # Step 3: Enhanced product comparison using both raw and store names
-            self.logger.info("Step 3: Performing enhanced product comparison...")
-            enhanced_matches = self.enhanced_comparator.batch_compare_products(products_data)
+            result['store_name_cache_stats'] = self.store_name_generator.get_cache_stats()
             
             # Convert enhanced matches to serializable format
             result['enhanced_matches'] = [
@@ -322,8 +381,6 @@ class ProductProcessingOrchestrator:
         except Exception as e:
             self.logger.error(f"Error in enhanced processing of document {file_path}: {str(e)}")
             result['error_message'] = str(e)
-        
-        return result
     
     def _generate_processing_summary(self, enhanced_matches) -> Dict[str, Any]:
         """
@@ -374,7 +431,7 @@ class ProductProcessingOrchestrator:
             file_path: Path to the file
             
         Returns:
-            str: File type ('pdf', 'excel', 'image', 'text', 'unknown')
+            str: File type ('pdf', 'excel', 'csv', 'image', 'text', 'unknown')
         """
         file_extension = Path(file_path).suffix.lower()
         
@@ -382,60 +439,115 @@ class ProductProcessingOrchestrator:
             return 'pdf'
         elif file_extension in ['.xlsx', '.xls', '.xlsm']:
             return 'excel'
+        elif file_extension in ['.csv', '.tsv']:
+            return 'csv'
         elif file_extension in ['.png', '.jpg', '.jpeg', '.tiff', '.tif']:
             return 'image'
-        elif file_extension in ['.txt', '.csv']:
+        elif file_extension == '.txt':
             return 'text'
         else:
             return 'unknown'
     
-    def _parse_document_enhanced(self, file_path: str) -> List[ProductData]:
+    def _parse_document_enhanced(self, file_path: str, naming_memo: Optional[NamingMemo] = None) -> List[ProductData]:
         """
         Parse document using the appropriate parser based on file type.
         
         Args:
             file_path: Path to the document file
+            naming_memo: Naming memo of the current run; parsers then leave AI naming to later stages
             
         Returns:
             List[ProductData]: List of extracted product data
         """
-        file_type = self._detect_file_type(file_path)
+        try:
+            products_data = list(self._iter_document_products(file_path, naming_memo))
+            self.logger.info(f"Parser extracted {len(products_data)} products")
+            return products_data
+        except Exception as e:
+            self.logger.error(f"Error parsing document {file_path}: {str(e)}")
+            return []
+    
+    def _iter_product_batches(self, file_path: str,
+                              naming_memo: Optional[NamingMemo] = None) -> Iterator[List[ProductData]]:
+        """
+        Parse a document incrementally, yielding products in batches of STREAM_BATCH_SIZE.
+        
+        A parse error part-way through the document is raised rather than
+        ending the batches early, so a truncated pricelist is never compared
+        and synchronized as if it were complete.
         
+        Args:
+            file_path: Path to the document file
+            naming_memo: Naming memo of the current run
+            
+        Yields:
+            List[ProductData]: Next batch of parsed products
+        """
+        batch = []
+        parsed = 0
         try:
-            if file_type == 'excel':
-                self.logger.info(f"Using Excel parser for file: {file_path}")
-                products_data = self.excel_parser.parse_excel_file(file_path)
+            for product in self._iter_document_products(file_path, naming_memo):
+                batch.append(product)
+                if len(batch) >= config.stream_batch_size:
+                    parsed += len(batch)
+                    yield batch
+                    batch = []
+        except Exception as e:
+            self.logger.error(f"Error parsing document {file_path} after {parsed + len(batch)} products: {str(e)}")
+            raise
+        if batch:
+            yield batch
+    
+    def _iter_document_products(self, file_path: str,
+                                naming_memo: Optional[NamingMemo] = None) -> Iterator[ProductData]:
+        """
+        Parse document using the appropriate parser based on file type, yielding products as they are found.
+        
+        Args:
+            file_path: Path to the document file
+            naming_memo: Naming memo of the current run; parsers then leave AI naming to later stages
+            
+        Yields:
+            ProductData: Extracted product data
+        """
+        file_type = self._detect_file_type(file_path)
+        
+        if file_type == 'excel':
+            self.logger.info(f"Using Excel parser for file: {file_path}")
+            if config.excel_all_sheets:
+                # One product table per sheet: parse them all in parallel
+                products_data = self.excel_parser.parse_excel_file(file_path, sheet_name=None)
+                self.logger.info(f"Excel parser extracted {len(products_data)} products from all sheets")
+                yield from products_data
+            elif self.excel_parser.should_stream(file_path):
+                # Large workbook: read it in row chunks
+                yield from self.excel_parser.iter_excel_products(file_path)
+            else:
+                products_data = self.excel_parser.parse_excel_file(file_path, stream=False)
                 self.logger.info(f"Excel parser extracted {len(products_data)} products")
-                return products_data
+                yield from products_data
+        
+        elif file_type == 'csv':
+            self.logger.info(f"Using CSV parser for file: {file_path}")
+            yield from self.csv_parser.iter_csv_products(file_path)
+        
+        elif file_type in ['pdf', 'image', 'text']:
+            self.logger.info(f"Using Document AI parser for {file_type} file: {file_path}")
             
-            elif file_type in ['pdf', 'image', 'text']:
-                self.logger.info(f"Using Document AI parser for {file_type} file: {file_path}")
-                
-                # Read document content
-                with open(file_path, 'rb') as f:
-                    document_content = f.read()
-                
-                # Determine MIME type
-                mime_type_map = {
-                    'pdf': 'application/pdf',
-                    'image': self._get_image_mime_type(file_path),
-                    'text': 'text/plain'
-                }
-                
-                mime_type = mime_type_map.get(file_type, 'application/pdf')
-                
-                # Parse document
-                products_data = self.docai_parser.parse_document(document_content, mime_type)
-                self.logger.info(f"Document AI parser extracted {len(products_data)} products")
-                return products_data
+            # Determine MIME type
+            mime_type_map = {
+                'pdf': 'application/pdf',
+                'image': self._get_image_mime_type(file_path),
+                'text': 'text/plain'
+            }
             
-            else:
-                self.logger.warning(f"Unsupported file type: {file_type} for file: {file_path}")
-                return []
+            mime_type = mime_type_map.get(file_type, 'application/pdf')
             
-        except Exception as e:
-            self.logger.error(f"Error parsing document {file_path}: {str(e)}")
-            return []
+            # Parse the memory-mapped document page by page
+            yield from self.docai_parser.iter_products(file_path, mime_type, naming_memo)
+        
+        else:
+            self.logger.warning(f"Unsupported file type: {file_type} for file: {file_path}")
     
     def _get_image_mime_type(self, file_path: str) -> str:
         """
@@ -657,5 +769,6 @@ class ProductProcessingOrchestrator:
         """
         return {
             'document_ai': ['.pdf', '.png', '.jpg', '.jpeg', '.tiff', '.tif', '.txt'],
-            'excel_parser': self.excel_parser.get_supported_formats()
+            'excel_parser': self.excel_parser.get_supported_formats(),
+            'csv_parser': self.csv_parser.get_supported_formats()
         }
@@ -0,0 +1,333 @@
+"""
+Multi-process comparison engine for Audico Product Manager.
+
+Fuzzy scoring is CPU-bound and holds the GIL, so a large pricelist is split
+into contiguous shards of parsed rows that are scored in a
+ProcessPoolExecutor. The catalog, its candidate index and the precomputed
+matching features are built once in the parent and handed to each worker
+once, through the pool initializer, as a pickled comparator without its API
+clients and name generator. Workers start from a forkserver (spawn where that
+is unavailable) rather than being forked from the multi-threaded parent, and
+each pool gets its own copy, so concurrent runs never share worker state.
+
+Streamed documents arrive in small batches, so a ComparisonRun keeps one pool
+open for the whole run: the catalog is pickled once per worker, and each
+batch is compared in the workers while the next one is parsed and named.
+"""
+
+import logging
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+# Use absolute imports that work when running directly
+try:
+    from audico_product_manager.docai_parser import ProductData
+    from audico_product_manager.product_comparison import ProductComparator, ProductMatch
+    from audico_product_manager.enhanced_product_comparison import EnhancedProductComparator, EnhancedProductMatch
+    from audico_product_manager.config import config
+    from audico_product_manager.process_pools import pool_context
+except ImportError:
+    try:
+        from .docai_parser import ProductData
+        from .product_comparison import ProductComparator, ProductMatch
+        from .enhanced_product_comparison import EnhancedProductComparator, EnhancedProductMatch
+        from .config import config
+        from .process_pools import pool_context
+    except ImportError:
+        from docai_parser import ProductData
+        from product_comparison import ProductComparator, ProductMatch
+        from enhanced_product_comparison import EnhancedProductComparator, EnhancedProductMatch
+        from config import config
+        from process_pools import pool_context
+
+
+# Prepared comparator of a worker process; set by _init_worker, never in the parent
+_shard_comparator = None
+
+
+def _init_worker(comparator: Union[ProductComparator, EnhancedProductComparator]) -> None:
+    """Worker initializer: keep the pickled comparator for this process's shards."""
+    global _shard_comparator
+    # Each process already owns a core, so cdist must not start its own thread pool
+    if isinstance(comparator, EnhancedProductComparator):
+        comparator.cdist_workers = 1
+    _shard_comparator = comparator
+
+
+def _compare_shard(shard: Tuple[int, int, List[Dict[str, Any]]]) -> List[ProductMatch]:
+    """Worker: match a shard of parsed rows with the worker's ProductComparator."""
+    offset, total, parsed_products = shard
+    return _shard_comparator.compare_rows(parsed_products, offset, total)
+
+
+def _compare_enhanced_shard(shard: Tuple[List[ProductData], List[Dict[str, Any]], bool]) -> List[EnhancedProductMatch]:
+    """Worker: match a shard of prepared rows with the worker's EnhancedProductComparator."""
+    products_data, rows, vectorized = shard
+    return _shard_comparator.match_prepared_batch(products_data, rows, vectorized)
+
+
+class ComparisonRun:
+    """Compares the stream batches of one run in a worker pool kept open for the whole run."""
+
+    def __init__(self, parallel: 'ParallelComparator', vectorized: bool = True):
+        """
+        Initialize the comparison run.
+
+        Args:
+            parallel: Parallel comparator holding the EnhancedProductComparator and pool sizing
+            vectorized: Score batches with cdist score matrices when available
+        """
+        self.parallel = parallel
+        self.comparator = parallel.comparator
+        self.vectorized = vectorized
+        self.logger = parallel.logger
+
+        self.row_count = 0
+        self.pooled_batches = 0
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_features = None
+        self._retired: List[ProcessPoolExecutor] = []
+        self._pool_failed = False
+        # (products, prepared rows, shard futures or None, matches compared in this process)
+        self._batches: List[Tuple[List[ProductData], List[Dict[str, Any]],
+                                  Optional[List[Future]], List[EnhancedProductMatch]]] = []
+
+    def _get_executor(self) -> Optional[ProcessPoolExecutor]:
+        """
+        Get the run's worker pool, starting it once the run is large enough.
+
+        Returns:
+            ProcessPoolExecutor: Pool holding the current catalog, or None while
+            batches should be compared in this process
+        """
+        parallel = self.parallel
+        if self._executor is None and (
+                self._pool_failed or parallel.max_workers <= 1
+                or self.row_count < parallel.max_workers * parallel.min_shard_rows):
+            return None
+
+        features = self.comparator.catalog_features
+        if self._executor is not None and features is not self._executor_features:
+            # The catalog was reloaded; later batches need workers holding the new one
+            self._retired.append(self._executor)
+            self._executor = None
+
+        if self._executor is None:
+            self.logger.info(f"Starting {parallel.max_workers} comparison worker processes for this run")
+            self._executor = ProcessPoolExecutor(max_workers=parallel.max_workers, mp_context=pool_context(__name__),
+                                                 initializer=_init_worker, initargs=(self.comparator,))
+            self._executor_features = features
+        return self._executor
+
+    def submit(self, products_data: List[ProductData]) -> None:
+        """
+        Prepare a batch in this process and start comparing it.
+
+        Store names are generated here; once the run is large enough, the
+        batch is scored in the worker pool without waiting for the result.
+
+        Args:
+            products_data: Products of one stream batch
+        """
+        if not products_data:
+            return
+
+        rows = self.comparator.prepare_batch(products_data)
+        self.row_count += len(products_data)
+
+        executor = self._get_executor()
+        if executor is not None:
+            parallel = self.parallel
+            shard_count = max(1, min(parallel.max_workers, len(products_data) // parallel.min_shard_rows))
+            shard_size = -(-len(products_data) // shard_count)
+            try:
+                futures = [executor.submit(_compare_enhanced_shard,
+                                           (products_data[start:start + shard_size], rows[start:start + shard_size],
+                                            self.vectorized))
+                           for start in range(0, len(products_data), shard_size)]
+            except Exception as e:
+                self.logger.error(f"Comparison worker pool failed, comparing in this process: {str(e)}")
+                self._pool_failed = True
+                self._retired.append(self._executor)
+                self._executor = None
+            else:
+                self.pooled_batches += 1
+                self._batches.append((products_data, rows, futures, []))
+                return
+
+        matches = self.comparator.match_prepared_batch(products_data, rows, self.vectorized)
+        self._batches.append((products_data, rows, None, matches))
+
+    def matches(self) -> List[EnhancedProductMatch]:
+        """
+        Wait for every submitted batch.
+
+        Returns:
+            List[EnhancedProductMatch]: Matches of all batches, in submission order
+        """
+        matches = []
+        for products_data, rows, futures, batch_matches in self._batches:
+            if futures is not None:
+                try:
+                    batch_matches = [match for future in futures for match in future.result()]
+                except Exception as e:
+                    self.logger.error(f"Parallel comparison failed, comparing the batch in this process: {str(e)}")
+                    batch_matches = self.comparator.match_prepared_batch(products_data, rows, self.vectorized)
+            matches.extend(batch_matches)
+
+        self.comparator.log_comparison_summary(matches)
+        return matches
+
+    def close(self) -> None:
+        """Shut down the run's worker pools, cancelling batches not yet compared."""
+        executors = self._retired + ([self._executor] if self._executor is not None else [])
+        self._executor = None
+        self._retired = []
+        for executor in executors:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+class ParallelComparator:
+    """Shards comparisons across worker processes that receive the parent's prepared catalog."""
+
+    # Shards per worker, so one slow shard does not leave the other cores idle
+    SHARDS_PER_WORKER = 4
+
+    def __init__(self, comparator: Union[ProductComparator, EnhancedProductComparator],
+                 max_workers: Optional[int] = None, min_shard_rows: Optional[int] = None):
+        """
+        Initialize the parallel comparator.
+
+        Args:
+            comparator: Comparator that loads the catalog and scores rows
+            max_workers: Worker processes (defaults to COMPARE_WORKERS or the CPU count)
+            min_shard_rows: Smallest shard worth sending to a worker process
+        """
+        self.comparator = comparator
+        self.max_workers = max_workers or config.compare_workers or os.cpu_count() or 1
+        self.min_shard_rows = max(1, min_shard_rows or config.compare_min_shard_rows)
+        self.logger = logging.getLogger(__name__)
+
+    @contextmanager
+    def comparison_run(self, vectorized: bool = True) -> Iterator[ComparisonRun]:
+        """
+        Open a comparison run for the stream batches of one document.
+
+        The run is local to the caller, so concurrent requests each get their
+        own worker pool.
+
+        Args:
+            vectorized: Score batches with cdist score matrices when available
+
+        Yields:
+            ComparisonRun: Run to submit batches to; its pool is shut down on exit
+        """
+        run = ComparisonRun(self, vectorized)
+        try:
+            yield run
+        finally:
+            run.close()
+
+    def _shard_bounds(self, row_count: int) -> List[Tuple[int, int]]:
+        """
+        Split row positions into contiguous shards.
+
+        Args:
+            row_count: Number of parsed rows
+
+        Returns:
+            List[Tuple[int, int]]: (start, end) bounds, or an empty list when the
+            rows should be compared in this process
+        """
+        workers = min(self.max_workers, row_count // self.min_shard_rows)
+        if workers <= 1:
+            return []
+
+        shard_count = min(workers * self.SHARDS_PER_WORKER, row_count // self.min_shard_rows)
+        shard_size = -(-row_count // shard_count)
+        return [(start, min(start + shard_size, row_count)) for start in range(0, row_count, shard_size)]
+
+    def _run_shards(self, worker: Callable[[Any], List], shards: List[Any]) -> List:
+        """
+        Run shards in worker processes and concatenate results in shard order.
+
+        The prepared comparator is pickled once per worker through the pool
+        initializer; afterwards only shards and their results cross process
+        boundaries.
+
+        Args:
+            worker: Module-level worker function
+            shards: Picklable shard arguments
+
+        Returns:
+            List: Results of all shards, in input order
+        """
+        workers = min(self.max_workers, len(shards))
+        self.logger.info(f"Comparing in {len(shards)} shards across {workers} worker processes")
+
+        with ProcessPoolExecutor(max_workers=workers, mp_context=pool_context(__name__),
+                                 initializer=_init_worker, initargs=(self.comparator,)) as executor:
+            shard_results = list(executor.map(worker, shards))
+
+        return [result for shard_result in shard_results for result in shard_result]
+
+    def compare_products(self, parsed_products: List[Dict[str, Any]]) -> List[ProductMatch]:
+        """
+        Parallel equivalent of ProductComparator.compare_products.
+
+        Args:
+            parsed_products: List of parsed product data
+
+        Returns:
+            List[ProductMatch]: Matches in input order
+        """
+        comparator = self.comparator
+        self.logger.info(f"Starting parallel comparison of {len(parsed_products)} parsed products")
+
+        # Catalog, index and live searches are resolved before the workers start
+        if not comparator.prepare_comparison(parsed_products):
+            return []
+
+        try:
+            bounds = self._shard_bounds(len(parsed_products))
+            if not bounds:
+                return comparator.compare_rows(parsed_products)
+
+            total = len(parsed_products)
+            shards = [(start, total, parsed_products[start:end]) for start, end in bounds]
+            return self._run_shards(_compare_shard, shards)
+        finally:
+            comparator.finish_comparison()
+
+    def batch_compare_products(self, products_data: List[ProductData],
+                               vectorized: bool = True) -> List[EnhancedProductMatch]:
+        """
+        Parallel equivalent of EnhancedProductComparator.batch_compare_products.
+
+        Store names are generated in this process; workers only score.
+
+        Args:
+            products_data: List of product data to compare
+            vectorized: Score each shard with cdist score matrices when available
+
+        Returns:
+            List[EnhancedProductMatch]: Match results in input order
+        """
+        comparator = self.comparator
+        bounds = self._shard_bounds(len(products_data))
+        if not bounds:
+            return comparator.batch_compare_products(products_data, vectorized)
+
+        self.logger.info(f"Starting parallel enhanced comparison for {len(products_data)} products")
+        try:
+            rows = comparator.prepare_batch(products_data)
+            shards = [(products_data[start:end], rows[start:end], vectorized) for start, end in bounds]
+            matches = self._run_shards(_compare_enhanced_shard, shards)
+        except Exception as e:
+            self.logger.error(f"Parallel comparison failed, comparing in this process: {str(e)}")
+            return comparator.batch_compare_products(products_data, vectorized)
+
+        comparator.log_comparison_summary(matches)
+        return matches
@@ -0,0 +1,221 @@
+"""
+Document parse cache for Audico Product Manager.
+
+This module keeps the products extracted from a document in a local SQLite
+database keyed by the SHA-256 of the document bytes, so re-uploading the same
+pricelist or retrying a GCS file skips text extraction and GPT-4 entirely.
+Results are stored as zlib-compressed JSON and are tied to the parser version
+that produced them; results from an older parser are treated as misses.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS parse_results (
+    content_hash TEXT NOT NULL,
+    variant TEXT NOT NULL,
+    parser_version TEXT NOT NULL,
+    product_count INTEGER NOT NULL,
+    products BLOB NOT NULL,
+    created_at REAL NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (content_hash, variant)
+);
+CREATE INDEX IF NOT EXISTS idx_parse_results_last_used ON parse_results (last_used);
+"""
+
+
+class ParseCache:
+    """SQLite-backed LRU cache of parsed products keyed by document content hash."""
+
+    def __init__(self, db_path: str = 'parse_cache.db', max_entries: int = 500):
+        """
+        Initialize the parse cache.
+
+        Args:
+            db_path: SQLite database path
+            max_entries: Maximum cached documents; least recently used documents are evicted
+        """
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.writes = 0
+        self.evictions = 0
+
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection for one unit of work, committing on success."""
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    @staticmethod
+    def document_hash(document_content: bytes) -> str:
+        """
+        Hash document bytes.
+
+        Args:
+            document_content: Raw document bytes
+
+        Returns:
+            str: SHA-256 hex digest
+        """
+        return hashlib.sha256(document_content).hexdigest()
+
+    def get(self, content_hash: str, variant: str, parser_version: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get the products cached for a document.
+
+        Args:
+            content_hash: Key from document_hash
+            variant: Parse options that change the result (e.g. MIME type)
+            parser_version: Version of the parser asking; other versions miss
+
+        Returns:
+            List[Dict[str, Any]]: Cached product dicts or None on a miss
+        """
+        stale = False
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT parser_version, products FROM parse_results WHERE content_hash = ? AND variant = ?",
+                    (content_hash, variant)
+                ).fetchone()
+                if row and row[0] != parser_version:
+                    stale, row = True, None
+                elif row:
+                    conn.execute("UPDATE parse_results SET last_used = ? WHERE content_hash = ? AND variant = ?",
+                                 (time.time(), content_hash, variant))
+            products = json.loads(zlib.decompress(row[1])) if row else None
+        except (sqlite3.Error, zlib.error, ValueError) as e:
+            self.logger.warning(f"Parse cache read failed: {str(e)}")
+            products = None
+
+        with self._lock:
+            if products is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+                self.stale += stale
+        return products
+
+    def put(self, content_hash: str, variant: str, parser_version: str, products: List[Dict[str, Any]]) -> None:
+        """
+        Cache the products parsed from a document, evicting the least recently used documents.
+
+        Args:
+            content_hash: Key from document_hash
+            variant: Parse options that change the result
+            parser_version: Version of the parser that produced the products
+            products: Product dicts
+        """
+        if self.max_entries <= 0:
+            return
+
+        payload = zlib.compress(json.dumps(products, separators=(',', ':'), ensure_ascii=False).encode('utf-8'))
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO parse_results "
+                    "(content_hash, variant, parser_version, product_count, products, created_at, last_used) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (content_hash, variant, parser_version, len(products), payload, now, now)
+                )
+                overflow = conn.execute("SELECT COUNT(*) FROM parse_results").fetchone()[0] - self.max_entries
+                if overflow > 0:
+                    conn.execute(
+                        "DELETE FROM parse_results WHERE rowid IN "
+                        "(SELECT rowid FROM parse_results ORDER BY last_used LIMIT ?)",
+                        (overflow,)
+                    )
+        except sqlite3.Error as e:
+            self.logger.warning(f"Parse cache write failed: {str(e)}")
+            return
+
+        with self._lock:
+            self.writes += 1
+            self.evictions += max(0, overflow)
+
+    def invalidate(self, content_hash: str) -> int:
+        """
+        Drop the cached results of one document.
+
+        Args:
+            content_hash: Key from document_hash
+
+        Returns:
+            int: Number of cached results removed
+        """
+        with self._connect() as conn:
+            return conn.execute("DELETE FROM parse_results WHERE content_hash = ?", (content_hash,)).rowcount
+
+    def purge_versions(self, parser_version: str) -> int:
+        """
+        Drop results produced by any parser version other than the given one.
+
+        Args:
+            parser_version: Version to keep
+
+        Returns:
+            int: Number of cached results removed
+        """
+        with self._connect() as conn:
+            return conn.execute("DELETE FROM parse_results WHERE parser_version != ?", (parser_version,)).rowcount
+
+    def clear(self) -> int:
+        """
+        Drop all cached results.
+
+        Returns:
+            int: Number of cached results removed
+        """
+        with self._connect() as conn:
+            return conn.execute("DELETE FROM parse_results").rowcount
+
+    def entry_count(self) -> int:
+        """Get the number of cached results."""
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM parse_results").fetchone()[0]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict[str, Any]: Hit/miss counters and current size
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            stats = {
+                'enabled': True,
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'stale': self.stale,
+                'writes': self.writes,
+                'evictions': self.evictions,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0
+            }
+        stats['entries'] = self.entry_count()
+        return stats
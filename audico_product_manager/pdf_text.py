@@ -0,0 +1,211 @@
+"""
+Page-parallel PDF text extraction for Audico Product Manager.
+
+PyPDF2 text extraction is pure Python and CPU-bound, so large distributor
+catalogs are split into contiguous page ranges that are extracted in a
+ProcessPoolExecutor. The document is memory-mapped rather than read into a
+bytes object; each worker gets the file path through the pool initializer
+and maps its own copy (documents held only as bytes are sent once per
+worker instead), so concurrent requests never share worker state. Pages can be consumed as a stream, with only a few ranges in
+flight at once, or joined once with their character spans kept so downstream
+chunking can respect page boundaries.
+"""
+
+import io
+import logging
+import mmap
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Iterator, List, NamedTuple, Optional, Tuple, Union
+
+import PyPDF2
+
+# Use absolute import that works when running directly
+try:
+    from audico_product_manager.process_pools import pool_context
+except ImportError:
+    try:
+        from .process_pools import pool_context
+    except ImportError:
+        from process_pools import pool_context
+
+
+DocumentSource = Union[bytes, mmap.mmap]
+
+# Reader of a worker process; opened by _init_worker, never in the parent
+_worker_reader: Optional[PyPDF2.PdfReader] = None
+
+PAGE_SEPARATOR = "\n"
+
+
+class PdfText(NamedTuple):
+    """Text of a PDF, page by page."""
+    pages: List[str]
+
+    @property
+    def text(self) -> str:
+        """Page texts joined with PAGE_SEPARATOR."""
+        return PAGE_SEPARATOR.join(self.pages)
+
+    @property
+    def page_spans(self) -> List[Tuple[int, int]]:
+        """(start, end) character offsets of each page in text."""
+        spans = []
+        start = 0
+        for page in self.pages:
+            spans.append((start, start + len(page)))
+            start += len(page) + len(PAGE_SEPARATOR)
+        return spans
+
+
+class MappedDocument(mmap.mmap):
+    """Read-only mapping of a document file that remembers the file's path."""
+
+    path: str = ''
+
+
+@contextmanager
+def map_document(file_path: str) -> Iterator[DocumentSource]:
+    """
+    Memory-map a document file for reading.
+
+    Args:
+        file_path: Path to the document
+
+    Yields:
+        DocumentSource: Read-only MappedDocument of the file (bytes for empty files, which cannot be mapped)
+    """
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b''
+            return
+        with MappedDocument(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            mapped.path = os.path.abspath(file_path)
+            yield mapped
+
+
+def _open_reader(source: DocumentSource) -> PyPDF2.PdfReader:
+    """Open a PDF reader over bytes or a memory-mapped file without copying it."""
+    if isinstance(source, mmap.mmap):
+        source.seek(0)
+        return PyPDF2.PdfReader(source)
+    return PyPDF2.PdfReader(io.BytesIO(source))
+
+
+def _extract_range(reader: PyPDF2.PdfReader, start: int, end: int) -> List[str]:
+    """Extract the text of pages [start, end), using '' for pages that fail."""
+    texts = []
+    for index in range(start, end):
+        try:
+            texts.append(reader.pages[index].extract_text() or "")
+        except Exception as e:
+            logging.getLogger(__name__).warning(f"Could not extract text from PDF page {index + 1}: {str(e)}")
+            texts.append("")
+    return texts
+
+
+def _init_worker(document: Union[str, bytes]) -> None:
+    """Worker initializer: map the document file (or take its bytes) and open a reader over it."""
+    global _worker_reader
+    if isinstance(document, str):
+        with open(document, 'rb') as f:
+            document = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    _worker_reader = _open_reader(document)
+
+
+def _extract_page_range(bounds: Tuple[int, int]) -> List[str]:
+    """Worker: extract a page range from the worker's document."""
+    return _extract_range(_worker_reader, *bounds)
+
+
+class PdfTextExtractor:
+    """Extracts PDF page texts, in parallel worker processes for large documents."""
+
+    # Ranges per worker, so one slow range does not leave the other cores idle
+    RANGES_PER_WORKER = 4
+
+    def __init__(self, max_workers: Optional[int] = None, min_pages_per_worker: int = 8):
+        """
+        Initialize the extractor.
+
+        Args:
+            max_workers: Worker processes (defaults to the CPU count)
+            min_pages_per_worker: Smallest page range worth sending to a worker process
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.min_pages_per_worker = max(1, min_pages_per_worker)
+        self.logger = logging.getLogger(__name__)
+
+    def _page_ranges(self, page_count: int) -> List[Tuple[int, int]]:
+        """
+        Split pages into contiguous ranges.
+
+        Args:
+            page_count: Number of pages
+
+        Returns:
+            List[Tuple[int, int]]: (start, end) ranges, or an empty list when the
+            pages should be extracted in this process
+        """
+        workers = min(self.max_workers, page_count // self.min_pages_per_worker)
+        if workers <= 1:
+            return []
+
+        range_count = min(workers * self.RANGES_PER_WORKER, page_count // self.min_pages_per_worker)
+        range_size = -(-page_count // range_count)
+        return [(start, min(start + range_size, page_count)) for start in range(0, page_count, range_size)]
+
+    def iter_pages(self, source: DocumentSource) -> Iterator[str]:
+        """
+        Yield the text of every page in page order.
+
+        At most two ranges per worker are in flight, so memory stays bounded
+        while the consumer processes earlier pages.
+
+        Args:
+            source: PDF bytes or a mapping from map_document
+
+        Yields:
+            str: Page text ('' for pages without extractable text)
+        """
+        reader = _open_reader(source)
+        page_count = len(reader.pages)
+        ranges = deque(self._page_ranges(page_count))
+        next_page = 0
+        if ranges:
+            workers = min(self.max_workers, len(ranges))
+            self.logger.info(f"Extracting {page_count} PDF pages in {len(ranges)} ranges across {workers} processes")
+            # Workers map the file themselves; only unmapped documents are copied to them
+            document = getattr(source, 'path', '') or bytes(source)
+            try:
+                with ProcessPoolExecutor(max_workers=workers, mp_context=pool_context(__name__),
+                                         initializer=_init_worker, initargs=(document,)) as executor:
+                    pending = deque(executor.submit(_extract_page_range, ranges.popleft())
+                                    for _ in range(min(workers * 2, len(ranges))))
+                    while pending:
+                        texts = pending.popleft().result()
+                        if ranges:
+                            pending.append(executor.submit(_extract_page_range, ranges.popleft()))
+                        for text in texts:
+                            next_page += 1
+                            yield text
+            except Exception as e:
+                self.logger.error(f"Parallel PDF extraction failed at page {next_page + 1}, "
+                                  f"extracting the rest in this process: {str(e)}")
+
+        for index in range(next_page, page_count):
+            yield _extract_range(reader, index, index + 1)[0]
+
+    def extract(self, source: DocumentSource) -> PdfText:
+        """
+        Extract the text of every page.
+
+        Args:
+            source: PDF bytes or a mapping from map_document
+
+        Returns:
+            PdfText: Page texts in page order
+        """
+        return PdfText(list(self.iter_pages(source)))
@@ -0,0 +1,39 @@
+"""
+Worker process start method for Audico Product Manager's process pools.
+
+The Flask app serves requests from several threads, so forking it can copy
+locks that another thread holds at that moment (logging, HTTP pools,
+SQLite) into a worker where they are never released. Comparison, PDF and
+workbook pools therefore start their workers from a forkserver, which is
+single-threaded, or spawn them where forkserver is unavailable. Workers get
+their inputs through the pool initializer rather than inherited globals.
+"""
+
+import multiprocessing
+from multiprocessing.context import BaseContext
+from typing import List
+
+# Modules the forkserver imports once, so each worker starts with them loaded
+_preload_modules: List[str] = []
+
+
+def pool_context(preload_module: str) -> BaseContext:
+    """
+    Get the start method context for a process pool.
+
+    Args:
+        preload_module: Module holding the pool's worker functions; imported by
+            the forkserver when it starts (later additions are imported by each
+            worker instead)
+
+    Returns:
+        BaseContext: forkserver context, or spawn where forkserver is unavailable
+    """
+    if 'forkserver' not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('spawn')
+
+    context = multiprocessing.get_context('forkserver')
+    if preload_module not in _preload_modules:
+        _preload_modules.append(preload_module)
+        context.set_forkserver_preload(list(_preload_modules))
+    return context
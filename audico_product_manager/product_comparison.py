@@ -10,6 +10,7 @@ audio equipment specific search terms and fuzzy matching.
 
 import logging
 import re
+from itertools import chain
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
@@ -19,16 +20,28 @@ import unicodedata
 # Use absolute imports that work when running directly
 try:
     from audico_product_manager.docai_parser import ProductData
-    from audico_product_manager.opencart_client import OpenCartAPIClient
+    from audico_product_manager.opencart_client import OpenCartAPIClient, CatalogExportError
+    from audico_product_manager.async_opencart_client import AsyncOpenCartAPIClient
+    from audico_product_manager.catalog_mirror import CatalogMirror
+    from audico_product_manager.catalog_index import CatalogIndex
+    from audico_product_manager.catalog_features import ProductFeatures, build_product_features
     from audico_product_manager.config import config
 except ImportError:
     try:
         from .docai_parser import ProductData
-        from .opencart_client import OpenCartAPIClient
+        from .opencart_client import OpenCartAPIClient, CatalogExportError
+        from .async_opencart_client import AsyncOpenCartAPIClient
+        from .catalog_mirror import CatalogMirror
+        from .catalog_index import CatalogIndex
+        from .catalog_features import ProductFeatures, build_product_features
         from .config import config
     except ImportError:
         from docai_parser import ProductData
-        from opencart_client import OpenCartAPIClient
+        from opencart_client import OpenCartAPIClient, CatalogExportError
+        from async_opencart_client import AsyncOpenCartAPIClient
+        from catalog_mirror import CatalogMirror
+        from catalog_index import CatalogIndex
+        from catalog_features import ProductFeatures, build_product_features
         from config import config
 
 
@@ -67,17 +80,34 @@ class ProductMatch:
 class ProductComparator:
     """Enhanced product comparison with intelligent matching for audio equipment."""
     
-    def __init__(self, opencart_client: OpenCartAPIClient):
+    def __init__(self, opencart_client: OpenCartAPIClient,
+                 async_client: Optional[AsyncOpenCartAPIClient] = None,
+                 catalog_mirror: Optional[CatalogMirror] = None,
+                 full_scan: Optional[bool] = None):
         """
         Initialize the product comparator.
         
         Args:
             opencart_client: OpenCart API client instance
+            async_client: Async OpenCart client for concurrent lookups (optional)
+            catalog_mirror: Local catalog mirror to read products and searches from (optional)
+            full_scan: Score every existing product instead of indexed candidates
+                (defaults to config.match_full_scan)
         """
         self.opencart_client = opencart_client
+        self.async_client = async_client
+        self.catalog_mirror = catalog_mirror
         self.logger = logging.getLogger(__name__)
         self.existing_products = []
         self.existing_products_loaded = False
+        self.loaded_from_mirror = False
+        
+        # Candidate index over existing_products, built lazily after each load
+        self.full_scan = config.match_full_scan if full_scan is None else full_scan
+        self.catalog_index: Optional[CatalogIndex] = None
+        
+        # Search results fetched ahead of time by compare_products, keyed by term
+        self._prefetched_searches: Dict[str, Optional[List[Dict]]] = {}
         
         # Enhanced matching thresholds for audio equipment
         self.fuzzy_threshold = 0.75  # Lowered for better audio equipment matching
@@ -97,39 +127,55 @@ class ProductComparator:
             r'([A-Z]+\d+[A-Z]*[-_]?[A-Z]*)', # SM58, Beta57A
             r'([A-Z]{2,}[-_]?\d{2,}[-_]?[A-Z]*)', # QSC-K12, JBL-EON615
         ]
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Pickle the prepared comparator for comparison worker processes.
         
-        # Expanded audio equipment search terms
-        self.audio_search_terms = [
-            "", "Denon", "AKG", "Audio", "Speaker", "Amplifier", "Receiver", "DJ", "Polk", "Alpha",
-            # Audio brands
-            "JBL", "QSC", "Yamaha", "Pioneer", "Sony", "Marantz", "Onkyo", "Harman", "Shure",
-            "Sennheiser", "Audio-Technica", "Behringer", "Mackie", "PreSonus", "Focusrite",
-            # Product categories
-            "Microphone", "Headphones", "Subwoofer", "Monitor", "Mixer", "Interface", "Preamp",
-            "Turntable", "CDJ", "Controller", "Synthesizer", "Keyboard", "Studio", "Live",
-            # Audio terms
-            "Channel", "Wireless", "Bluetooth", "USB", "XLR", "TRS", "Phantom", "Condenser",
-            "Dynamic", "Ribbon", "Cardioid", "Omnidirectional", "Shotgun", "Lavalier",
-            # AV terms
-            "HDMI", "4K", "8K", "Dolby", "DTS", "Atmos", "Surround", "Theater", "Cinema",
-            "Streaming", "Network", "WiFi", "Ethernet", "Optical", "Coaxial", "Analog"
-        ]
+        Workers only score rows against the loaded catalog, so the API
+        clients and the catalog mirror are left out.
+        
+        Returns:
+            Dict[str, Any]: Instance state without I/O members
+        """
+        state = self.__dict__.copy()
+        for name in ('opencart_client', 'async_client', 'catalog_mirror'):
+            state[name] = None
+        return state
     
     def load_existing_products(self, force_reload: bool = False) -> bool:
         """
-        Load existing products from OpenCart with enhanced audio equipment search.
+        Load existing products from OpenCart via a paginated catalog export.
         
         Args:
             force_reload: Force reload even if already loaded
             
         Returns:
-            bool: True if products loaded successfully
+            bool: True if products loaded successfully, False if the catalog export
+                failed part-way (the previously loaded catalog, if any, is kept)
         """
         if self.existing_products_loaded and not force_reload:
             return True
         
+        self.catalog_index = None
+        self._prefetched_searches = {}
+        
         try:
-            self.logger.info("Loading existing products from OpenCart with enhanced audio search...")
+            # Read from the local catalog mirror when available
+            if self.catalog_mirror is not None:
+                if force_reload:
+                    # A forced reload re-exports everything so deleted products are pruned
+                    self.catalog_mirror.refresh(self.opencart_client, full=True)
+                if self.catalog_mirror.ensure_fresh(self.opencart_client):
+                    self.existing_products = self.catalog_mirror.get_all_products()
+                    self.logger.info(f"Loaded {len(self.existing_products)} products from the catalog mirror")
+                    self.existing_products_loaded = True
+                    self.loaded_from_mirror = True
+                    return True
+                self.logger.warning("Catalog mirror is empty and could not be refreshed, falling back to live export")
+            
+            self.loaded_from_mirror = False
+            self.logger.info("Loading existing products from OpenCart catalog export...")
             
             # Test connection first
             if not self.opencart_client.test_connection():
@@ -138,24 +184,16 @@ class ProductComparator:
                 self.existing_products_loaded = True
                 return True
             
-            # Fetch products using expanded audio equipment search terms
-            all_products = []
-            seen_product_ids = set()
-            
-            for term in self.audio_search_terms:
-                try:
-                    products = self.opencart_client.search_products(term)
-                    if products:
-                        # Deduplicate products by product_id
-                        for product in products:
-                            product_id = product.get('product_id')
-                            if product_id and product_id not in seen_product_ids:
-                                all_products.append(product)
-                                seen_product_ids.add(product_id)
-                        self.logger.info(f"Search term '{term}': found {len(products)} products, {len(all_products)} total unique")
-                except Exception as e:
-                    self.logger.warning(f"Error searching for term '{term}': {str(e)}")
-                    continue
+            # Export the full catalog in one paginated pass; a partial export is refused
+            try:
+                if self.async_client is not None:
+                    all_products = self.async_client.get_all_products_sync()
+                else:
+                    all_products = list(self.opencart_client.iter_all_products())
+            except CatalogExportError as e:
+                self.logger.error(f"{str(e)}; keeping the previously loaded catalog "
+                                  f"({len(self.existing_products)} products)")
+                return False
             
             if all_products:
                 self.logger.info(f"Successfully loaded {len(all_products)} unique products from OpenCart")
@@ -370,10 +408,19 @@ class ProductComparator:
         if not text1 or not text2:
             return 0.0
         
-        # Normalize both texts
-        norm_text1 = self.normalize_text(text1)
-        norm_text2 = self.normalize_text(text2)
+        return self._similarity_normalized(self.normalize_text(text1), self.normalize_text(text2))
+    
+    def _similarity_normalized(self, norm_text1: str, norm_text2: str) -> float:
+        """
+        Similarity between two already-normalized texts (see calculate_similarity).
         
+        Args:
+            norm_text1: First normalized text
+            norm_text2: Second normalized text
+            
+        Returns:
+            float: Similarity score (0.0 to 1.0)
+        """
         # Calculate sequence similarity
         base_similarity = SequenceMatcher(None, norm_text1, norm_text2).ratio()
         
@@ -450,8 +497,8 @@ class ProductComparator:
         Returns:
             ProductMatch: Best match result
         """
-        if not self.existing_products_loaded:
-            self.load_existing_products()
+        if not self.existing_products_loaded and not self.load_existing_products():
+            raise CatalogExportError("Existing products could not be loaded")
         
         parsed_name = parsed_product.get('name', '')
         parsed_model = parsed_product.get('model', '')
@@ -465,53 +512,47 @@ class ProductComparator:
         
         self.logger.debug(f"Finding match for: {parsed_name} (Model: {parsed_model}, SKU: {parsed_sku})")
         
-        # ENHANCED: Search for specific product model/name if not found in pre-loaded products
-        specific_search_products = []
-        search_terms = []
+        # Specific model/SKU searches: terms the local index cannot answer are
+        # fetched in one deferred, deduplicated step (see _resolve_search_terms)
+        search_terms = self._get_specific_search_terms(parsed_product)
+        self._resolve_search_terms([parsed_product])
         
-        # Add specific search terms from the parsed product
-        if parsed_model and len(parsed_model.strip()) > 2:
-            search_terms.append(parsed_model.strip())
-        if parsed_sku and len(parsed_sku.strip()) > 2:
-            search_terms.append(parsed_sku.strip())
-        
-        # Extract model numbers from name for additional searches
-        extracted_model = self.extract_model_number(parsed_name)
-        if extracted_model and extracted_model not in search_terms:
-            search_terms.append(extracted_model)
-        
-        # Perform specific searches for this product
+        specific_search_products: Dict[Any, Dict] = {}
         for search_term in search_terms:
-            try:
-                self.logger.info(f"Searching OpenCart for specific term: '{search_term}'")
-                products = self.opencart_client.search_products(search_term)
-                if products:
-                    self.logger.info(f"Found {len(products)} products for '{search_term}'")
-                    for product in products:
-                        # Avoid duplicates by checking product_id
-                        product_id = product.get('product_id')
-                        if not any(p.get('product_id') == product_id for p in specific_search_products):
-                            specific_search_products.append(product)
-                else:
-                    self.logger.info(f"No products found for '{search_term}'")
-            except Exception as e:
-                self.logger.warning(f"Error searching for '{search_term}': {str(e)}")
+            for product in self._prefetched_searches.get(search_term) or []:
+                specific_search_products.setdefault(product.get('product_id'), product)
+        
+        # Catalog products carry precomputed features (see CatalogIndex); search
+        # results already in the catalog are scored through the index
+        catalog_index = self._get_catalog_index()
+        extra_features = [
+            self._build_features(product)
+            for product in specific_search_products.values()
+            if not catalog_index.contains(product)
+        ]
+        
+        if self.full_scan:
+            # Fallback mode: score every pre-loaded product
+            candidate_features = catalog_index.features
+        else:
+            # Only score indexed candidates
+            candidate_features = catalog_index.candidates(parsed_name, parsed_model, parsed_sku)
         
-        # Combine pre-loaded products with specific search results
-        all_products_to_check = list(self.existing_products)
-        for product in specific_search_products:
-            # Avoid duplicates
-            product_id = product.get('product_id')
-            if not any(p.get('product_id') == product_id for p in all_products_to_check):
-                all_products_to_check.append(product)
+        candidates_checked = len(candidate_features) + len(extra_features)
+        self.logger.info(f"Checking against {candidates_checked} total products ({len(self.existing_products)} pre-loaded + {len(specific_search_products)} from specific search)")
         
-        self.logger.info(f"Checking against {len(all_products_to_check)} total products ({len(self.existing_products)} pre-loaded + {len(specific_search_products)} from specific search)")
+        # Normalize the parsed side once per row
+        normalized_parsed_sku = self.normalize_text(parsed_sku)
+        normalized_parsed_model = self.normalize_text(parsed_model)
+        normalized_parsed_name = self.normalize_text(parsed_name)
+        parsed_extracted = self.extract_model_number(parsed_name) or self.extract_model_number(parsed_model)
+        normalized_parsed_extracted = self.normalize_text(parsed_extracted) if parsed_extracted else ''
         
-        for existing_product in all_products_to_check:
+        for features in chain(candidate_features, extra_features):
+            existing_product = features.product
             existing_name = existing_product.get('name', '')
             existing_model = existing_product.get('model', '')
             existing_sku = existing_product.get('sku', '')
-            existing_price = self._parse_price(existing_product.get('price', 0))
             
             match_info = {
                 'existing_product': existing_product,
@@ -521,14 +562,14 @@ class ProductComparator:
             }
             
             # 1. Exact SKU match (highest priority)
-            if parsed_sku and existing_sku and self.normalize_text(parsed_sku) == self.normalize_text(existing_sku):
+            if parsed_sku and existing_sku and normalized_parsed_sku == features.normalized_sku:
                 match_info['match_type'] = MatchType.EXACT_SKU
                 match_info['total_score'] = 1.0
                 match_info['scores']['sku_exact'] = 1.0
                 self.logger.debug(f"Exact SKU match: {parsed_sku} == {existing_sku}")
             
             # 2. Exact model match
-            elif parsed_model and existing_model and self.normalize_text(parsed_model) == self.normalize_text(existing_model):
+            elif parsed_model and existing_model and normalized_parsed_model == features.normalized_model:
                 match_info['match_type'] = MatchType.EXACT_MODEL
                 match_info['total_score'] = 0.95
                 match_info['scores']['model_exact'] = 1.0
@@ -536,19 +577,19 @@ class ProductComparator:
             
             # 3. Enhanced model extraction and comparison
             elif parsed_model or existing_model:
-                parsed_extracted = self.extract_model_number(parsed_name) or self.extract_model_number(parsed_model)
-                existing_extracted = self.extract_model_number(existing_name) or self.extract_model_number(existing_model)
-                
-                if parsed_extracted and existing_extracted:
-                    if self.normalize_text(parsed_extracted) == self.normalize_text(existing_extracted):
+                if parsed_extracted and features.extracted_model:
+                    if normalized_parsed_extracted == features.extracted_model:
                         match_info['match_type'] = MatchType.MODEL_EXTRACTED
                         match_info['total_score'] = 0.9
                         match_info['scores']['model_extracted'] = 1.0
-                        self.logger.debug(f"Extracted model match: {parsed_extracted} == {existing_extracted}")
+                        self.logger.debug(f"Extracted model match: {parsed_extracted} == {features.extracted_model}")
             
             # 4. Enhanced fuzzy name matching
             if match_info['total_score'] < 0.8:  # Only if no strong match found
-                name_similarity = self.calculate_similarity(parsed_name, existing_name)
+                if parsed_name and existing_name:
+                    name_similarity = self._similarity_normalized(normalized_parsed_name, features.normalized_name)
+                else:
+                    name_similarity = 0.0
                 match_info['scores']['name_similarity'] = name_similarity
                 
                 if name_similarity >= self.fuzzy_threshold:
@@ -601,6 +642,7 @@ class ProductComparator:
         # Create debug info
         debug_info = {
             'total_products_checked': len(self.existing_products),
+            'candidates_checked': candidates_checked,
             'best_score': best_score,
             'all_matches': debug_matches[:5],  # Top 5 matches for debugging
             'model_extraction': {
@@ -621,6 +663,97 @@ class ProductComparator:
             debug_info=debug_info
         )
     
+    def _get_catalog_index(self) -> CatalogIndex:
+        """
+        Get the candidate index for the loaded catalog, building it on first use.
+        
+        Returns:
+            CatalogIndex: Index over existing_products
+        """
+        if self.catalog_index is None:
+            self.catalog_index = CatalogIndex(self.existing_products, self.normalize_text, self.extract_model_number)
+        return self.catalog_index
+    
+    def _build_features(self, product: Dict[str, Any]) -> ProductFeatures:
+        """
+        Compute matching features for a product outside the catalog index.
+        
+        Args:
+            product: Product data (e.g. a live search result)
+            
+        Returns:
+            ProductFeatures: Precomputed features
+        """
+        return build_product_features(product, self.normalize_text, self.extract_model_number)
+    
+    def _resolve_search_terms(self, parsed_products: List[Dict[str, Any]]) -> None:
+        """
+        Fetch the specific search terms the local catalog cannot answer.
+        
+        Terms whose canonical model/SKU is already in the catalog index need
+        no live search. The remaining terms are deduplicated and fetched in a
+        single step (concurrently when an async client is available) into
+        _prefetched_searches. Nothing is fetched when the catalog comes from
+        the local mirror, which already holds the whole store.
+        
+        Args:
+            parsed_products: Parsed products whose search terms to resolve
+        """
+        if self.loaded_from_mirror:
+            return
+        
+        catalog_index = self._get_catalog_index()
+        missing_terms = {}
+        for parsed_product in parsed_products:
+            for term in self._get_specific_search_terms(parsed_product):
+                if term in self._prefetched_searches or term in missing_terms:
+                    continue
+                if not catalog_index.lookup(term):
+                    missing_terms[term] = None
+        
+        if not missing_terms:
+            return
+        
+        self.logger.info(f"Fetching {len(missing_terms)} search terms missing from the local catalog")
+        if self.async_client is not None:
+            results = self.async_client.search_products_many_sync(list(missing_terms))
+        else:
+            results = {}
+            for term in missing_terms:
+                try:
+                    results[term] = self.opencart_client.search_products(term)
+                except Exception as e:
+                    self.logger.warning(f"Error searching for '{term}': {str(e)}")
+                    results[term] = None
+        self._prefetched_searches.update(results)
+    
+    def _get_specific_search_terms(self, parsed_product: Dict[str, Any]) -> List[str]:
+        """
+        Build the OpenCart search terms used to look up a parsed product.
+        
+        Args:
+            parsed_product: Parsed product data
+            
+        Returns:
+            List[str]: Model, SKU and extracted model search terms
+        """
+        search_terms = []
+        parsed_model = parsed_product.get('model', '')
+        parsed_sku = parsed_product.get('sku', '')
+        
+        # Add specific search terms from the parsed product
+        if parsed_model and len(parsed_model.strip()) > 2:
+            search_terms.append(parsed_model.strip())
+        if parsed_sku and len(parsed_sku.strip()) > 2:
+            search_terms.append(parsed_sku.strip())
+        
+        # Extract model numbers from name for additional searches
+        extracted_model = self.extract_model_number(parsed_product.get('name', ''))
+        if extracted_model and extracted_model not in search_terms:
+            search_terms.append(extracted_model)
+        
+        return search_terms
+    
     def _parse_price(self, price_value: Any) -> Optional[float]:
         """
         Enhanced price parsing for various formats.
@@ -750,26 +883,46 @@ class ProductComparator:
         
         return issues
     
-    def compare_products(self, parsed_products: List[Dict[str, Any]]) -> List[ProductMatch]:
+    def prepare_comparison(self, parsed_products: List[Dict[str, Any]]) -> bool:
         """
-        Compare a list of parsed products against existing products.
+        Load the catalog, build its index and fetch unresolved search terms.
+        
+        After this, find_best_match answers every row in parsed_products from
+        local state only, so rows can be scored in any order or process.
         
         Args:
-            parsed_products: List of parsed product data
+            parsed_products: Parsed products that are about to be compared
             
         Returns:
-            List[ProductMatch]: List of product matches
+            bool: True if the existing products were loaded
         """
-        self.logger.info(f"Starting enhanced comparison of {len(parsed_products)} parsed products")
-        
-        # Ensure existing products are loaded
         if not self.load_existing_products():
             self.logger.error("Failed to load existing products")
-            return []
+            return False
+        
+        self._get_catalog_index()
+        
+        # Fetch every row's unresolved search terms in one step up front
+        self._resolve_search_terms(parsed_products)
+        return True
+    
+    def compare_rows(self, parsed_products: List[Dict[str, Any]], offset: int = 0,
+                     total: Optional[int] = None) -> List[ProductMatch]:
+        """
+        Match parsed rows against the prepared catalog (see prepare_comparison).
         
+        Args:
+            parsed_products: Parsed rows to match
+            offset: Position of the first row in the full comparison (for logging)
+            total: Number of rows in the full comparison (for logging)
+            
+        Returns:
+            List[ProductMatch]: Matches in input order
+        """
+        total = total or len(parsed_products)
         matches = []
-        for i, parsed_product in enumerate(parsed_products):
-            self.logger.info(f"Comparing product {i+1}/{len(parsed_products)}: {parsed_product.get('name', 'Unknown')}")
+        for i, parsed_product in enumerate(parsed_products, start=offset):
+            self.logger.info(f"Comparing product {i+1}/{total}: {parsed_product.get('name', 'Unknown')}")
             
             match = self.find_best_match(parsed_product)
             matches.append(match)
@@ -785,6 +938,30 @@ class ProductComparator:
         
         return matches
     
+    def compare_products(self, parsed_products: List[Dict[str, Any]]) -> List[ProductMatch]:
+        """
+        Compare a list of parsed products against existing products.
+        
+        Args:
+            parsed_products: List of parsed product data
+            
+        Returns:
+            List[ProductMatch]: List of product matches
+        """
+        self.logger.info(f"Starting enhanced comparison of {len(parsed_products)} parsed products")
+        
+        if not self.prepare_comparison(parsed_products):
+            return []
+        
+        matches = self.compare_rows(parsed_products)
+        
+        self.finish_comparison()
+        return matches
+    
+    def finish_comparison(self) -> None:
+        """Drop the search results prefetched by prepare_comparison."""
+        self._prefetched_searches = {}
+    
     def get_comparison_summary(self, matches: List[ProductMatch]) -> Dict[str, Any]:
         """
         Generate a summary of comparison results.
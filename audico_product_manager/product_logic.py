@@ -6,6 +6,7 @@ This module handles the business logic for product processing, including
 data transformation, validation, and synchronization with OpenCart.
 """
 
+import asyncio
 import logging
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
@@ -17,15 +18,21 @@ from decimal import Decimal, InvalidOperation
 try:
     from audico_product_manager.docai_parser import ProductData
     from audico_product_manager.opencart_client import OpenCartProduct, OpenCartAPIClient
+    from audico_product_manager.async_opencart_client import AsyncOpenCartAPIClient
+    from audico_product_manager.catalog_mirror import CatalogMirror
     from audico_product_manager.config import config
 except ImportError:
     try:
         from .docai_parser import ProductData
         from .opencart_client import OpenCartProduct, OpenCartAPIClient
+        from .async_opencart_client import AsyncOpenCartAPIClient
+        from .catalog_mirror import CatalogMirror
         from .config import config
     except ImportError:
         from docai_parser import ProductData
         from opencart_client import OpenCartProduct, OpenCartAPIClient
+        from async_opencart_client import AsyncOpenCartAPIClient
+        from catalog_mirror import CatalogMirror
         from config import config
 
 
@@ -49,14 +56,20 @@ class ProductSyncResult:
 class ProductSynchronizer:
     """Handles product synchronization between parsed data and OpenCart."""
     
-    def __init__(self, opencart_client: OpenCartAPIClient):
+    def __init__(self, opencart_client: OpenCartAPIClient,
+                 async_client: Optional[AsyncOpenCartAPIClient] = None,
+                 catalog_mirror: Optional[CatalogMirror] = None):
         """
         Initialize the product synchronizer.
         
         Args:
             opencart_client: OpenCart API client instance
+            async_client: Async OpenCart client used for concurrent batch syncs (optional)
+            catalog_mirror: Local catalog mirror used for lookups before hitting the store (optional)
         """
         self.opencart_client = opencart_client
+        self.async_client = async_client
+        self.catalog_mirror = catalog_mirror
         self.logger = logging.getLogger(__name__)
         
         # Cache for categories and manufacturers
@@ -71,7 +84,9 @@ class ProductSynchronizer:
             Dict[str, int]: Mapping of category names to IDs
         """
         if self._categories_cache is None:
-            categories = self.opencart_client.get_categories()
+            categories = self.catalog_mirror.get_categories() if self.catalog_mirror is not None else None
+            if not categories:
+                categories = self.opencart_client.get_categories()
             if categories:
                 self._categories_cache = {
                     cat.get('name', '').lower(): int(cat.get('category_id', 0))
@@ -91,7 +106,9 @@ class ProductSynchronizer:
             Dict[str, int]: Mapping of manufacturer names to IDs
         """
         if self._manufacturers_cache is None:
-            manufacturers = self.opencart_client.get_manufacturers()
+            manufacturers = self.catalog_mirror.get_manufacturers() if self.catalog_mirror is not None else None
+            if not manufacturers:
+                manufacturers = self.opencart_client.get_manufacturers()
             if manufacturers:
                 self._manufacturers_cache = {
                     mfr.get('name', '').lower(): int(mfr.get('manufacturer_id', 0))
@@ -274,6 +291,31 @@ class ProductSynchronizer:
             self.logger.error(f"Error converting product data: {str(e)}")
             return None
     
+    def _get_mirrored_product(self, model: str) -> Optional[Dict]:
+        """
+        Look a product up in the local catalog mirror.
+        
+        Args:
+            model: Product model/SKU
+            
+        Returns:
+            Dict: Mirrored product data or None if not mirrored
+        """
+        if self.catalog_mirror is None:
+            return None
+        return self.catalog_mirror.get_product_by_model(model)
+    
+    def _record_in_mirror(self, product_id: Any, opencart_product: OpenCartProduct) -> None:
+        """
+        Record a product written to OpenCart in the local catalog mirror.
+        
+        Args:
+            product_id: OpenCart product ID
+            opencart_product: The product that was written
+        """
+        if self.catalog_mirror is not None:
+            self.catalog_mirror.record_product(product_id, opencart_product.to_dict())
+    
     def sync_product(self, product_data: ProductData) -> ProductSyncResult:
         """
         Synchronize a single product with OpenCart.
@@ -293,8 +335,10 @@ class ProductSynchronizer:
                     error_message="Failed to convert product data"
                 )
             
-            # Check if product already exists
-            existing_product = self.opencart_client.get_product_by_model(opencart_product.model)
+            # Check if product already exists (local mirror first, then the store)
+            existing_product = self._get_mirrored_product(opencart_product.model)
+            if existing_product is None:
+                existing_product = self.opencart_client.get_product_by_model(opencart_product.model)
             
             if existing_product:
                 # Update existing product
@@ -302,6 +346,7 @@ class ProductSynchronizer:
                 result = self.opencart_client.update_product(product_id, opencart_product)
                 
                 if result:
+                    self._record_in_mirror(product_id, opencart_product)
                     return ProductSyncResult(
                         action=ProductAction.UPDATE,
                         product_data=result,
@@ -318,6 +363,7 @@ class ProductSynchronizer:
                 
                 if result:
                     product_id = result.get('product_id')
+                    self._record_in_mirror(product_id, opencart_product)
                     return ProductSyncResult(
                         action=ProductAction.CREATE,
                         product_data=result,
@@ -340,20 +386,25 @@ class ProductSynchronizer:
         """
         Synchronize a batch of products with OpenCart.
         
+        When an async client is configured the lookups and writes for all
+        products are issued concurrently; otherwise products are synced one
+        after another.
+        
         Args:
             products_data: List of parsed product data
             
         Returns:
             List[ProductSyncResult]: Results of the synchronization
         """
-        results = []
+        if self.async_client is not None:
+            results = self.async_client.run(self._sync_products_batch_async, products_data)
+        else:
+            results = []
+            for i, product_data in enumerate(products_data):
+                self.logger.info(f"Syncing product {i+1}/{len(products_data)}: {product_data.name}")
+                results.append(self.sync_product(product_data))
         
-        for i, product_data in enumerate(products_data):
-            self.logger.info(f"Syncing product {i+1}/{len(products_data)}: {product_data.name}")
-            
-            result = self.sync_product(product_data)
-            results.append(result)
-            
+        for product_data, result in zip(products_data, results):
             # Log result
             if result.action == ProductAction.CREATE:
                 self.logger.info(f"Created product: {product_data.name}")
@@ -364,6 +415,116 @@ class ProductSynchronizer:
         
         return results
     
+    async def _sync_products_batch_async(self, products_data: List[ProductData]) -> List[ProductSyncResult]:
+        """
+        Synchronize a batch of products concurrently through the async client.
+        
+        Args:
+            products_data: List of parsed product data
+            
+        Returns:
+            List[ProductSyncResult]: Results in the same order as products_data
+        """
+        # Warm the category/manufacturer caches in parallel before converting
+        if self.catalog_mirror is not None:
+            # SQLite reads run in a worker thread, off the event loop
+            await asyncio.to_thread(self._get_categories)
+            await asyncio.to_thread(self._get_manufacturers)
+        if self._categories_cache is None or self._manufacturers_cache is None:
+            categories, manufacturers = await asyncio.gather(
+                self.async_client.get_categories(),
+                self.async_client.get_manufacturers()
+            )
+            if self._categories_cache is None:
+                self._categories_cache = {
+                    cat.get('name', '').lower(): int(cat.get('category_id', 0))
+                    for cat in categories or []
+                    if cat.get('name') and cat.get('category_id')
+                }
+            if self._manufacturers_cache is None:
+                self._manufacturers_cache = {
+                    mfr.get('name', '').lower(): int(mfr.get('manufacturer_id', 0))
+                    for mfr in manufacturers or []
+                    if mfr.get('name') and mfr.get('manufacturer_id')
+                }
+        
+        # Rows sharing a model are synced one after another, so a later row
+        # finds the product an earlier one created instead of creating a duplicate
+        model_groups: Dict[str, List[int]] = {}
+        for index, product_data in enumerate(products_data):
+            key = (product_data.model or '').strip().casefold() or f"#{index}"
+            model_groups.setdefault(key, []).append(index)
+        
+        results: List[Optional[ProductSyncResult]] = [None] * len(products_data)
+        
+        async def sync_group(indexes: List[int]) -> None:
+            for index in indexes:
+                results[index] = await self._sync_product_async(products_data[index])
+        
+        self.logger.info(f"Syncing {len(products_data)} products ({len(model_groups)} models) concurrently "
+                         f"(max {self.async_client.max_concurrency} in flight)")
+        await asyncio.gather(*(sync_group(indexes) for indexes in model_groups.values()))
+        return results
+    
+    async def _sync_product_async(self, product_data: ProductData) -> ProductSyncResult:
+        """
+        Synchronize a single product with OpenCart through the async client.
+        
+        Args:
+            product_data: Parsed product data
+            
+        Returns:
+            ProductSyncResult: Result of the synchronization
+        """
+        try:
+            # Convert to OpenCart product format
+            opencart_product = self.convert_to_opencart_product(product_data)
+            if not opencart_product:
+                return ProductSyncResult(
+                    action=ProductAction.ERROR,
+                    error_message="Failed to convert product data"
+                )
+            
+            # Check if product already exists (mirror reads are SQLite, kept off the event loop)
+            existing_product = await asyncio.to_thread(self._get_mirrored_product, opencart_product.model)
+            if existing_product is None:
+                existing_product = await self.async_client.get_product_by_model(opencart_product.model)
+            
+            if existing_product:
+                product_id = existing_product.get('product_id')
+                result = await self.async_client.update_product(product_id, opencart_product)
+                if result:
+                    await asyncio.to_thread(self._record_in_mirror, product_id, opencart_product)
+                    return ProductSyncResult(
+                        action=ProductAction.UPDATE,
+                        product_data=result,
+                        opencart_product_id=product_id
+                    )
+                return ProductSyncResult(
+                    action=ProductAction.ERROR,
+                    error_message="Failed to update existing product"
+                )
+            
+            result = await self.async_client.create_product(opencart_product)
+            if result:
+                await asyncio.to_thread(self._record_in_mirror, result.get('product_id'), opencart_product)
+                return ProductSyncResult(
+                    action=ProductAction.CREATE,
+                    product_data=result,
+                    opencart_product_id=result.get('product_id')
+                )
+            return ProductSyncResult(
+                action=ProductAction.ERROR,
+                error_message="Failed to create new product"
+            )
+                    
+        except Exception as e:
+            self.logger.error(f"Error syncing product {product_data.name}: {str(e)}")
+            return ProductSyncResult(
+                action=ProductAction.ERROR,
+                error_message=str(e)
+            )
+    
     def get_sync_summary(self, results: List[ProductSyncResult]) -> Dict[str, Any]:
         """
         Generate a summary of synchronization results.
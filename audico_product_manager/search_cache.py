@@ -0,0 +1,273 @@
+"""
+Search response cache for Audico Product Manager.
+
+This module provides an in-process LRU + TTL cache for OpenCart product
+searches, keyed on the normalized search term. Concurrent lookups for the
+same term (e.g. parallel Flask requests, or concurrent coroutines of the
+async client) are coalesced into a single fetch.
+"""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+# Use absolute import that works when running directly
+try:
+    from audico_product_manager.config import config
+except ImportError:
+    try:
+        from .config import config
+    except ImportError:
+        from config import config
+
+
+class _InFlight:
+    """A fetch in progress that other callers (threads or coroutines) can wait on."""
+
+    __slots__ = ('event', 'result', 'waiters')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        # Futures of coroutines waiting on the fetch, each bound to its own event loop
+        self.waiters: List[asyncio.Future] = []
+
+    def finish(self, result: Optional[List[Dict]]) -> None:
+        """Publish the result and wake every waiting thread and coroutine."""
+        self.result = result
+        self.event.set()
+        for future in self.waiters:
+            future.get_loop().call_soon_threadsafe(_wake, future)
+
+
+def _wake(future: asyncio.Future) -> None:
+    """Resolve a waiter's future unless it was cancelled."""
+    if not future.done():
+        future.set_result(None)
+
+
+class SearchCache:
+    """Thread-safe LRU + TTL cache for product search results with single-flight fetches."""
+
+    def __init__(self, max_entries: Optional[int] = None, ttl: Optional[float] = None):
+        """
+        Initialize the search cache.
+
+        Args:
+            max_entries: Maximum number of cached search terms
+            ttl: Seconds a cached result stays valid
+        """
+        self.max_entries = max_entries if max_entries is not None else config.search_cache_size
+        self.ttl = ttl if ttl is not None else config.search_cache_ttl
+
+        self._entries: "OrderedDict[str, Tuple[float, List[Dict]]]" = OrderedDict()
+        self._in_flight: Dict[str, _InFlight] = {}
+        self._lock = threading.Lock()
+
+        # Bumped on invalidation so fetches started before a write are not stored
+        self._generation = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def normalize_term(search_term: str) -> str:
+        """
+        Normalize a search term for use as a cache key.
+
+        Args:
+            search_term: Raw search term
+
+        Returns:
+            str: Lowercased term with collapsed whitespace
+        """
+        return ' '.join(str(search_term).lower().split())
+
+    def _lookup(self, key: str) -> Optional[List[Dict]]:
+        """Return a fresh cached value (caller holds the lock)."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def _store(self, key: str, value: List[Dict]) -> None:
+        """Store a value and evict the least recently used entries (caller holds the lock)."""
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def get(self, search_term: str) -> Optional[List[Dict]]:
+        """
+        Get a cached search result without fetching.
+
+        Args:
+            search_term: Search term
+
+        Returns:
+            List[Dict]: Copy of the cached products or None on a miss
+        """
+        with self._lock:
+            value = self._lookup(self.normalize_term(search_term))
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return list(value)
+
+    def put(self, search_term: str, value: Optional[List[Dict]]) -> None:
+        """
+        Cache a search result. Failed searches (None) are not cached.
+
+        Args:
+            search_term: Search term
+            value: Products returned by the search
+        """
+        if value is None or self.max_entries <= 0:
+            return
+        with self._lock:
+            self._store(self.normalize_term(search_term), list(value))
+
+    def _join(self, key: str, loop: Optional[asyncio.AbstractEventLoop] = None) -> Tuple[
+            Optional[List[Dict]], Optional[_InFlight], bool, int, Optional[asyncio.Future]]:
+        """
+        Look up a key, joining or starting its in-flight fetch on a miss.
+
+        Args:
+            key: Normalized search term
+            loop: Event loop of a coroutine caller, which waits on a future instead of the thread event
+
+        Returns:
+            Tuple: Cached copy (None on a miss), in-flight fetch (None on a hit),
+                whether the caller leads the fetch, cache generation and the
+                coroutine caller's wait future
+        """
+        with self._lock:
+            value = self._lookup(key)
+            if value is not None:
+                self.hits += 1
+                return list(value), None, False, self._generation, None
+
+            flight = self._in_flight.get(key)
+            if flight is None:
+                flight = _InFlight()
+                self._in_flight[key] = flight
+                self.misses += 1
+                return None, flight, True, self._generation, None
+
+            self.coalesced += 1
+            waiter = None
+            if loop is not None:
+                waiter = loop.create_future()
+                flight.waiters.append(waiter)
+            return None, flight, False, self._generation, waiter
+
+    def _land(self, key: str, flight: _InFlight, result: Optional[List[Dict]], generation: int) -> None:
+        """Store a leader's result unless the cache was invalidated meanwhile, then wake its waiters."""
+        with self._lock:
+            del self._in_flight[key]
+            if result is not None and generation == self._generation and self.max_entries > 0:
+                self._store(key, list(result))
+        flight.finish(result)
+
+    def get_or_fetch(self, search_term: str,
+                     fetch: Callable[[], Optional[List[Dict]]]) -> Optional[List[Dict]]:
+        """
+        Get a search result, fetching it at most once across concurrent callers.
+
+        Args:
+            search_term: Search term
+            fetch: Callable performing the actual search
+
+        Returns:
+            List[Dict]: Products (a copy) or None if the fetch failed
+        """
+        key = self.normalize_term(search_term)
+        value, flight, is_leader, generation, _ = self._join(key)
+        if flight is None:
+            return value
+
+        if not is_leader:
+            flight.event.wait()
+            return list(flight.result) if flight.result is not None else None
+
+        result = None
+        try:
+            result = fetch()
+        finally:
+            self._land(key, flight, result, generation)
+
+        return list(result) if result is not None else None
+
+    async def async_get_or_fetch(self, search_term: str,
+                                 fetch: Callable[[], Awaitable[Optional[List[Dict]]]]) -> Optional[List[Dict]]:
+        """
+        Coroutine counterpart of get_or_fetch that waits without blocking the event loop.
+
+        Coroutines and threads looking up the same term share one fetch, and
+        a result fetched across an invalidation is not stored.
+
+        Args:
+            search_term: Search term
+            fetch: Coroutine function performing the actual search
+
+        Returns:
+            List[Dict]: Products (a copy) or None if the fetch failed
+        """
+        key = self.normalize_term(search_term)
+        value, flight, is_leader, generation, waiter = self._join(key, asyncio.get_running_loop())
+        if flight is None:
+            return value
+
+        if not is_leader:
+            await waiter
+            return list(flight.result) if flight.result is not None else None
+
+        result = None
+        try:
+            result = await fetch()
+        finally:
+            self._land(key, flight, result, generation)
+
+        return list(result) if result is not None else None
+
+    def invalidate(self) -> None:
+        """Drop all cached searches, e.g. after a product write."""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+            self.invalidations += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict[str, Any]: Hit/miss counters and current size
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'ttl_seconds': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'coalesced': self.coalesced,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0
+            }
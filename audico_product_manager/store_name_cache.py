@@ -0,0 +1,191 @@
+"""
+Persistent store-name cache for Audico Product Manager.
+
+This module keeps GPT-generated store names in a local SQLite database keyed
+by a hash of the normalized prompt inputs, so re-processing a supplier
+pricelist only calls the model for lines that actually changed.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+# Use absolute import that works when running directly
+try:
+    from audico_product_manager.config import config
+except ImportError:
+    try:
+        from .config import config
+    except ImportError:
+        from config import config
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS store_names (
+    cache_key TEXT PRIMARY KEY,
+    store_name TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_store_names_last_used ON store_names (last_used);
+"""
+
+# Prompt inputs that determine the generated name
+KEY_FIELDS = ('raw_name', 'model', 'description', 'extracted_brand', 'detected_category', 'specifications')
+
+
+def _normalize_value(value: Any) -> Any:
+    """Casefold strings and collapse their whitespace, recursing into dicts."""
+    if isinstance(value, dict):
+        return {str(k): _normalize_value(v) for k, v in value.items()}
+    return ' '.join(str(value or '').casefold().split())
+
+
+class StoreNameCache:
+    """SQLite-backed LRU cache of generated store names with hit-rate statistics."""
+
+    def __init__(self, db_path: Optional[str] = None, max_entries: Optional[int] = None):
+        """
+        Initialize the store-name cache.
+
+        Args:
+            db_path: SQLite database path
+            max_entries: Maximum cached names; least recently used names are evicted
+        """
+        self.db_path = db_path or config.store_name_cache_path
+        self.max_entries = max_entries if max_entries is not None else config.store_name_cache_size
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection for one unit of work, committing on success."""
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    @staticmethod
+    def make_key(context: Dict[str, Any], prompt_version: str) -> str:
+        """
+        Build the cache key for a naming prompt.
+
+        Args:
+            context: Prompt context from StoreNameGenerator._prepare_context
+            prompt_version: Version of the naming prompt
+
+        Returns:
+            str: SHA-256 hex digest of the normalized prompt inputs
+        """
+        inputs = {field: _normalize_value(context.get(field)) for field in KEY_FIELDS}
+        inputs['prompt_version'] = prompt_version
+        payload = json.dumps(inputs, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, cache_key: str) -> Optional[str]:
+        """
+        Get a cached store name.
+
+        Args:
+            cache_key: Key from make_key
+
+        Returns:
+            str: Cached store name or None on a miss
+        """
+        try:
+            with self._connect() as conn:
+                row = conn.execute("SELECT store_name FROM store_names WHERE cache_key = ?",
+                                   (cache_key,)).fetchone()
+                if row:
+                    conn.execute("UPDATE store_names SET last_used = ? WHERE cache_key = ?",
+                                 (time.time(), cache_key))
+        except sqlite3.Error as e:
+            self.logger.warning(f"Store name cache read failed: {str(e)}")
+            row = None
+
+        with self._lock:
+            if row:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return row[0] if row else None
+
+    def put(self, cache_key: str, store_name: str) -> None:
+        """
+        Cache a store name, evicting the least recently used names over the size limit.
+
+        Args:
+            cache_key: Key from make_key
+            store_name: Generated store name
+        """
+        if self.max_entries <= 0:
+            return
+
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO store_names (cache_key, store_name, created_at, last_used) "
+                    "VALUES (?, ?, ?, ?)",
+                    (cache_key, store_name, now, now)
+                )
+                overflow = conn.execute("SELECT COUNT(*) FROM store_names").fetchone()[0] - self.max_entries
+                if overflow > 0:
+                    conn.execute(
+                        "DELETE FROM store_names WHERE cache_key IN "
+                        "(SELECT cache_key FROM store_names ORDER BY last_used LIMIT ?)",
+                        (overflow,)
+                    )
+        except sqlite3.Error as e:
+            self.logger.warning(f"Store name cache write failed: {str(e)}")
+            return
+
+        with self._lock:
+            self.writes += 1
+            self.evictions += max(0, overflow)
+
+    def clear(self) -> None:
+        """Drop all cached store names, e.g. after changing the naming prompt."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM store_names")
+
+    def entry_count(self) -> int:
+        """Get the number of cached store names."""
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM store_names").fetchone()[0]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict[str, Any]: Hit/miss counters and current size
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            stats = {
+                'enabled': True,
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'writes': self.writes,
+                'evictions': self.evictions,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0
+            }
+        stats['entries'] = self.entry_count()
+        return stats
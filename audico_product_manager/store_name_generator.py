@@ -6,36 +6,77 @@ This module provides GPT-4 powered generation of OpenCart-friendly product names
 that follow store conventions and improve product matching accuracy.
 """
 
+import json
 import logging
 import re
-from typing import Dict, Any, Optional, List
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Any, Optional, List, Iterator
 from openai import OpenAI
 import os
 
 try:
     from audico_product_manager.config import config
     from audico_product_manager.docai_parser import ProductData
+    from audico_product_manager.store_name_cache import StoreNameCache
+    from audico_product_manager.naming_memo import NamingMemo
+    from audico_product_manager.naming_engine import NamingEngine, NamingJob, OpenAINamingProvider
 except ImportError:
     try:
         from .config import config
         from .docai_parser import ProductData
+        from .store_name_cache import StoreNameCache
+        from .naming_memo import NamingMemo
+        from .naming_engine import NamingEngine, NamingJob, OpenAINamingProvider
     except ImportError:
         from config import config
         from docai_parser import ProductData
+        from store_name_cache import StoreNameCache
+        from naming_memo import NamingMemo
+        from naming_engine import NamingEngine, NamingJob, OpenAINamingProvider
 
 
 class StoreNameGenerator:
     """Generates OpenCart-friendly product names using GPT-4."""
     
-    def __init__(self, openai_api_key: Optional[str] = None):
+    # Part of every cache key; bump whenever the naming prompt or examples change
+    NAMING_PROMPT_VERSION = '1'
+    
+    # Completion tokens reserved per product in a batched naming request
+    BATCH_OUTPUT_TOKENS_PER_ITEM = 40
+    
+    def __init__(self, openai_api_key: Optional[str] = None, name_cache: Optional[StoreNameCache] = None,
+                 use_cache: Optional[bool] = None, naming_engine: Optional[NamingEngine] = None):
         """
         Initialize the store name generator.
         
         Args:
             openai_api_key: OpenAI API key (optional, will use config/env if not provided)
+            name_cache: Persistent cache of generated names (optional, created from config)
+            use_cache: Read and write the name cache (defaults to STORE_NAME_CACHE_ENABLED)
+            naming_engine: Concurrent engine for batch naming (optional, created for OpenAI when a key is set)
         """
         self.logger = logging.getLogger(__name__)
         
+        # Persistent cache of GPT-generated names
+        self.use_cache = config.store_name_cache_enabled if use_cache is None else use_cache
+        self.name_cache = (name_cache or StoreNameCache()) if self.use_cache else None
+        
+        # Names generated during the current processing run (see naming_run). The
+        # generator is shared by concurrent Flask requests, so the memo lives in
+        # the run's context rather than on the instance.
+        self._run_memo: ContextVar[Optional[NamingMemo]] = ContextVar(f"store_name_run_memo_{id(self)}",
+                                                                      default=None)
+        
+        # GPT-4 round-trips and token usage
+        self.request_stats = {
+            'requests': 0,
+            'batched_requests': 0,
+            'batched_products': 0,
+            'prompt_tokens': 0,
+            'completion_tokens': 0
+        }
+        
         # Initialize OpenAI client
         api_key = openai_api_key or getattr(config, 'openai_api_key', None) or os.getenv('OPENAI_API_KEY')
         if not api_key:
@@ -44,6 +85,11 @@ class StoreNameGenerator:
         else:
             self.openai_client = OpenAI(api_key=api_key)
         
+        # Concurrent, rate-limited naming for batch_generate_store_names
+        if naming_engine is None and api_key:
+            naming_engine = NamingEngine(OpenAINamingProvider(api_key))
+        self.naming_engine = naming_engine
+        
         # Store naming patterns and examples
         self.naming_patterns = {
             'av_receiver': 'Brand Model - X.X Channel AV Receiver Description',
@@ -80,12 +126,62 @@ class StoreNameGenerator:
             'focusrite': 'Focusrite'
         }
     
-    def generate_store_name(self, product_data: ProductData) -> str:
+    @property
+    def run_memo(self) -> Optional[NamingMemo]:
+        """Memo of the naming run active in the calling thread or task, if any."""
+        return self._run_memo.get()
+    
+    @contextmanager
+    def naming_run(self) -> Iterator[NamingMemo]:
+        """
+        Name each product at most once until the block exits.
+        
+        Every stage of a processing run that asks this generator for a name
+        gets the name generated the first time the product was seen. Runs in
+        other threads (e.g. concurrent requests) each get their own memo.
+        
+        Yields:
+            NamingMemo: Memo shared by all stages of the run
+        """
+        run_memo = NamingMemo()
+        token = self._run_memo.set(run_memo)
+        try:
+            yield run_memo
+        finally:
+            self._run_memo.reset(token)
+            stats = run_memo.get_stats()
+            self.logger.info(f"Named {stats['products_named']} products, "
+                             f"avoided {stats['llm_calls_avoided']} LLM calls this run")
+    
+    def generate_store_name(self, product_data: ProductData, bypass_cache: bool = False) -> str:
         """
         Generate an OpenCart-friendly store name for a product.
         
         Args:
             product_data: Product data from extraction
+            bypass_cache: Call GPT-4 even if the name is cached (the new name is still cached)
+            
+        Returns:
+            str: Generated store-friendly name
+        """
+        run_memo = self.run_memo
+        if run_memo is None:
+            return self._generate_store_name(product_data, bypass_cache)
+        
+        memo_key = NamingMemo.product_key(product_data.name, product_data.model)
+        store_name = run_memo.get(memo_key)
+        if store_name is None:
+            store_name = self._generate_store_name(product_data, bypass_cache)
+            run_memo.put(memo_key, store_name)
+        return store_name
+    
+    def _generate_store_name(self, product_data: ProductData, bypass_cache: bool = False) -> str:
+        """
+        Generate a store name from the persistent cache, GPT-4 or the fallback rules.
+        
+        Args:
+            product_data: Product data from extraction
+            bypass_cache: Skip the persistent cache lookup
             
         Returns:
             str: Generated store-friendly name
@@ -98,11 +194,23 @@ class StoreNameGenerator:
             # Prepare context for GPT-4
             context = self._prepare_context(product_data)
             
+            # Reuse the name generated for identical prompt inputs
+            cache_key = None
+            if self.name_cache is not None:
+                cache_key = StoreNameCache.make_key(context, self.NAMING_PROMPT_VERSION)
+                if not bypass_cache:
+                    cached_name = self.name_cache.get(cache_key)
+                    if cached_name:
+                        self.logger.debug(f"Cached store name: '{cached_name}' for product: '{product_data.name}'")
+                        return cached_name
+            
             # Generate store name using GPT-4
             store_name = self._call_gpt4_for_naming(context)
             
             if store_name:
                 self.logger.info(f"Generated store name: '{store_name}' for product: '{product_data.name}'")
+                if cache_key:
+                    self.name_cache.put(cache_key, store_name)
                 return store_name
             else:
                 self.logger.warning("GPT-4 failed to generate name, using fallback")
@@ -266,22 +374,21 @@ class StoreNameGenerator:
         
         return specs
     
-    def _call_gpt4_for_naming(self, context: Dict[str, Any]) -> Optional[str]:
+    def _build_naming_job(self, context: Dict[str, Any]) -> NamingJob:
         """
-        Call GPT-4 to generate store-friendly product name.
+        Build the single-product GPT-4 naming request.
         
         Args:
             context: Context for name generation
             
         Returns:
-            str: Generated name or None if failed
+            NamingJob: Chat messages and sampling parameters
         """
-        try:
-            # Prepare examples for few-shot learning
-            examples = self._get_naming_examples()
-            
-            # Create prompt
-            prompt = f"""You are an expert at creating product names for an audio equipment online store. Your task is to convert technical product specifications into customer-friendly product names that follow consistent naming patterns.
+        # Prepare examples for few-shot learning
+        examples = self._get_naming_examples()
+        
+        # Create prompt
+        prompt = f"""You are an expert at creating product names for an audio equipment online store. Your task is to convert technical product specifications into customer-friendly product names that follow consistent naming patterns.
 
 NAMING PATTERNS:
 - AV Receivers: "Brand Model - X.X Channel AV Receiver [Key Features]"
@@ -310,29 +417,171 @@ REQUIREMENTS:
 6. Use proper capitalization and formatting
 
 Generate ONLY the product name, nothing else:"""
-
+        
+        return NamingJob(
+            messages=[
+                {"role": "system", "content": "You are an expert product naming specialist for audio equipment stores."},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=100,
+            temperature=0.3
+        )
+    
+    def _call_gpt4_for_naming(self, context: Dict[str, Any]) -> Optional[str]:
+        """
+        Call GPT-4 to generate store-friendly product name.
+        
+        Args:
+            context: Context for name generation
+            
+        Returns:
+            str: Generated name or None if failed
+        """
+        try:
+            job = self._build_naming_job(context)
             response = self.openai_client.chat.completions.create(
                 model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are an expert product naming specialist for audio equipment stores."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=100,
-                temperature=0.3
+                messages=job.messages,
+                max_tokens=job.max_tokens,
+                temperature=job.temperature
             )
             
-            generated_name = response.choices[0].message.content.strip()
-            
-            # Validate and clean the generated name
-            if generated_name and len(generated_name) > 10:
-                return self._clean_generated_name(generated_name)
-            
-            return None
+            self._record_usage(getattr(response, 'usage', None))
+            return self._parse_naming_response(response.choices[0].message.content)
             
         except Exception as e:
             self.logger.error(f"GPT-4 API call failed: {str(e)}")
             return None
     
+    def _parse_naming_response(self, content: Optional[str]) -> Optional[str]:
+        """
+        Validate and clean a single-product naming response.
+        
+        Args:
+            content: Raw response content
+            
+        Returns:
+            str: Cleaned name or None if the response is not a usable name
+        """
+        generated_name = (content or '').strip()
+        if generated_name and len(generated_name) > 10:
+            return self._clean_generated_name(generated_name)
+        return None
+    
+    def _build_batch_naming_job(self, contexts: List[Dict[str, Any]]) -> NamingJob:
+        """
+        Build one GPT-4 request that names several products.
+        
+        The naming patterns, examples and requirements are sent once for the
+        whole batch, and the model answers with a JSON array of
+        {"model", "store_name"} objects (see _parse_batch_naming_response).
+        
+        Args:
+            contexts: Contexts for name generation, with unique models
+            
+        Returns:
+            NamingJob: Chat messages and sampling parameters
+        """
+        examples = self._get_naming_examples()
+        product_blocks = "\n\n".join(self._format_batch_item(context) for context in contexts)
+        
+        prompt = f"""You are an expert at creating product names for an audio equipment online store. Your task is to convert technical product specifications into customer-friendly product names that follow consistent naming patterns.
+
+NAMING PATTERNS:
+- AV Receivers: "Brand Model - X.X Channel AV Receiver [Key Features]"
+- Amplifiers: "Brand Model - [Power] Amplifier [Type/Features]"
+- Speakers: "Brand Model - [Size/Type] Speaker [Features]"
+- Microphones: "Brand Model - [Type] Microphone [Features]"
+- Other Audio: "Brand Model - [Product Type] [Key Features]"
+
+EXAMPLES:
+{examples}
+
+PRODUCTS TO NAME:
+{product_blocks}
+
+REQUIREMENTS:
+1. Use the detected brand and model prominently
+2. Follow the naming pattern for the product category
+3. Include key specifications (channels, power, connectivity)
+4. Make it customer-friendly and searchable
+5. Keep it concise but descriptive
+6. Use proper capitalization and formatting
+
+Return ONLY a JSON array with one object per product, copying each model exactly as given:
+[{{"model": "<model>", "store_name": "<product name>"}}]"""
+        
+        return NamingJob(
+            messages=[
+                {"role": "system", "content": "You are an expert product naming specialist for audio equipment stores."},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=self.BATCH_OUTPUT_TOKENS_PER_ITEM * len(contexts) + 50,
+            temperature=0.3
+        )
+    
+    @staticmethod
+    def _format_batch_item(context: Dict[str, Any]) -> str:
+        """Format one product of a batch naming prompt."""
+        return (
+            f"Model: {context['model']}\n"
+            f"Raw Name: {context['raw_name']}\n"
+            f"Brand: {context['extracted_brand']}\n"
+            f"Category: {context['detected_category']}\n"
+            f"Specifications: {context['specifications']}\n"
+            f"Description: {context['description']}"
+        )
+    
+    def _parse_batch_naming_response(self, content: Optional[str], models: List[str]) -> Dict[str, str]:
+        """
+        Validate a batch naming response.
+        
+        Args:
+            content: Raw response content
+            models: Models that were sent in the batch
+            
+        Returns:
+            Dict[str, str]: Cleaned store names keyed by the model as sent
+        """
+        text = (content or '').strip()
+        if text.startswith('```'):
+            text = re.sub(r'^```(?:json)?\s*|\s*```$', '', text)
+        
+        try:
+            items = json.loads(text)
+        except json.JSONDecodeError as e:
+            self.logger.warning(f"Batch naming response is not valid JSON: {str(e)}")
+            return {}
+        
+        if not isinstance(items, list):
+            self.logger.warning("Batch naming response is not a JSON array")
+            return {}
+        
+        models_by_key = {model.strip().casefold(): model for model in models}
+        names = {}
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            model = models_by_key.get(str(item.get('model', '')).strip().casefold())
+            store_name = item.get('store_name')
+            if model is None or not isinstance(store_name, str) or len(store_name.strip()) <= 10:
+                continue
+            names.setdefault(model, self._clean_generated_name(store_name))
+        
+        if len(names) < len(models):
+            self.logger.warning(f"Batch naming returned {len(names)} valid names for {len(models)} products")
+        return names
+    
+    def _record_usage(self, usage: Any, batch_size: int = 0) -> None:
+        """Count a GPT-4 round-trip and its token usage (response.usage or a NamingCompletion)."""
+        self.request_stats['requests'] += 1
+        if batch_size:
+            self.request_stats['batched_requests'] += 1
+            self.request_stats['batched_products'] += batch_size
+        if usage is not None:
+            self.request_stats['prompt_tokens'] += getattr(usage, 'prompt_tokens', 0) or 0
+            self.request_stats['completion_tokens'] += getattr(usage, 'completion_tokens', 0) or 0
+    
     def _get_naming_examples(self) -> str:
         """
         Get examples for few-shot learning.
@@ -433,21 +682,36 @@ Generate ONLY the product name, nothing else:"""
             self.logger.error(f"Error generating fallback name: {str(e)}")
             return product_data.name or "Unknown Product"
     
-    def batch_generate_store_names(self, products_data: List[ProductData]) -> List[ProductData]:
+    def batch_generate_store_names(self, products_data: List[ProductData],
+                                   batch_requests: Optional[bool] = None) -> List[ProductData]:
         """
         Generate store names for a batch of products.
         
+        Products that are neither memoized nor cached are named concurrently
+        through the naming engine, within its rate limits.
+        
         Args:
             products_data: List of product data
+            batch_requests: Name uncached products several per GPT-4 request
+                (defaults to STORE_NAME_BATCH_ENABLED); products the batch
+                response misses are named one by one
             
         Returns:
             List[ProductData]: Products with generated store names
         """
         self.logger.info(f"Generating store names for {len(products_data)} products")
         
-        for product_data in products_data:
+        generated_names = {}
+        use_batches = config.store_name_batch_enabled if batch_requests is None else batch_requests
+        if self.naming_engine is not None:
             try:
-                store_name = self.generate_store_name(product_data)
+                generated_names = self._generate_names_concurrently(products_data, use_batches)
+            except Exception as e:
+                self.logger.error(f"Concurrent store naming failed, naming products one by one: {str(e)}")
+        
+        for position, product_data in enumerate(products_data):
+            try:
+                store_name = generated_names.get(position) or self.generate_store_name(product_data)
                 product_data.online_store_name = store_name
                 self.logger.debug(f"Generated store name for {product_data.model}: {store_name}")
             except Exception as e:
@@ -456,6 +720,152 @@ Generate ONLY the product name, nothing else:"""
         
         return products_data
     
+    def _generate_names_concurrently(self, products_data: List[ProductData], use_batches: bool) -> Dict[int, str]:
+        """
+        Name the products that are neither memoized nor cached through the naming engine.
+        
+        With use_batches, products are first packed into multi-product
+        requests until the estimated prompt tokens reach
+        STORE_NAME_BATCH_TOKENS or the batch holds STORE_NAME_BATCH_SIZE
+        products. Products without a model, repeating a model already in the
+        batch, or missing from a batch response are then named with
+        concurrent single-product requests. Products whose request fails get
+        the rule-based fallback name.
+        
+        Args:
+            products_data: List of product data
+            use_batches: Pack products into multi-product requests
+            
+        Returns:
+            Dict[int, str]: Store names by input position
+        """
+        names: Dict[int, str] = {}
+        pending: Dict[str, Dict[str, Any]] = {}
+        
+        for position, product_data in enumerate(products_data):
+            memo_key = NamingMemo.product_key(product_data.name, product_data.model)
+            if self.run_memo is not None and memo_key in self.run_memo:
+                continue
+            if memo_key in pending:
+                pending[memo_key]['positions'].append(position)
+                continue
+            
+            context = self._prepare_context(product_data)
+            cache_key = None
+            if self.name_cache is not None:
+                cache_key = StoreNameCache.make_key(context, self.NAMING_PROMPT_VERSION)
+                cached_name = self.name_cache.get(cache_key)
+                if cached_name:
+                    names[position] = cached_name
+                    if self.run_memo is not None:
+                        self.run_memo.put(memo_key, cached_name)
+                    continue
+            
+            pending[memo_key] = {'product': product_data, 'context': context,
+                                 'cache_key': cache_key, 'positions': [position]}
+        
+        if not pending:
+            return names
+        
+        remaining = dict(pending)
+        if use_batches:
+            batches = self._pack_naming_batches([item for item in pending.items() if item[1]['context']['model'].strip()])
+            completions = self.naming_engine.run(
+                [self._build_batch_naming_job([entry['context'] for _, entry in batch]) for batch in batches]
+            )
+            for batch, completion in zip(batches, completions):
+                if completion is None:
+                    continue
+                self._record_usage(completion, batch_size=len(batch))
+                generated = self._parse_batch_naming_response(
+                    completion.text, [entry['context']['model'] for _, entry in batch]
+                )
+                for memo_key, entry in batch:
+                    store_name = generated.get(entry['context']['model'])
+                    if store_name:
+                        self._store_generated_name(memo_key, entry, store_name, names, cache=True)
+                        del remaining[memo_key]
+        
+        single_entries = list(remaining.items())
+        completions = self.naming_engine.run([self._build_naming_job(entry['context']) for _, entry in single_entries])
+        for (memo_key, entry), completion in zip(single_entries, completions):
+            store_name = None
+            if completion is not None:
+                self._record_usage(completion)
+                store_name = self._parse_naming_response(completion.text)
+            if store_name:
+                self._store_generated_name(memo_key, entry, store_name, names, cache=True)
+            else:
+                self._store_generated_name(memo_key, entry, self._generate_fallback_name(entry['product']),
+                                           names, cache=False)
+        
+        return names
+    
+    def _store_generated_name(self, memo_key: str, entry: Dict[str, Any], store_name: str,
+                              names: Dict[int, str], cache: bool) -> None:
+        """Record a name for every position of a pending product, in the run memo and optionally the cache."""
+        for position in entry['positions']:
+            names[position] = store_name
+        if cache and entry['cache_key']:
+            self.name_cache.put(entry['cache_key'], store_name)
+        if self.run_memo is not None:
+            self.run_memo.put(memo_key, store_name)
+    
+    def _pack_naming_batches(self, entries: List[Any]) -> List[List[Any]]:
+        """
+        Split pending products into batches bounded by estimated prompt tokens and size.
+        
+        Args:
+            entries: (memo_key, entry) pairs whose entry holds the naming context
+            
+        Returns:
+            List[List[Any]]: Batches with unique models
+        """
+        batches = []
+        batch, batch_tokens, batch_models = [], 0, set()
+        for memo_key, entry in entries:
+            model_key = entry['context']['model'].strip().casefold()
+            if model_key in batch_models:
+                continue
+            
+            # Rough estimate of ~4 characters per token
+            tokens = len(self._format_batch_item(entry['context'])) // 4 + 1
+            if batch and (batch_tokens + tokens > config.store_name_batch_tokens
+                          or len(batch) >= config.store_name_batch_size):
+                batches.append(batch)
+                batch, batch_tokens, batch_models = [], 0, set()
+            
+            batch.append((memo_key, entry))
+            batch_tokens += tokens
+            batch_models.add(model_key)
+        
+        if batch:
+            batches.append(batch)
+        return batches
+    
+    def get_request_stats(self) -> Dict[str, Any]:
+        """
+        Get GPT-4 naming round-trip and token counters.
+        
+        Returns:
+            Dict[str, Any]: Requests made, batched products and token usage
+        """
+        stats = dict(self.request_stats)
+        if self.naming_engine is not None:
+            stats['engine'] = self.naming_engine.get_stats()
+        return stats
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get persistent name cache statistics.
+        
+        Returns:
+            Dict[str, Any]: Cache counters, or {'enabled': False} when the cache is bypassed
+        """
+        if self.name_cache is None:
+            return {'enabled': False}
+        return self.name_cache.get_stats()
+    
     def test_generation(self) -> bool:
         """
         Test the store name generation functionality.
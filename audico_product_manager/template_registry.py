@@ -0,0 +1,238 @@
+"""
+Supplier template registry for Audico Product Manager.
+
+Suppliers send the same pricelist layout month after month. The first time a
+layout is seen, the Excel and CSV parsers discover its header row, column
+mapping and column types; this module remembers that parse plan in a local
+SQLite database keyed by a fingerprint of the supplier name, the sheet layout
+and the header row and its offset, so later files from the same template skip
+discovery and are read with explicit columns and dtypes.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS supplier_templates (
+    fingerprint TEXT PRIMARY KEY,
+    supplier TEXT NOT NULL,
+    layout TEXT NOT NULL,
+    header_row INTEGER NOT NULL,
+    template TEXT NOT NULL,
+    uses INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_supplier_templates_layout ON supplier_templates (supplier, layout);
+"""
+
+
+def header_labels(header: Sequence[Any]) -> List[str]:
+    """Normalize header cells for fingerprinting (trimmed, lower case, trailing blanks dropped)."""
+    labels = ['' if value is None else str(value).strip().lower() for value in header]
+    while labels and not labels[-1]:
+        labels.pop()
+    return labels
+
+
+@dataclass
+class SupplierTemplate:
+    """Parse plan of one supplier pricelist layout."""
+    fingerprint: str
+    supplier: str
+    layout: str
+    header_row: int
+    columns: List[str]
+    column_map: Dict[str, str]
+    dtypes: Dict[str, str] = field(default_factory=dict)
+    price_format: str = 'text'
+
+    @property
+    def usecols(self) -> List[int]:
+        """Positions of the mapped columns, in sheet order."""
+        mapped = set(self.column_map.values())
+        return [index for index, column in enumerate(self.columns) if column in mapped]
+
+    @property
+    def usecol_names(self) -> List[str]:
+        """Names of the mapped columns, in sheet order."""
+        return [self.columns[index] for index in self.usecols]
+
+
+class TemplateRegistry:
+    """SQLite-backed registry of supplier templates keyed by layout fingerprint."""
+
+    def __init__(self, db_path: str = 'supplier_templates.db', max_entries: int = 1000):
+        """
+        Initialize the template registry.
+
+        Args:
+            db_path: SQLite database path
+            max_entries: Maximum templates kept; least recently used templates are evicted
+        """
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection for one unit of work, committing on success."""
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    @staticmethod
+    def fingerprint(supplier: str, layout: str, header_row: int, header: Sequence[Any]) -> str:
+        """
+        Fingerprint a pricelist layout.
+
+        Args:
+            supplier: Supplier name ('' when unknown)
+            layout: Sheet layout (file kind and sheet name or delimiter)
+            header_row: Index of the header row
+            header: Header row cells
+
+        Returns:
+            str: SHA-256 hex digest
+        """
+        key = '\x1e'.join([supplier.strip().lower(), layout, str(header_row), '\x1f'.join(header_labels(header))])
+        return hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+    def find(self, supplier: str, layout: str, rows: Sequence[Sequence[Any]]) -> Optional[SupplierTemplate]:
+        """
+        Find the template whose header row appears at its offset in the first rows of a sheet.
+
+        Args:
+            supplier: Supplier name ('' when unknown)
+            layout: Sheet layout
+            rows: First rows of the sheet
+
+        Returns:
+            SupplierTemplate: Matching template or None
+        """
+        template = None
+        try:
+            with self._connect() as conn:
+                candidates = conn.execute(
+                    "SELECT fingerprint, header_row, template FROM supplier_templates "
+                    "WHERE supplier = ? AND layout = ? ORDER BY last_used DESC",
+                    (supplier.strip().lower(), layout)
+                ).fetchall()
+                for fingerprint, header_row, payload in candidates:
+                    if (header_row < len(rows)
+                            and self.fingerprint(supplier, layout, header_row, rows[header_row]) == fingerprint):
+                        template = SupplierTemplate(**json.loads(payload))
+                        conn.execute("UPDATE supplier_templates SET uses = uses + 1, last_used = ? "
+                                     "WHERE fingerprint = ?", (time.time(), fingerprint))
+                        break
+        except (sqlite3.Error, ValueError, TypeError) as e:
+            self.logger.warning(f"Template registry read failed: {str(e)}")
+            template = None
+
+        with self._lock:
+            if template:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return template
+
+    def put(self, template: SupplierTemplate) -> None:
+        """
+        Register a template, evicting the least recently used templates.
+
+        Args:
+            template: Template to store (replaces one with the same fingerprint)
+        """
+        if self.max_entries <= 0:
+            return
+
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO supplier_templates "
+                    "(fingerprint, supplier, layout, header_row, template, uses, created_at, last_used) "
+                    "VALUES (?, ?, ?, ?, ?, 0, ?, ?)",
+                    (template.fingerprint, template.supplier.strip().lower(), template.layout,
+                     template.header_row, json.dumps(asdict(template)), now, now)
+                )
+                overflow = conn.execute("SELECT COUNT(*) FROM supplier_templates").fetchone()[0] - self.max_entries
+                if overflow > 0:
+                    conn.execute(
+                        "DELETE FROM supplier_templates WHERE fingerprint IN "
+                        "(SELECT fingerprint FROM supplier_templates ORDER BY last_used LIMIT ?)",
+                        (overflow,)
+                    )
+        except sqlite3.Error as e:
+            self.logger.warning(f"Template registry write failed: {str(e)}")
+            return
+
+        with self._lock:
+            self.writes += 1
+
+    def forget(self, fingerprint: str) -> int:
+        """
+        Drop one template.
+
+        Args:
+            fingerprint: Template fingerprint
+
+        Returns:
+            int: Number of templates removed
+        """
+        with self._connect() as conn:
+            return conn.execute("DELETE FROM supplier_templates WHERE fingerprint = ?", (fingerprint,)).rowcount
+
+    def clear(self) -> int:
+        """
+        Drop all templates.
+
+        Returns:
+            int: Number of templates removed
+        """
+        with self._connect() as conn:
+            return conn.execute("DELETE FROM supplier_templates").rowcount
+
+    def entry_count(self) -> int:
+        """Get the number of registered templates."""
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM supplier_templates").fetchone()[0]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get registry statistics.
+
+        Returns:
+            Dict[str, Any]: Hit/miss counters and current size
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            stats = {
+                'enabled': True,
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'writes': self.writes,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0
+            }
+        stats['templates'] = self.entry_count()
+        return stats
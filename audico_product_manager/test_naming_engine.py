@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Test the naming engine against the local fake model: result ordering,
+concurrency, request and token quotas, and Retry-After handling.
+"""
+
+import asyncio
+import sys
+import time
+
+from naming_engine import FakeNamingProvider, NamingEngine, NamingJob, estimate_tokens
+
+
+def make_jobs(count, max_tokens=20):
+    """Build naming jobs whose prompt ends with their index."""
+    return [NamingJob(messages=[{'role': 'user', 'content': f"Name this product\nProduct {i}"}],
+                      max_tokens=max_tokens)
+            for i in range(count)]
+
+
+class UnevenLatencyProvider(FakeNamingProvider):
+    """Fake model whose later jobs finish first, recording peak concurrency."""
+
+    def __init__(self, count):
+        super().__init__(latency=0)
+        self.count = count
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def complete(self, job):
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            index = int(job.messages[-1]['content'].rsplit(' ', 1)[-1])
+            await asyncio.sleep((self.count - index) * 0.002)
+            return await super().complete(job)
+        finally:
+            self.in_flight -= 1
+
+
+def test_results_keep_job_order():
+    """Completions come back in job order, with at most max_concurrency in flight."""
+    provider = UnevenLatencyProvider(40)
+    engine = NamingEngine(provider, max_concurrency=8, requests_per_minute=0,
+                          tokens_per_minute=0, max_retries=0)
+
+    results = engine.run(make_jobs(40))
+
+    assert [r.text for r in results] == [f"Fake Store Name - Product {i}" for i in range(40)]
+    assert provider.peak_in_flight == 8
+    assert engine.get_stats()['completed'] == 40
+
+
+def test_request_quota_delays_requests_beyond_the_bucket():
+    """Requests beyond the per-minute bucket wait for it to refill."""
+    # The bucket starts with 600 requests and refills 10 per second
+    engine = NamingEngine(FakeNamingProvider(latency=0), max_concurrency=50,
+                          requests_per_minute=600, tokens_per_minute=0, max_retries=0)
+
+    start = time.monotonic()
+    results = engine.run(make_jobs(608))
+    elapsed = time.monotonic() - start
+
+    assert all(results)
+    assert 0.7 <= elapsed < 3
+
+
+def test_token_quota_delays_requests_beyond_the_bucket():
+    """Prompt and completion tokens are charged against the token bucket."""
+    jobs = make_jobs(208, max_tokens=50)
+    cost = estimate_tokens(jobs[0].messages) + jobs[0].max_tokens
+    # Room for 200 jobs, refilled at a little over 3 jobs per second
+    engine = NamingEngine(FakeNamingProvider(latency=0), max_concurrency=50,
+                          requests_per_minute=0, tokens_per_minute=200 * cost, max_retries=0)
+
+    start = time.monotonic()
+    results = engine.run(jobs)
+    elapsed = time.monotonic() - start
+
+    assert all(results)
+    assert 2 <= elapsed < 5
+
+
+def test_rate_limits_pause_for_retry_after():
+    """Rejected calls pause the engine for Retry-After and are retried."""
+    provider = FakeNamingProvider(latency=0, rate_limit_every=5, retry_after=0.2)
+    engine = NamingEngine(provider, max_concurrency=4, requests_per_minute=0,
+                          tokens_per_minute=0, max_retries=3)
+
+    start = time.monotonic()
+    results = engine.run(make_jobs(12))
+    elapsed = time.monotonic() - start
+
+    stats = engine.get_stats()
+    assert all(results)
+    assert stats['completed'] == 12
+    assert stats['rate_limited'] == provider.calls - 12 > 0
+    assert elapsed >= 0.2
+
+
+def test_rate_limits_fail_jobs_after_max_retries():
+    """Jobs still rejected after max_retries come back as None."""
+    provider = FakeNamingProvider(latency=0, rate_limit_every=1, retry_after=0.01)
+    engine = NamingEngine(provider, max_concurrency=2, requests_per_minute=0,
+                          tokens_per_minute=0, max_retries=2)
+
+    results = engine.run(make_jobs(3))
+
+    stats = engine.get_stats()
+    assert results == [None, None, None]
+    assert provider.calls == 9
+    assert stats['rate_limited'] == 9
+    assert stats['failed'] == 3
+
+
+if __name__ == "__main__":
+    for test in (test_results_keep_job_order, test_request_quota_delays_requests_beyond_the_bucket,
+                 test_token_quota_delays_requests_beyond_the_bucket, test_rate_limits_pause_for_retry_after,
+                 test_rate_limits_fail_jobs_after_max_retries):
+        test()
+        print(f"✓ {test.__name__}")
+    sys.exit(0)
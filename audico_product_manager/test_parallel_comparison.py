@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Test that streamed comparison runs reach the worker pool with the default
+batch and shard sizes, and match the in-process comparison.
+"""
+
+import random
+import sys
+
+from config import config
+from docai_parser import ProductData
+from enhanced_product_comparison import EnhancedProductComparator
+from parallel_comparison import ParallelComparator
+
+
+class StubNameGenerator:
+    """Store name generator that needs no OpenAI access."""
+
+    def generate_store_name(self, product):
+        return f"{product.manufacturer or ''} {product.model} {product.name}".strip()
+
+    def batch_generate_store_names(self, products):
+        for product in products:
+            product.online_store_name = self.generate_store_name(product)
+        return products
+
+
+def make_comparator():
+    """Build a comparator over a synthetic catalog."""
+    rng = random.Random(7)
+    brands = ['Denon', 'Yamaha', 'Marantz', 'Polk', 'JBL']
+    kinds = ['AV Receiver', 'Speaker', 'Amplifier', 'Soundbar', 'Subwoofer']
+    comparator = EnhancedProductComparator(None, StubNameGenerator())
+    comparator.existing_products = [
+        {'product_id': str(i), 'name': f"{rng.choice(brands)} {model} {rng.choice(kinds)}",
+         'model': model, 'sku': model, 'price': '1000.00'}
+        for i, model in enumerate(f"{rng.choice('ABXYZ')}{rng.randint(100, 9999)}{rng.choice(['H', 'BT', ''])}"
+                                  for _ in range(500))
+    ]
+    comparator.existing_products_loaded = True
+    return comparator
+
+
+def make_products(comparator, count):
+    """Build parsed products, most of them matching a catalog product."""
+    rng = random.Random(11)
+    products = []
+    for i in range(count):
+        existing = rng.choice(comparator.existing_products)
+        products.append(ProductData(name=existing['name'] if i % 3 else f"Unknown gadget {i}",
+                                    model=existing['model'] if i % 2 else f"NEW-{i}", price='R1,200'))
+    return products
+
+
+def match_keys(matches):
+    return [(match.existing_product and match.existing_product['product_id'], match.match_type,
+             round(match.confidence_score, 9), match.action, match.store_name_used) for match in matches]
+
+
+def stream(parallel, products):
+    """Compare products in stream batches of STREAM_BATCH_SIZE, as the orchestrator does."""
+    with parallel.comparison_run() as comparison:
+        for start in range(0, len(products), config.stream_batch_size):
+            comparison.submit(products[start:start + config.stream_batch_size])
+        return comparison.matches(), comparison.pooled_batches
+
+
+def test_streamed_run_reaches_worker_pool():
+    """Default batch and shard sizes send a large run's batches to the pool, with unchanged results."""
+    comparator = make_comparator()
+    products = make_products(comparator, 6 * config.stream_batch_size)
+    expected = match_keys(comparator.batch_compare_products(make_products(comparator, len(products))))
+
+    # max_workers defaults to the CPU count; pin it so the check does not depend on the host
+    matches, pooled_batches = stream(ParallelComparator(comparator, max_workers=2), products)
+
+    assert pooled_batches > 0
+    assert match_keys(matches) == expected
+
+
+def test_small_run_stays_in_process():
+    """A run smaller than one shard per worker never starts the pool."""
+    comparator = make_comparator()
+    products = make_products(comparator, config.compare_min_shard_rows)
+
+    matches, pooled_batches = stream(ParallelComparator(comparator, max_workers=2), products)
+
+    assert pooled_batches == 0
+    assert len(matches) == len(products)
+
+
+if __name__ == "__main__":
+    for test in (test_streamed_run_reaches_worker_pool, test_small_run_stays_in_process):
+        test()
+        print(f"✓ {test.__name__}")
+    sys.exit(0)
@@ -0,0 +1,341 @@
+"""
+Transport policy for OpenCart API calls in Audico Product Manager.
+
+This module provides the retry, backoff and circuit breaker rules shared by
+OpenCartAPIClient and AsyncOpenCartAPIClient: per-call timeouts, exponential
+backoff with jitter driven by config.max_retries / config.retry_delay, a
+circuit breaker that fails fast while the store is down, and per-endpoint
+retry counters.
+"""
+
+import asyncio
+import logging
+import random
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple, Type
+
+# Use absolute import that works when running directly
+try:
+    from audico_product_manager.config import config
+except ImportError:
+    try:
+        from .config import config
+    except ImportError:
+        from config import config
+
+NUMERIC_ID_PATTERN = re.compile(r'/\d+')
+
+
+class CircuitOpenError(Exception):
+    """Raised when a request is rejected because the circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with a single half-open probe."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        """
+        Initialize the circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds to wait before letting a probe request through
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        """
+        Check whether a request may be sent.
+
+        Returns:
+            bool: False while the circuit is open or a half-open probe is in
+            flight, True otherwise
+        """
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.probe_in_flight:
+                return False
+            if self.state == self.OPEN and time.monotonic() - self.opened_at < self.reset_timeout:
+                return False
+            # Let a single probe through; its outcome decides the next state
+            self.state = self.HALF_OPEN
+            self.probe_in_flight = True
+            return True
+
+    def release_probe(self) -> None:
+        """Free the half-open probe slot of a request that ended without an outcome."""
+        with self._lock:
+            self.probe_in_flight = False
+
+    def record_success(self) -> None:
+        """Record a successful request and close the circuit."""
+        with self._lock:
+            self.consecutive_failures = 0
+            self.state = self.CLOSED
+            self.probe_in_flight = False
+
+    def record_failure(self) -> bool:
+        """
+        Record a failed request.
+
+        Returns:
+            bool: True if this failure opened the circuit
+        """
+        with self._lock:
+            self.consecutive_failures += 1
+            self.probe_in_flight = False
+            if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+                was_open = self.state == self.OPEN
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+                return not was_open
+            return False
+
+
+class TransportPolicy:
+    """Retry, backoff, timeout and circuit breaker rules for OpenCart requests."""
+
+    # Statuses worth retrying for idempotent requests
+    RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+    # Statuses where the server did not act on the request, so even a
+    # POST can be safely retried
+    SAFE_RETRY_STATUS_CODES = {429, 503}
+
+    IDEMPOTENT_METHODS = {'GET', 'PUT', 'DELETE'}
+
+    def __init__(self, timeout: Optional[float] = None, max_retries: Optional[int] = None,
+                 retry_delay: Optional[float] = None, max_delay: Optional[float] = None,
+                 failure_threshold: Optional[int] = None, reset_timeout: Optional[float] = None):
+        """
+        Initialize the transport policy.
+
+        Args:
+            timeout: Per-call timeout in seconds
+            max_retries: Maximum retries after the first attempt
+            retry_delay: Base backoff delay in seconds
+            max_delay: Upper bound for a single backoff delay in seconds
+            failure_threshold: Consecutive failures that open the circuit breaker
+            reset_timeout: Seconds the circuit stays open before probing again
+        """
+        self.timeout = timeout if timeout is not None else config.opencart_timeout
+        self.max_retries = max_retries if max_retries is not None else config.max_retries
+        self.retry_delay = retry_delay if retry_delay is not None else config.retry_delay
+        self.max_delay = max_delay if max_delay is not None else config.retry_max_delay
+        self.circuit_breaker = CircuitBreaker(
+            failure_threshold if failure_threshold is not None else config.circuit_breaker_threshold,
+            reset_timeout if reset_timeout is not None else config.circuit_breaker_reset
+        )
+
+        self.logger = logging.getLogger(__name__)
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._stats_lock = threading.Lock()
+
+    @staticmethod
+    def endpoint_key(method: str, endpoint: str) -> str:
+        """
+        Build the stats key for a request, collapsing numeric IDs.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint or route
+
+        Returns:
+            str: Key such as 'PUT /products/{id}'
+        """
+        return f"{method.upper()} {NUMERIC_ID_PATTERN.sub('/{id}', endpoint)}"
+
+    def _count(self, endpoint: str, counter: str) -> None:
+        """Increment a per-endpoint counter."""
+        with self._stats_lock:
+            stats = self._stats.setdefault(endpoint, {
+                'requests': 0,
+                'retries': 0,
+                'failures': 0,
+                'short_circuited': 0
+            })
+            stats[counter] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get per-endpoint retry counters and circuit breaker state.
+
+        Returns:
+            Dict[str, Any]: Transport statistics
+        """
+        with self._stats_lock:
+            endpoints = {key: dict(value) for key, value in self._stats.items()}
+        return {
+            'circuit_state': self.circuit_breaker.state,
+            'consecutive_failures': self.circuit_breaker.consecutive_failures,
+            'endpoints': endpoints
+        }
+
+    def backoff_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        Compute the delay before the next attempt.
+
+        Uses exponential backoff with equal jitter; a numeric Retry-After
+        header takes precedence when present.
+
+        Args:
+            attempt: Zero-based index of the attempt that just failed
+            retry_after: Retry-After header value, if any
+
+        Returns:
+            float: Delay in seconds
+        """
+        if retry_after:
+            try:
+                return min(self.max_delay, max(0.0, float(retry_after)))
+            except ValueError:
+                pass
+
+        capped = min(self.max_delay, self.retry_delay * (2 ** attempt))
+        return capped / 2 + random.uniform(0, capped / 2)
+
+    def _should_retry_status(self, method: str, status_code: int) -> bool:
+        """Check whether a response status warrants another attempt."""
+        if method.upper() in self.IDEMPOTENT_METHODS:
+            return status_code in self.RETRYABLE_STATUS_CODES
+        return status_code in self.SAFE_RETRY_STATUS_CODES
+
+    def _check_circuit(self, endpoint: str) -> None:
+        """Raise CircuitOpenError if the circuit breaker rejects the request."""
+        if not self.circuit_breaker.allow_request():
+            self._count(endpoint, 'short_circuited')
+            raise CircuitOpenError(f"OpenCart circuit breaker is open; skipping {endpoint}")
+
+    def _record_outcome(self, failed: bool) -> None:
+        """Feed an attempt's outcome into the circuit breaker."""
+        if not failed:
+            self.circuit_breaker.record_success()
+        elif self.circuit_breaker.record_failure():
+            self.logger.error(
+                f"OpenCart circuit breaker opened after {self.circuit_breaker.consecutive_failures} "
+                f"consecutive failures; failing fast for {self.circuit_breaker.reset_timeout}s"
+            )
+
+    def execute(self, method: str, endpoint: str, send: Callable[[float], Any],
+                retry_exceptions: Tuple[Type[BaseException], ...]) -> Any:
+        """
+        Send a request with retries, backoff and circuit breaking.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint or route (used for stats)
+            send: Callable taking the timeout and returning a response with
+                status_code and headers
+            retry_exceptions: Transport exceptions that warrant another attempt
+
+        Returns:
+            The last response received
+
+        Raises:
+            CircuitOpenError: If the circuit breaker is open
+            Exception: The last transport error once retries are exhausted, or
+                any other error raised by send
+        """
+        key = self.endpoint_key(method, endpoint)
+
+        for attempt in range(self.max_retries + 1):
+            self._check_circuit(key)
+            self._count(key, 'requests')
+            retry_after = None
+
+            try:
+                response = send(self.timeout)
+            except retry_exceptions as e:
+                self._record_outcome(failed=True)
+                if attempt >= self.max_retries:
+                    self._count(key, 'failures')
+                    raise
+                self.logger.warning(f"{key} attempt {attempt + 1} failed: {str(e)}")
+            except Exception:
+                # Not worth retrying, but still a failed call to the store
+                self._record_outcome(failed=True)
+                self._count(key, 'failures')
+                raise
+            except BaseException:
+                # Cancelled or interrupted before an outcome; let another request probe
+                self.circuit_breaker.release_probe()
+                raise
+            else:
+                self._record_outcome(failed=response.status_code >= 500)
+                if attempt >= self.max_retries or not self._should_retry_status(method, response.status_code):
+                    if response.status_code >= 400:
+                        self._count(key, 'failures')
+                    return response
+                retry_after = response.headers.get('Retry-After')
+                self.logger.warning(f"{key} attempt {attempt + 1} returned {response.status_code}")
+
+            self._count(key, 'retries')
+            time.sleep(self.backoff_delay(attempt, retry_after))
+
+    async def execute_async(self, method: str, endpoint: str, send: Callable[[float], Any],
+                            retry_exceptions: Tuple[Type[BaseException], ...]) -> Any:
+        """
+        Async counterpart of execute(); send must return an awaitable.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint or route (used for stats)
+            send: Callable taking the timeout and returning an awaitable response
+            retry_exceptions: Transport exceptions that warrant another attempt
+
+        Returns:
+            The last response received
+
+        Raises:
+            CircuitOpenError: If the circuit breaker is open
+            Exception: The last transport error once retries are exhausted, or
+                any other error raised by send
+        """
+        key = self.endpoint_key(method, endpoint)
+
+        for attempt in range(self.max_retries + 1):
+            self._check_circuit(key)
+            self._count(key, 'requests')
+            retry_after = None
+
+            try:
+                response = await send(self.timeout)
+            except retry_exceptions as e:
+                self._record_outcome(failed=True)
+                if attempt >= self.max_retries:
+                    self._count(key, 'failures')
+                    raise
+                self.logger.warning(f"{key} attempt {attempt + 1} failed: {str(e)}")
+            except Exception:
+                # Not worth retrying, but still a failed call to the store
+                self._record_outcome(failed=True)
+                self._count(key, 'failures')
+                raise
+            except BaseException:
+                # Cancelled or interrupted before an outcome; let another request probe
+                self.circuit_breaker.release_probe()
+                raise
+            else:
+                self._record_outcome(failed=response.status_code >= 500)
+                if attempt >= self.max_retries or not self._should_retry_status(method, response.status_code):
+                    if response.status_code >= 400:
+                        self._count(key, 'failures')
+                    return response
+                retry_after = response.headers.get('Retry-After')
+                self.logger.warning(f"{key} attempt {attempt + 1} returned {response.status_code}")
+
+            self._count(key, 'retries')
+            await asyncio.sleep(self.backoff_delay(attempt, retry_after))
@@ -9,6 +9,7 @@ Usage:
     python denon_rename.py input.csv > output.csv
     python denon_rename.py --json input.json > output.json
     python denon_rename.py --text "product1\nproduct2\n..." > output.csv
+    python denon_rename.py --sample --fake --concurrency 16   # offline run against a fake model
 """
 
 import sys
@@ -19,9 +20,45 @@ import argparse
 from typing import List, Dict, Any
 from io import StringIO
 
-# Import our GPT-4 namer
+# Import the concurrent naming engine
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-from gpt4_namer import generate_store_name, get_openai_client
+from audico_product_manager.naming_engine import (
+    NamingEngine, NamingJob, OpenAINamingProvider, FakeNamingProvider
+)
+
+NAMING_PROMPT = """You are an expert at creating product names for an audio equipment online store. Convert this technical product specification into a customer-friendly product name that follows store naming conventions.
+
+NAMING GUIDELINES:
+- Start with Brand and Model (e.g., "Denon AVR-S670H")
+- Use proper formatting with dashes and descriptive text
+- Include key specifications (channels, power, resolution, features)
+- Make it searchable and customer-friendly
+- Follow pattern: "Brand Model – Key Specs Product Type with Features"
+
+EXAMPLES:
+- "5.2 Channel. 140W 8K AV Receiver AVRS-670H" → "Denon AVR-S670H – 8K 140W 5.2 Channel AV Receiver with HEOS"
+- "SM58 Dynamic Vocal Microphone" → "Shure SM58 – Dynamic Vocal Microphone"
+
+PRODUCT TO CONVERT:
+{raw_name}
+
+Generate ONLY the store-friendly product name, nothing else:"""
+
+def build_naming_job(raw_name: str) -> NamingJob:
+    """Build the GPT-4 naming request for one raw product name."""
+    return NamingJob(
+        messages=[
+            {"role": "system", "content": "You are an expert product naming specialist for audio equipment stores."},
+            {"role": "user", "content": NAMING_PROMPT.format(raw_name=raw_name)}
+        ],
+        max_tokens=150,
+        temperature=0.1
+    )
+
+def fake_store_name(job: NamingJob) -> str:
+    """Deterministic store name used by the fake model (--fake)."""
+    raw_name = job.messages[-1]['content'].split('PRODUCT TO CONVERT:\n', 1)[-1].split('\n', 1)[0]
+    return f"Denon {raw_name} [FAKE]"
 
 def process_csv_data(input_file: str) -> List[Dict[str, Any]]:
     """
@@ -164,34 +201,30 @@ def process_text_data(text_input: str) -> List[Dict[str, Any]]:
     
     return products
 
-def generate_store_names(products: List[Dict[str, Any]], client) -> List[Dict[str, Any]]:
+def generate_store_names(products: List[Dict[str, Any]], engine: NamingEngine) -> List[Dict[str, Any]]:
     """
-    Generate store names for all products using GPT-4.
+    Generate store names for all products concurrently.
     
     Args:
         products: List of products to process
-        client: OpenAI client
+        engine: Naming engine (concurrency and rate limits come from its settings)
         
     Returns:
-        List of products with generated store names
+        List of products with generated store names, in input order
     """
-    print(f"Processing {len(products)} products...", file=sys.stderr)
+    print(f"Processing {len(products)} products "
+          f"(up to {engine.max_concurrency} requests in flight)...", file=sys.stderr)
     
-    for i, product in enumerate(products, 1):
-        try:
-            print(f"Processing {i}/{len(products)}: {product['raw_name'][:50]}...", file=sys.stderr)
-            
-            store_name = generate_store_name(product['raw_name'], client)
-            product['store_name'] = store_name
-            
-            if store_name:
-                print(f"  ✅ Generated: {store_name}", file=sys.stderr)
-            else:
-                print(f"  ❌ Failed to generate name", file=sys.stderr)
-                product['store_name'] = product['raw_name']  # Fallback
+    completions = engine.run([build_naming_job(product['raw_name']) for product in products])
+    
+    for i, (product, completion) in enumerate(zip(products, completions), 1):
+        store_name = completion.text.strip().strip('"\'') if completion else None
         
-        except Exception as e:
-            print(f"  ❌ Error: {str(e)}", file=sys.stderr)
+        if store_name:
+            product['store_name'] = store_name
+            print(f"  ✅ {i}/{len(products)}: {store_name}", file=sys.stderr)
+        else:
+            print(f"  ❌ {i}/{len(products)}: Failed to generate name for {product['raw_name'][:50]}", file=sys.stderr)
             product['store_name'] = product['raw_name']  # Fallback
     
     return products
@@ -258,15 +291,21 @@ def main():
     parser.add_argument('--text', help='Process text input directly')
     parser.add_argument('--sample', action='store_true', help='Use sample Denon data for testing')
     parser.add_argument('--output-json', action='store_true', help='Output as JSON instead of CSV')
+    parser.add_argument('--concurrency', type=int, help='Maximum naming requests in flight (default NAMING_MAX_CONCURRENCY)')
+    parser.add_argument('--fake', action='store_true', help='Use a local fake model instead of OpenAI')
     
     args = parser.parse_args()
     
-    # Initialize OpenAI client
-    try:
-        client = get_openai_client()
-    except SystemExit:
-        print("Error: OpenAI API key not configured. Run 'python setup_openai_key.py' first.", file=sys.stderr)
-        return 1
+    # Initialize the naming provider
+    if args.fake:
+        provider = FakeNamingProvider(respond=fake_store_name)
+    else:
+        api_key = os.getenv('OPENAI_API_KEY')
+        if not api_key:
+            print("Error: OpenAI API key not configured. Run 'python setup_openai_key.py' first.", file=sys.stderr)
+            return 1
+        provider = OpenAINamingProvider(api_key, model="gpt-4o")
+    engine = NamingEngine(provider, max_concurrency=args.concurrency)
     
     # Process input
     products = []
@@ -302,7 +341,7 @@ def main():
         return 1
     
     # Generate store names
-    products = generate_store_names(products, client)
+    products = generate_store_names(products, engine)
     
     # Output results
     if args.output_json: